@@ -1,32 +1,47 @@
 import abc
+import json
+import os
 from contextlib import contextmanager
 from datetime import datetime
+from multiprocessing.dummy import Pool as ThreadPool
 from typing import (
     Optional, Tuple, Callable, Container, FrozenSet, Type, Dict, Any, List,
-    Mapping
+    Mapping, Iterable
 )
 
 import agate
 import pytz
+from hologram import ValidationError
 
 import dbt.exceptions
 import dbt.flags
 
-from dbt.clients.agate_helper import empty_table
+from dbt.clients.agate_helper import (
+    empty_table, merge_tables, table_from_data
+)
+from dbt.clients.system import load_file_contents
 from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.results import (
+    CachedCatalogRelation, CachedSchemaSnapshot, CatalogKey,
+    RelationsCacheSnapshot
+)
 from dbt.node_types import NodeType
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import filter_null_values
 
 from dbt.adapters.base.connections import BaseConnectionManager
-from dbt.adapters.base.meta import AdapterMeta, available
+from dbt.adapters.base.meta import AdapterMeta, available, introspection
 from dbt.adapters.base.relation import ComponentName, BaseRelation
 from dbt.adapters.base import Column as BaseColumn
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import IntrospectionCache, RelationsCache
 
 
 GET_CATALOG_MACRO_NAME = 'get_catalog'
+GET_CATALOG_RELATIONS_MACRO_NAME = 'get_catalog_relations'
+GET_CATALOG_FINGERPRINTS_MACRO_NAME = 'get_catalog_fingerprints'
 FRESHNESS_MACRO_NAME = 'collect_freshness'
+FRESHNESS_BATCH_MACRO_NAME = 'collect_freshness_batch'
+RELATIONS_CACHE_FILE_NAME = 'relations_cache.json'
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -98,6 +113,36 @@ def _utc(
         return dt.replace(tzinfo=pytz.UTC)
 
 
+def _freshness_result(
+    max_loaded_at: Optional[datetime],
+    snapshotted_at: Optional[datetime],
+    source: BaseRelation,
+    loaded_at_field: str,
+) -> Dict[str, Any]:
+    if max_loaded_at is None:
+        # no records in the table, so really the max_loaded_at was
+        # infinitely long ago. Just call it 0:00 January 1 year UTC
+        max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
+    else:
+        max_loaded_at = _utc(max_loaded_at, source, loaded_at_field)
+
+    snapshotted_at = _utc(snapshotted_at, source, loaded_at_field)
+    age = (snapshotted_at - max_loaded_at).total_seconds()
+    return {
+        'max_loaded_at': max_loaded_at,
+        'snapshotted_at': snapshotted_at,
+        'age': age,
+    }
+
+
+def _snapshot_key(
+    database: Optional[str], schema: str
+) -> Tuple[Optional[str], str]:
+    if database is not None:
+        database = database.lower()
+    return database, schema.lower()
+
+
 def _relation_name(rel: Optional[BaseRelation]) -> str:
     if rel is None:
         return 'null relation'
@@ -197,6 +242,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     def __init__(self, config):
         self.config = config
         self.cache = RelationsCache()
+        self._introspection_cache = IntrospectionCache()
         self.connections = self.ConnectionManager(config)
         self._internal_manifest_lazy: Optional[Manifest] = None
 
@@ -210,6 +256,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         return self.connections.release()
 
     def cleanup_connections(self):
+        self._introspection_cache.clear()
         return self.connections.cleanup_all()
 
     def clear_transaction(self):
@@ -324,37 +371,158 @@ class BaseAdapter(metaclass=AdapterMeta):
         # schemas
         return info_schema_name_map
 
-    def _relations_cache_for_schemas(self, manifest: Manifest) -> None:
+    def _relations_cache_snapshot_path(self) -> str:
+        return os.path.join(self.config.target_path, RELATIONS_CACHE_FILE_NAME)
+
+    def _load_relations_cache_snapshot(
+        self
+    ) -> Dict[Tuple[Optional[str], str], CachedSchemaSnapshot]:
+        """Load the persisted relations cache for this target, if there is
+        one. Returns a mapping of lowercased (database, schema) pairs to their
+        snapshots, which is empty if there is nothing usable on disk.
+        """
+        path = self._relations_cache_snapshot_path()
+        if not dbt.flags.PERSIST_CACHE or not os.path.exists(path):
+            return {}
+
+        try:
+            snapshot = RelationsCacheSnapshot.from_dict(
+                json.loads(load_file_contents(path))
+            )
+        except (ValueError, ValidationError) as exc:
+            logger.debug(
+                'Ignoring invalid relations cache snapshot at {}: {}'
+                .format(path, exc)
+            )
+            return {}
+
+        if (snapshot.adapter_type != self.type() or
+                snapshot.profile_name != self.config.profile_name or
+                snapshot.target_name != self.config.target_name):
+            return {}
+
+        return {
+            _snapshot_key(s.database, s.schema): s for s in snapshot.schemas
+        }
+
+    def _snapshot_relations(
+        self,
+        snapshot: Mapping[Tuple[Optional[str], str], CachedSchemaSnapshot],
+        information_schema: BaseRelation,
+        schema: str,
+    ) -> Optional[List[BaseRelation]]:
+        """Return the persisted relations for the schema if its fingerprint
+        still matches the database, or None if it has to be listed again.
+        """
+        cached = snapshot.get(
+            _snapshot_key(information_schema.database, schema)
+        )
+        if cached is None:
+            return None
+        fingerprint = self.get_schema_fingerprint(information_schema, schema)
+        if fingerprint is None or fingerprint != cached.fingerprint:
+            return None
+        logger.debug(
+            'Reusing persisted relations cache for schema "{}.{}"'
+            .format(information_schema.database, schema)
+        )
+        return [self.Relation.from_dict(r) for r in cached.relations]
+
+    def _relations_cache_for_schemas(
+        self,
+        manifest: Manifest,
+        new_schemas: Iterable[Tuple[str, str]] = (),
+        clear: bool = False,
+    ) -> None:
         """Populate the relations cache for the given schemas. Returns an
         iteratble of the schemas populated, as strings.
+
+        If clear is set, the cache is cleared in the same step as it's
+        populated, once all the schemas have been listed.
         """
         if not dbt.flags.USE_CACHE:
             return
 
         info_schema_name_map = self._get_cache_schemas(manifest,
                                                        exec_only=True)
+        new = {
+            (database.lower(), schema.lower())
+            for database, schema in new_schemas
+        }
+        snapshot = self._load_relations_cache_snapshot()
+        # run all the queries before touching the cache, so we don't hold its
+        # lock while waiting on the database
+        relations: List[BaseRelation] = []
         for db, schema in info_schema_name_map.search():
-            for relation in self.list_relations_without_caching(db, schema):
-                self.cache.add(relation)
+            if (str(db.database).lower(), schema.lower()) in new:
+                # we just created it, so there is nothing in it to list
+                continue
+            persisted = None
+            if snapshot:
+                persisted = self._snapshot_relations(snapshot, db, schema)
+            if persisted is None:
+                persisted = self.list_relations_without_caching(db, schema)
+            relations.extend(persisted)
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
         # so we can check it later
-        self.cache.update_schemas(info_schema_name_map.schemas_searched())
+        self.cache.add_relations(
+            relations, info_schema_name_map.schemas_searched(), clear=clear
+        )
 
     def set_relations_cache(
-        self, manifest: Manifest, clear: bool = False
+        self,
+        manifest: Manifest,
+        clear: bool = False,
+        new_schemas: Iterable[Tuple[str, str]] = (),
     ) -> None:
         """Run a query that gets a populated cache of the relations in the
         database and set the cache on this adapter.
+
+        :param new_schemas: The (database, schema) pairs of schemas that were
+            just created. They are cached as empty without being listed.
         """
         if not dbt.flags.USE_CACHE:
             return
 
-        with self.cache.lock:
-            if clear:
-                self.cache.clear()
-            self._relations_cache_for_schemas(manifest)
+        self._introspection_cache.clear()
+        self._relations_cache_for_schemas(manifest, new_schemas, clear=clear)
+
+    def persist_relations_cache(self, manifest: Manifest) -> None:
+        """Write the cached relations of the manifest's schemas to the target
+        directory, along with each schema's current fingerprint, so the next
+        invocation can skip listing schemas that have not changed. Schemas the
+        adapter can't fingerprint are left out.
+        """
+        if not (dbt.flags.USE_CACHE and dbt.flags.PERSIST_CACHE):
+            return
+
+        info_schema_name_map = self._get_cache_schemas(manifest,
+                                                       exec_only=True)
+        schemas: List[CachedSchemaSnapshot] = []
+        for db, schema in info_schema_name_map.search():
+            if (db.database, schema) not in self.cache:
+                continue
+            fingerprint = self.get_schema_fingerprint(db, schema)
+            if fingerprint is None:
+                continue
+            relations = self.cache.get_relations(db.database, schema)
+            schemas.append(CachedSchemaSnapshot(
+                database=db.database,
+                schema=schema,
+                fingerprint=fingerprint,
+                relations=[r.to_dict() for r in relations],
+            ))
+
+        snapshot = RelationsCacheSnapshot(
+            adapter_type=self.type(),
+            profile_name=self.config.profile_name,
+            target_name=self.config.target_name,
+            generated_at=datetime.utcnow(),
+            schemas=schemas,
+        )
+        snapshot.write(self._relations_cache_snapshot_path())
 
     @available
     def cache_added(self, relation: Optional[BaseRelation]) -> str:
@@ -366,6 +534,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             )
         if dbt.flags.USE_CACHE:
             self.cache.add(relation)
+        self._introspection_cache.invalidate(relation)
         # so jinja doesn't render things
         return ''
 
@@ -381,6 +550,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             )
         if dbt.flags.USE_CACHE:
             self.cache.drop(relation)
+        self._introspection_cache.invalidate(relation)
         return ''
 
     @available
@@ -403,8 +573,35 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         if dbt.flags.USE_CACHE:
             self.cache.rename(from_relation, to_relation)
+        self._introspection_cache.invalidate(from_relation)
+        self._introspection_cache.invalidate(to_relation)
         return ''
 
+    def _cached_introspection(
+        self, name: str, arguments: Dict[str, Any], call: Callable[[], Any]
+    ) -> Any:
+        """Return the cached result of an introspective method, or call it
+        and cache the result. Bypassing the relations cache bypasses this
+        cache too.
+        """
+        if not dbt.flags.USE_CACHE:
+            return call()
+        key = self._introspection_cache.make_key(name, arguments)
+        if key is None:
+            return call()
+        found, value = self._introspection_cache.get(key)
+        if found:
+            return value
+        value = call()
+        self._introspection_cache.set(
+            key, value, self._introspection_cache.describes(arguments)
+        )
+        return value
+
+    def _invalidate_introspection(self, arguments: Dict[str, Any]) -> None:
+        for changed in self._introspection_cache.describes(arguments):
+            self._introspection_cache.invalidate(changed)
+
     ###
     # Abstract methods for database-specific values, attributes, and types
     ###
@@ -423,6 +620,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     ###
     # Abstract methods about schemas
     ###
+    @introspection.cached
     @abc.abstractmethod
     def list_schemas(self, database: str) -> List[str]:
         """Get a list of existing schemas in database"""
@@ -430,6 +628,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             '`list_schemas` is not implemented for this adapter!'
         )
 
+    @introspection.cached
     @available.parse(lambda *a, **k: False)
     def check_schema_exists(self, database: str, schema: str) -> bool:
         """Check if a schema exists.
@@ -447,6 +646,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     ###
     # Abstract methods about relations
     ###
+    @introspection.invalidates
     @abc.abstractmethod
     @available.parse_none
     def drop_relation(self, relation: BaseRelation) -> None:
@@ -466,6 +666,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             '`truncate_relation` is not implemented for this adapter!'
         )
 
+    @introspection.invalidates
     @abc.abstractmethod
     @available.parse_none
     def rename_relation(
@@ -479,6 +680,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             '`rename_relation` is not implemented for this adapter!'
         )
 
+    @introspection.cached
     @abc.abstractmethod
     @available.parse_list
     def get_columns_in_relation(
@@ -502,6 +704,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         )
         return self.get_columns_in_relation(relation)
 
+    @introspection.invalidates
     @abc.abstractmethod
     def expand_column_types(
         self, goal: BaseRelation, current: BaseRelation
@@ -536,6 +739,24 @@ class BaseAdapter(metaclass=AdapterMeta):
             'adapter!'
         )
 
+    def get_schema_fingerprint(
+        self, information_schema: BaseRelation, schema: str
+    ) -> Optional[str]:
+        """Get a cheap fingerprint of the relations in the given schema, used
+        to decide whether a persisted relations cache is still valid. Any
+        change to the set of relations in the schema must change the
+        fingerprint.
+
+        The default implementation returns None, which means the schema is
+        always listed again.
+
+        :param Relation information_schema: The information schema to query.
+        :param str schema: The name of the schema to fingerprint.
+        :return: The fingerprint, or None if it can't be determined.
+        :rtype: Optional[str]
+        """
+        return None
+
     ###
     # Provided methods about relations
     ###
@@ -639,6 +860,7 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         self.expand_column_types(from_relation, to_relation)
 
+    @introspection.cached
     def list_relations(self, database: str, schema: str) -> List[BaseRelation]:
         if self._schema_is_cached(database, schema):
             return self.cache.get_relations(database, schema)
@@ -697,6 +919,7 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return matches
 
+    @introspection.cached
     @available.parse_none
     def get_relation(
         self, database: str, schema: str, identifier: str
@@ -732,6 +955,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     # ODBC FUNCTIONS -- these should not need to change for every adapter,
     #                   although some adapters may override them
     ###
+    @introspection.invalidates
     @abc.abstractmethod
     @available.parse_none
     def create_schema(self, database: str, schema: str):
@@ -740,6 +964,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             '`create_schema` is not implemented for this adapter!'
         )
 
+    @introspection.invalidates
     @abc.abstractmethod
     def drop_schema(self, database: str, schema: str):
         """Drop the given schema (and everything in it) if it exists."""
@@ -952,19 +1177,174 @@ class BaseAdapter(metaclass=AdapterMeta):
         """
         return table.where(_catalog_filter_schemas(manifest))
 
+    def _catalog_connection_name(
+        self, information_schema: BaseRelation
+    ) -> str:
+        return '.'.join([
+            str(information_schema.database),
+            str(information_schema.schema),
+        ])
+
+    def _get_one_catalog(
+        self,
+        information_schema: BaseRelation,
+        schemas: List[str],
+        manifest: Manifest,
+    ) -> agate.Table:
+        name = self._catalog_connection_name(information_schema)
+        with self.connection_named(name):
+            kwargs = {
+                'information_schema': information_schema,
+                'schemas': schemas,
+            }
+            table = self.execute_macro(GET_CATALOG_MACRO_NAME, kwargs=kwargs)
+
+        return self._catalog_filter_table(table, manifest)
+
+    def _get_one_catalog_incremental(
+        self,
+        information_schema: BaseRelation,
+        schemas: List[str],
+        manifest: Manifest,
+        previous: Mapping[CatalogKey, CachedCatalogRelation],
+    ) -> Tuple[agate.Table, Dict[CatalogKey, str]]:
+        name = self._catalog_connection_name(information_schema)
+        with self.connection_named(name):
+            fingerprints = self.get_catalog_fingerprints(
+                information_schema, schemas
+            )
+        if fingerprints is None:
+            table = self._get_one_catalog(
+                information_schema, schemas, manifest
+            )
+            return table, {}
+
+        changed = {
+            key for key, fingerprint in fingerprints.items()
+            if key not in previous or previous[key].fingerprint != fingerprint
+        }
+        if len(changed) == len(fingerprints):
+            # nothing to reuse, so query the schemas as a whole
+            table = self._get_one_catalog(
+                information_schema, schemas, manifest
+            )
+            return table, fingerprints
+
+        tables: List[agate.Table] = []
+        if changed:
+            relations = [
+                self.Relation.create(
+                    database=key.database,
+                    schema=key.schema,
+                    identifier=key.name,
+                )
+                for key in sorted(changed)
+            ]
+            with self.connection_named(name):
+                kwargs = {
+                    'information_schema': information_schema,
+                    'relations': relations,
+                }
+                table = self.execute_macro(
+                    GET_CATALOG_RELATIONS_MACRO_NAME, kwargs=kwargs
+                )
+            tables.append(self._catalog_filter_table(table, manifest))
+
+        column_names: List[str] = []
+        reused: List[Dict[str, Any]] = []
+        for key in fingerprints:
+            if key in changed:
+                continue
+            for row in previous[key].rows:
+                column_names.extend(c for c in row if c not in column_names)
+                reused.append(row)
+        if reused:
+            tables.append(table_from_data(
+                [{c: row.get(c) for c in column_names} for row in reused],
+                column_names
+            ))
+        return merge_tables(tables), fingerprints
+
+    def _map_information_schemas(self, func, manifest: Manifest, *args):
+        """Call func(information_schema, schemas, manifest, *args) for each
+        information_schema the manifest uses, concurrently, and return the
+        results in a list.
+        """
+        info_schema_name_map = self._get_cache_schemas(manifest)
+        arguments = [
+            (information_schema, sorted(schemas), manifest) + args
+            for information_schema, schemas in info_schema_name_map.items()
+            if schemas
+        ]
+        pool = ThreadPool(self.config.threads)
+        try:
+            return pool.starmap(func, arguments)
+        finally:
+            pool.close()
+            pool.join()
+
     def get_catalog(self, manifest: Manifest) -> agate.Table:
-        """Get the catalog for this manifest by running the get catalog macro.
-        Returns an agate.Table of catalog information.
+        """Get the catalog for this manifest by running the get catalog macro
+        once for each information_schema, concurrently. Each query is limited
+        to the schemas the manifest uses. Returns an agate.Table of catalog
+        information.
         """
-        information_schemas = list(self._get_cache_schemas(manifest).keys())
-        # make it a list so macros can index into it.
-        kwargs = {'information_schemas': information_schemas}
-        table = self.execute_macro(GET_CATALOG_MACRO_NAME,
-                                   kwargs=kwargs,
-                                   release=True)
+        tables = self._map_information_schemas(
+            self._get_one_catalog, manifest
+        )
+        return merge_tables(tables)
 
-        results = self._catalog_filter_table(table, manifest)
-        return results
+    def get_catalog_incremental(
+        self,
+        manifest: Manifest,
+        previous: Mapping[CatalogKey, CachedCatalogRelation],
+    ) -> Tuple[agate.Table, Dict[CatalogKey, str]]:
+        """Get the catalog for this manifest, reusing the catalog rows of
+        relations in `previous` whose fingerprint has not changed. Only new
+        and changed relations are queried.
+
+        :return: The catalog table, and the current fingerprint of every
+            relation the adapter could fingerprint.
+        """
+        results = self._map_information_schemas(
+            self._get_one_catalog_incremental, manifest, previous
+        )
+        fingerprints: Dict[CatalogKey, str] = {}
+        for _, schema_fingerprints in results:
+            fingerprints.update(schema_fingerprints)
+        return merge_tables([table for table, _ in results]), fingerprints
+
+    def get_catalog_fingerprints(
+        self, information_schema: BaseRelation, schemas: List[str]
+    ) -> Optional[Dict[CatalogKey, str]]:
+        """Get a fingerprint of the catalog entry of each relation in the
+        given schemas. A relation's fingerprint must change whenever its
+        catalog entry would.
+
+        This runs the get_catalog_fingerprints macro, which returns a table
+        of (database, schema, name, fingerprint) rows. The default version of
+        the macro returns none, which means the catalog is always fetched in
+        full.
+
+        :param Relation information_schema: The information schema to query.
+        :param List[str] schemas: The names of the schemas to fingerprint.
+        :return: A mapping of lowercased catalog keys to fingerprints, or
+            None if they can't be determined.
+        :rtype: Optional[Dict[CatalogKey, str]]
+        """
+        kwargs = {'information_schema': information_schema, 'schemas': schemas}
+        results = self.execute_macro(
+            GET_CATALOG_FINGERPRINTS_MACRO_NAME,
+            kwargs=kwargs
+        )
+        if results is None:
+            return None
+        return {
+            CatalogKey(
+                str(database).lower(), str(schema).lower(), str(name).lower()
+            ): str(fingerprint)
+            for database, schema, name, fingerprint in results
+        }
 
     def cancel_open_connections(self):
         """Cancel all open connections."""
@@ -999,21 +1379,52 @@ class BaseAdapter(metaclass=AdapterMeta):
                     FRESHNESS_MACRO_NAME, [tuple(r) for r in table]
                 )
             )
-        if table[0][0] is None:
-            # no records in the table, so really the max_loaded_at was
-            # infinitely long ago. Just call it 0:00 January 1 year UTC
-            max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
-        else:
-            max_loaded_at = _utc(table[0][0], source, loaded_at_field)
+        return _freshness_result(
+            table[0][0], table[0][1], source, loaded_at_field
+        )
 
-        snapshotted_at = _utc(table[0][1], source, loaded_at_field)
-        age = (snapshotted_at - max_loaded_at).total_seconds()
-        return {
-            'max_loaded_at': max_loaded_at,
-            'snapshotted_at': snapshotted_at,
-            'age': age,
+    def calculate_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        manifest: Optional[Manifest] = None
+    ) -> List[Dict[str, Any]]:
+        """Calculate the freshness of several sources with a single query.
+
+        :param sources: A list of (source, loaded_at_field, filter) tuples.
+        :return: The freshness of each source, in the order given.
+        """
+        kwargs: Dict[str, Any] = {
+            'sources': [
+                {
+                    'source': source,
+                    'loaded_at_field': loaded_at_field,
+                    'filter': filter,
+                }
+                for source, loaded_at_field, filter in sources
+            ],
         }
 
+        table = self.execute_macro(
+            FRESHNESS_BATCH_MACRO_NAME,
+            kwargs=kwargs,
+            release=True,
+            manifest=manifest
+        )
+        # a 1-row table with the maximum `loaded_at_field` value of each
+        # source, followed by the current time according to the db.
+        if len(table) != 1 or len(table[0]) != len(sources) + 1:
+            dbt.exceptions.raise_compiler_error(
+                'Got an invalid result from "{}" macro: {}'.format(
+                    FRESHNESS_BATCH_MACRO_NAME, [tuple(r) for r in table]
+                )
+            )
+        row = table[0]
+        snapshotted_at = row[-1]
+        return [
+            _freshness_result(max_loaded_at, snapshotted_at, source, field)
+            for max_loaded_at, (source, field, _) in zip(row, sources)
+        ]
+
     def pre_model_hook(self, config: Mapping[str, Any]) -> Any:
         """A hook for running some operation before the model materialization
         runs. The hook can assume it has a connection available.
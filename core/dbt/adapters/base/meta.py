@@ -1,4 +1,5 @@
 import abc
+import inspect
 from functools import wraps
 from typing import Callable, Optional, Any, FrozenSet, Dict
 
@@ -85,6 +86,76 @@ class _Available:
 available = _Available()
 
 
+class _Introspection:
+    """Decorators for adapter methods that ask the database about its
+    schemas, relations and columns, or that change the answers to those
+    questions. AdapterMeta applies the same decorator to every override of
+    the method in subclasses, so adapter implementations share the
+    per-invocation introspection cache without having to opt in.
+    """
+    def cached(self, func: Callable) -> Callable:
+        """Remember the result of the method for the rest of the
+        invocation, keyed by its arguments.
+        """
+        return self._mark(func, self._cached)
+
+    def invalidates(self, func: Callable) -> Callable:
+        """Forget the cached introspection results about the relations and
+        schemas the method is called with, once it returns.
+        """
+        return self._mark(func, self._invalidates)
+
+    @staticmethod
+    def _mark(func: Callable, wrapper: Callable) -> Callable:
+        wrapped = wrapper(func)
+        wrapped._introspection_wrapper_ = wrapper  # type: ignore
+        return wrapped
+
+    @staticmethod
+    def _bind(signature, adapter, args, kwargs):
+        try:
+            bound = signature.bind(adapter, *args, **kwargs)
+        except TypeError:
+            return None
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        # the first argument is the adapter itself
+        arguments.pop(next(iter(signature.parameters)))
+        return arguments
+
+    @classmethod
+    def _cached(cls, func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def inner(adapter, *args, **kwargs):
+            arguments = cls._bind(signature, adapter, args, kwargs)
+            if arguments is None:
+                return func(adapter, *args, **kwargs)
+            return adapter._cached_introspection(
+                func.__name__, arguments,
+                lambda: func(adapter, *args, **kwargs)
+            )
+        return inner
+
+    @classmethod
+    def _invalidates(cls, func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def inner(adapter, *args, **kwargs):
+            try:
+                return func(adapter, *args, **kwargs)
+            finally:
+                arguments = cls._bind(signature, adapter, args, kwargs)
+                if arguments is not None:
+                    adapter._invalidate_introspection(arguments)
+        return inner
+
+
+introspection = _Introspection()
+
+
 class AdapterMeta(abc.ABCMeta):
     def __new__(mcls, name, bases, namespace, **kwargs):
         cls = super().__new__(mcls, name, bases, namespace, **kwargs)
@@ -110,7 +181,20 @@ class AdapterMeta(abc.ABCMeta):
             if parse_replacement is not None:
                 replacements[name] = parse_replacement
 
+        # apply the introspection decorators of base classes to overrides
+        wrappers: Dict[str, Callable] = {}
+        for base in bases:
+            wrappers.update(getattr(base, '_introspection_wrappers_', {}))
+
+        for name, value in namespace.items():
+            wrapper = getattr(value, '_introspection_wrapper_', None)
+            if wrapper is not None:
+                wrappers[name] = wrapper
+            elif name in wrappers and inspect.isfunction(value):
+                setattr(cls, name, introspection._mark(value, wrappers[name]))
+
         cls._available_: FrozenSet[str] = frozenset(available)
+        cls._introspection_wrappers_: Dict[str, Callable] = wrappers
         # should this be a namedtuple so it will be immutable like _available_?
         cls._parse_replacements_: Dict[str, Callable] = replacements
         return cls
@@ -1,4 +1,5 @@
-from collections import namedtuple
+from collections import deque, namedtuple
+from contextlib import contextmanager
 import threading
 from copy import deepcopy
 from dbt.logger import CACHE_LOGGER as logger
@@ -35,33 +36,34 @@ def dot_separated(key):
 class _CachedRelation:
     """Nothing about _CachedRelation is guaranteed to be thread-safe!
 
-    :attr str schema: The schema of this relation.
-    :attr str identifier: The identifier of this relation.
+    :attr str database: The lowercased database of this relation.
+    :attr str schema: The lowercased schema of this relation.
+    :attr str identifier: The lowercased identifier of this relation.
     :attr Dict[_ReferenceKey, _CachedRelation] referenced_by: The relations
         that refer to this relation.
+    :attr Set[_ReferenceKey] references: The relations that this relation
+        refers to (the reverse of referenced_by).
     :attr BaseRelation inner: The underlying dbt relation.
     """
     def __init__(self, inner):
         self.referenced_by = {}
+        self.references = set()
+        self._set_inner(inner)
+
+    def _set_inner(self, inner):
+        """Set the underlying relation, lowercasing its path components once
+        here instead of on every lookup.
+        """
         self.inner = inner
+        self.database = _lower(inner.database)
+        self.schema = _lower(inner.schema)
+        self.identifier = _lower(inner.identifier)
 
     def __str__(self):
         return (
             '_CachedRelation(database={}, schema={}, identifier={}, inner={})'
         ).format(self.database, self.schema, self.identifier, self.inner)
 
-    @property
-    def database(self):
-        return _lower(self.inner.database)
-
-    @property
-    def schema(self):
-        return _lower(self.inner.schema)
-
-    @property
-    def identifier(self):
-        return _lower(self.inner.identifier)
-
     def __copy__(self):
         new = self.__class__(self.inner)
         new.__dict__.update(self.__dict__)
@@ -71,6 +73,7 @@ class _CachedRelation:
         new = self.__class__(self.inner.incorporate())
         new.__dict__.update(self.__dict__)
         new.referenced_by = deepcopy(self.referenced_by, memo)
+        new.references = set(self.references)
 
     def is_referenced_by(self, key):
         return key in self.referenced_by
@@ -80,7 +83,7 @@ class _CachedRelation:
 
         :return _ReferenceKey: A key for this relation.
         """
-        return _make_key(self)
+        return _ReferenceKey(self.database, self.schema, self.identifier)
 
     def add_reference(self, referrer):
         """Add a reference from referrer to self, indicating that if this node
@@ -89,17 +92,26 @@ class _CachedRelation:
         :param _CachedRelation referrer: The node that refers to this node.
         """
         self.referenced_by[referrer.key()] = referrer
+        referrer.references.add(self.key())
 
     def collect_consequences(self):
-        """Recursively collect a set of _ReferenceKeys that would
-        consequentially get dropped if this were dropped via
-        "drop ... cascade".
+        """Collect a set of _ReferenceKeys that would consequentially get
+        dropped if this were dropped via "drop ... cascade".
+
+        This is a breadth-first walk of referenced_by, so each relation is
+        visited once no matter how many paths lead to it, and deep chains of
+        views don't hit the recursion limit.
 
         :return Set[_ReferenceKey]: All the relations that would be dropped
         """
         consequences = {self.key()}
-        for relation in self.referenced_by.values():
-            consequences.update(relation.collect_consequences())
+        to_visit = deque([self])
+        while to_visit:
+            relation = to_visit.popleft()
+            for key, referrer in relation.referenced_by.items():
+                if key not in consequences:
+                    consequences.add(key)
+                    to_visit.append(referrer)
         return consequences
 
     def release_references(self, keys):
@@ -108,9 +120,8 @@ class _CachedRelation:
 
         :param Iterable[_ReferenceKey] keys: The keys to drop.
         """
-        keys = set(self.referenced_by) & set(keys)
         for key in keys:
-            self.referenced_by.pop(key)
+            self.referenced_by.pop(key, None)
 
     def rename(self, new_relation):
         """Rename this cached relation to new_relation.
@@ -124,13 +135,13 @@ class _CachedRelation:
         # also store a table_name, and usually use it in their  .render(),
         # so we need to update that as well. It doesn't appear that
         # table_name is ever anything but the identifier (via .create())
-        self.inner = self.inner.incorporate(
+        self._set_inner(self.inner.incorporate(
             path={
                 'database': new_relation.inner.database,
                 'schema': new_relation.inner.schema,
                 'identifier': new_relation.inner.identifier
             },
-        )
+        ))
 
     def rename_key(self, old_key, new_key):
         """Rename a reference that may or may not exist. Only handles the
@@ -167,19 +178,112 @@ def lazy_log(msg, func):
     logger.debug(msg.format(func()))
 
 
+class _ReadWriteLock:
+    """A lock that any number of threads can hold for reading at once, or a
+    single thread for writing. Threads waiting to write block new readers, so
+    a steady stream of lookups can't starve them.
+
+    Both sides are reentrant, and the writing thread may also read. A thread
+    that only holds the lock for reading must not try to write: it would wait
+    for itself forever, so that raises instead. Using the lock itself as a
+    context manager acquires it for writing.
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._local = threading.local()
+        self._readers = 0
+        self._writer = None
+        self._writes = 0
+        self._waiting_writers = 0
+
+    def _held_reads(self):
+        return getattr(self._local, 'reads', 0)
+
+    def acquire_read(self):
+        ident = threading.get_ident()
+        with self._cond:
+            if self._writer != ident and not self._held_reads():
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers += 1
+        self._local.reads = self._held_reads() + 1
+
+    def release_read(self):
+        self._local.reads = self._held_reads() - 1
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        ident = threading.get_ident()
+        with self._cond:
+            if self._writer == ident:
+                self._writes += 1
+                return
+            if self._held_reads():
+                raise dbt.exceptions.InternalException(
+                    'Cannot write to the relations cache while reading it'
+                )
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = ident
+            self._writes = 1
+
+    def release_write(self):
+        with self._cond:
+            self._writes -= 1
+            if not self._writes:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def __enter__(self):
+        self.acquire_write()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release_write()
+
+
 class RelationsCache:
     """A cache of the relations known to dbt. Keeps track of relationships
     declared between tables and handles renames/drops as a real database would.
 
     :attr Dict[_ReferenceKey, _CachedRelation] relations: The known relations.
-    :attr threading.RLock lock: The lock around relations, held during updates.
-        The adapters also hold this lock while filling the cache.
+    :attr _ReadWriteLock lock: The lock around relations. Lookups hold it for
+        reading, so they don't block each other; updates hold it for writing.
+        Keep the critical sections short: never hold it while waiting on the
+        database.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
+    :attr Dict[Tuple[str, str], Dict[_ReferenceKey, _CachedRelation]]
+        _schema_index: The known relations, grouped by their lowercased
+        (database, schema). Always updated alongside relations.
     """
     def __init__(self):
         self.relations = {}
-        self.lock = threading.RLock()
+        self.lock = _ReadWriteLock()
         self.schemas = set()
+        self._schema_index = {}
 
     def add_schema(self, database, schema):
         """Add a schema to the set of known schemas (case-insensitive)
@@ -224,7 +328,7 @@ class RelationsCache:
         # we have to hold the lock for the entire dump, if other threads modify
         # self.relations or any cache entry's referenced_by during iteration
         # it's a runtime error!
-        with self.lock:
+        with self.lock.read():
             return {
                 dot_separated(k): v.dump_graph_entry()
                 for k, v in self.relations.items()
@@ -239,7 +343,31 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        cached = self.relations.setdefault(key, relation)
+        self._index_add(key, cached)
+        return cached
+
+    def _index_add(self, key, relation):
+        """Add a relation to the schema index.
+
+        :param _ReferenceKey key: The key of the relation.
+        :param _CachedRelation relation: The relation stored under key.
+        """
+        bucket = self._schema_index.setdefault((key.database, key.schema), {})
+        bucket[key] = relation
+
+    def _index_remove(self, key):
+        """Remove a relation from the schema index. Unknown keys are ignored.
+
+        :param _ReferenceKey key: The key of the relation to remove.
+        """
+        schema_key = (key.database, key.schema)
+        bucket = self._schema_index.get(schema_key)
+        if bucket is None:
+            return
+        bucket.pop(key, None)
+        if not bucket:
+            del self._schema_index[schema_key]
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
@@ -330,18 +458,46 @@ class RelationsCache:
 
         lazy_log('after adding: {!s}', self.dump_graph)
 
+    def add_relations(self, relations, schemas, clear=False):
+        """Add many relations to the cache, and mark every given schema as
+        cached (even the ones with no relations), all under a single hold of
+        the lock. Readers never see a partially-populated schema.
+
+        :param Iterable[BaseRelation] relations: The underlying relations.
+        :param Iterable[Tuple[str, str]] schemas: The (database, schema) pairs
+            that were searched to find the relations.
+        :param bool clear: If set, clear the cache first, under the same hold
+            of the lock. Readers never see it empty.
+        """
+        cached = [_CachedRelation(r) for r in relations]
+        logger.debug('Adding {} relations'.format(len(cached)))
+        with self.lock:
+            if clear:
+                self.clear()
+            for relation in cached:
+                self._setdefault(relation)
+            self.update_schemas(schemas)
+
+        lazy_log('after adding: {!s}', self.dump_graph)
+
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
         cascade!
 
         :param Iterable[_ReferenceKey] keys: The keys to remove.
         """
-        # remove direct refs
         for key in keys:
-            del self.relations[key]
-        # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+            # remove direct refs
+            dropped = self.relations.pop(key)
+            self._index_remove(key)
+            # then remove the entry from each relation it referred to. Only
+            # those can have it in their referenced_by.
+            for referenced_key in dropped.references:
+                referenced = self.relations.get(referenced_key)
+                if referenced is not None:
+                    referenced.release_references((key,))
+            for referrer in dropped.referenced_by.values():
+                referrer.references.discard(key)
 
     def _drop_cascade_relation(self, dropped):
         """Drop the given relation and cascade it appropriately to all
@@ -387,20 +543,27 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._index_remove(old_key)
         new_key = new_relation.key()
 
         # relaton has to rename its innards, so it needs the _CachedRelation.
         relation.rename(new_relation)
-        # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
+        # update all the relations that it refers to
+        for referenced_key in relation.references:
+            cached = self.relations.get(referenced_key)
+            if cached is not None and cached.is_referenced_by(old_key):
                 logger.debug(
                     'updated reference from {0} -> {2} to {1} -> {2}'
                     .format(old_key, new_key, cached.key())
                 )
                 cached.rename_key(old_key, new_key)
+        # and all the relations that refer to it
+        for referrer in relation.referenced_by.values():
+            referrer.references.discard(old_key)
+            referrer.references.add(new_key)
 
         self.relations[new_key] = relation
+        self._index_add(new_key, relation)
         # also fixup the schemas!
         self.remove_schema(old_key.database, old_key.schema)
         self.add_schema(new_key.database, new_key.schema)
@@ -469,15 +632,13 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        schema = _lower(schema)
-        with self.lock:
-            results = [
-                r.inner for r in self.relations.values()
-                if (r.schema == _lower(schema) and
-                    r.database == _lower(database))
-            ]
+        schema_key = (_lower(database), _lower(schema))
+        with self.lock.read():
+            bucket = self._schema_index.get(schema_key, {})
+            results = [r.inner for r in bucket.values()]
 
-        if None in results:
+        # identity check: `None in results` would call each relation's __eq__
+        if any(r is None for r in results):
             dbt.exceptions.raise_cache_inconsistent(
                 'in get_relations, a None relation was found in the cache!'
             )
@@ -488,3 +649,121 @@ class RelationsCache:
         with self.lock:
             self.relations.clear()
             self.schemas.clear()
+            self._schema_index.clear()
+
+
+def _is_relation(value):
+    return all(
+        hasattr(value, attr) for attr in ('database', 'schema', 'identifier')
+    )
+
+
+class IntrospectionCache:
+    """A per-invocation cache of what the database said about its schemas,
+    relations and columns, so repeated introspection of the same objects
+    doesn't hit the database every time.
+
+    Each entry is keyed by the method name and its lowercased arguments, and
+    remembers the _ReferenceKeys it describes. A _ReferenceKey with no
+    identifier describes a whole schema, and one with no schema a whole
+    database.
+
+    :attr threading.Lock lock: The lock around entries. Never held while
+        waiting on the database.
+    :attr Dict[Any, Tuple[List[_ReferenceKey], Any]] entries: The cached
+        results, and what they describe.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    @staticmethod
+    def _normalize(value):
+        if _is_relation(value):
+            return _make_key(value)
+        elif isinstance(value, str):
+            return value.lower()
+        return value
+
+    @classmethod
+    def make_key(cls, name, arguments):
+        """Make a cache key for a call to the named method with the given
+        arguments, or return None if the arguments can't be used as a key.
+        """
+        key = (name, tuple(
+            (arg, cls._normalize(value))
+            for arg, value in sorted(arguments.items())
+        ))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def describes(arguments):
+        """Get the _ReferenceKeys that a call with the given arguments is
+        about: every relation among the arguments, and the `database`,
+        `schema` and `identifier` arguments if there are any.
+        """
+        targets = [
+            _make_key(value) for value in arguments.values()
+            if _is_relation(value)
+        ]
+        if 'database' in arguments or 'schema' in arguments:
+            targets.append(_ReferenceKey(
+                _lower(arguments.get('database')),
+                _lower(arguments.get('schema')),
+                _lower(arguments.get('identifier')),
+            ))
+        return targets
+
+    def get(self, key):
+        """Look up a cached result.
+
+        :return Tuple[bool, Any]: Whether the key was found, and its value.
+        """
+        with self.lock:
+            if key not in self.entries:
+                return False, None
+            value = self.entries[key][1]
+        if isinstance(value, list):
+            value = list(value)
+        return True, value
+
+    def set(self, key, value, targets):
+        if isinstance(value, list):
+            value = list(value)
+        with self.lock:
+            self.entries[key] = (targets, value)
+
+    @staticmethod
+    def _is_stale(entry_target, changed):
+        if entry_target.database != changed.database:
+            return False
+        if changed.identifier is None:
+            # a schema was created or dropped: that changes everything in
+            # it, and the list of schemas in the database.
+            return entry_target.schema in (changed.schema, None)
+        # a relation changed: that changes what we know about it, and the
+        # list of relations in its schema.
+        return (entry_target.schema == changed.schema and
+                entry_target.identifier in (changed.identifier, None))
+
+    def invalidate(self, changed):
+        """Forget every cached result about the given relation. A relation
+        with no identifier stands for its whole schema.
+        """
+        changed = _make_key(changed)
+        with self.lock:
+            stale = [
+                key for key, (targets, _) in self.entries.items()
+                if any(self._is_stale(t, changed) for t in targets)
+            ]
+            for key in stale:
+                del self.entries[key]
+
+    def clear(self):
+        """Clear the cache"""
+        with self.lock:
+            self.entries.clear()
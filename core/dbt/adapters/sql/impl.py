@@ -6,11 +6,13 @@ from dbt.contracts.connection import Connection
 import dbt.exceptions
 import dbt.flags
 from dbt.adapters.base import BaseAdapter, available
+from dbt.adapters.base.meta import introspection
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.logger import GLOBAL_LOGGER as logger
 
 
 LIST_RELATIONS_MACRO_NAME = 'list_relations_without_caching'
+GET_SCHEMA_FINGERPRINT_MACRO_NAME = 'get_schema_fingerprint'
 GET_COLUMNS_IN_RELATION_MACRO_NAME = 'get_columns_in_relation'
 LIST_SCHEMAS_MACRO_NAME = 'list_schemas'
 CHECK_SCHEMA_EXISTS_MACRO_NAME = 'check_schema_exists'
@@ -114,6 +116,7 @@ class SQLAdapter(BaseAdapter):
 
                 self.alter_column_type(current, column_name, new_type)
 
+    @introspection.invalidates
     def alter_column_type(self, relation, column_name, new_column_type):
         """
         1. Create a new column (w/ temp name and correct type)
@@ -209,6 +212,16 @@ class SQLAdapter(BaseAdapter):
             ))
         return relations
 
+    def get_schema_fingerprint(self, information_schema, schema):
+        kwargs = {'information_schema': information_schema, 'schema': schema}
+        results = self.execute_macro(
+            GET_SCHEMA_FINGERPRINT_MACRO_NAME,
+            kwargs=kwargs
+        )
+        if results is None or len(results) == 0:
+            return None
+        return '|'.join(str(value) for value in results[0])
+
     def quote(cls, identifier):
         return '"{}"'.format(identifier)
 
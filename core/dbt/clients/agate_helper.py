@@ -49,6 +49,31 @@ def table_from_data_flat(data, column_names):
     return agate.Table(rows, column_names, column_types=DEFAULT_TYPE_TESTER)
 
 
+def merge_tables(tables):
+    """Merge a list of agate tables into one. The tables may disagree about
+    column types (for example, a column that is all null in one of them), so
+    the types are inferred again from the combined rows.
+    """
+    if len(tables) == 0:
+        return empty_table()
+    elif len(tables) == 1:
+        return tables[0]
+
+    column_names = []
+    for table in tables:
+        for name in table.column_names:
+            if name not in column_names:
+                column_names.append(name)
+
+    data = []
+    for table in tables:
+        for row in table:
+            values = dict(zip(table.column_names, row))
+            data.append({name: values.get(name) for name in column_names})
+
+    return table_from_data(data, column_names)
+
+
 def empty_table():
     "Returns an empty Agate table. To be used in place of None"
 
@@ -61,6 +61,31 @@ def get_current_sha(cwd):
     return out.decode('utf-8')
 
 
+def ls_remote(cwd, repo, revision):
+    """Find the commit SHA that the given revision of a remote repository
+    points to, without cloning it. Tags are preferred to branches, as in
+    `checkout`. A revision that is already a full SHA is returned as-is.
+
+    :returns Optional[str]: The SHA, or None if the revision is not a tag or
+        branch of the remote.
+    """
+    out, _ = run_cmd(cwd, ['git', 'ls-remote', repo, revision,
+                           '{}^{{}}'.format(revision)],
+                     env={'LC_ALL': 'C'})
+    refs = {}
+    for line in out.decode('utf-8').splitlines():
+        sha, _, ref = line.partition('\t')
+        refs[ref] = sha
+
+    tag = 'refs/tags/{}'.format(revision)
+    for ref in (tag + '^{}', tag, 'refs/heads/{}'.format(revision)):
+        if ref in refs:
+            return refs[ref]
+    if re.match('^[0-9a-f]{40}$', revision):
+        return revision
+    return None
+
+
 def remove_remote(cwd):
     return run_cmd(cwd, ['git', 'remote', 'rm', 'origin'], env={'LC_ALL': 'C'})
 
@@ -2,7 +2,9 @@ import codecs
 import linecache
 import os
 import tempfile
-from typing import List, Union, Set, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Union, Set, Optional
 
 import jinja2
 import jinja2._compat
@@ -86,12 +88,21 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
         return super()._compile(source, filename)
 
 
+# the original_file_path of nodes sent over RPC, see RemoteFile
+REMOTE_FILE_PATH = 'from remote system'
+
+
 class TemplateCache:
 
     def __init__(self):
         self.file_cache = {}
 
     def get_node_template(self, node):
+        # macros sent over RPC all have the same path and are only used for
+        # one request, so don't cache them
+        if node.original_file_path == REMOTE_FILE_PATH:
+            return get_template(string=node.raw_sql, ctx={}, node=node)
+
         key = (node.package_name, node.original_file_path)
 
         if key in self.file_cache:
@@ -113,10 +124,53 @@ class TemplateCache:
 template_cache = TemplateCache()
 
 
+class RenderTracker:
+    """Record what a node used while it was rendered: the macros it called,
+    the environment variables it read, and whether it did anything (like
+    querying the database) that makes its rendered SQL unsafe to reuse.
+    """
+    def __init__(self):
+        self.macros: Set[str] = set()
+        self.env_vars: Dict[str, Optional[str]] = {}
+        self.uncacheable_reason: Optional[str] = None
+
+    @property
+    def cacheable(self) -> bool:
+        return self.uncacheable_reason is None
+
+    def mark_uncacheable(self, reason: str) -> None:
+        if self.uncacheable_reason is None:
+            self.uncacheable_reason = reason
+
+
+_render_tracking = threading.local()
+
+
+def get_render_tracker() -> Optional[RenderTracker]:
+    return getattr(_render_tracking, 'tracker', None)
+
+
+@contextmanager
+def track_render():
+    """Track everything rendered in this thread inside the block, and yield
+    the RenderTracker that records it.
+    """
+    previous = get_render_tracker()
+    tracker = RenderTracker()
+    _render_tracking.tracker = tracker
+    try:
+        yield tracker
+    finally:
+        _render_tracking.tracker = previous
+
+
 def macro_generator(node):
     def apply_context(context):
         def call(*args, **kwargs):
             name = node.name
+            tracker = get_render_tracker()
+            if tracker is not None:
+                tracker.macros.add(node.unique_id)
             template = template_cache.get_node_template(node)
             module = template.make_module(context, False, context)
 
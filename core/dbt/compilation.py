@@ -14,6 +14,7 @@ import dbt.contracts.project
 import dbt.exceptions
 import dbt.flags
 import dbt.config
+from dbt.clients.jinja import track_render
 from dbt.contracts.graph.compiled import InjectedCTE, COMPILED_TYPES
 from dbt.contracts.graph.parsed import ParsedNode
 
@@ -106,9 +107,12 @@ class Compiler:
         dbt.clients.system.make_directory(self.config.target_path)
         dbt.clients.system.make_directory(self.config.modules_path)
 
-    def compile_node(self, node, manifest, extra_context=None):
+    def compile_node(self, node, manifest, extra_context=None, cache=None):
         if extra_context is None:
             extra_context = {}
+        # the compile cache doesn't know what is in extra context
+        if extra_context:
+            cache = None
 
         logger.debug("Compiling {}".format(node.unique_id))
 
@@ -122,14 +126,28 @@ class Compiler:
         })
         compiled_node = _compiled_type_for(node).from_dict(data)
 
-        context = dbt.context.runtime.generate(
-            compiled_node, self.config, manifest)
-        context.update(extra_context)
+        cached = None
+        if cache is not None:
+            cached = cache.get(node)
 
-        compiled_node.compiled_sql = dbt.clients.jinja.get_rendered(
-            node.raw_sql,
-            context,
-            node)
+        if cached is not None:
+            logger.debug("Using cached compiled SQL for {}".format(
+                node.unique_id))
+            compiled_node.compiled_sql = cached.compiled_sql
+            for cte_id in cached.extra_ctes:
+                compiled_node.set_cte(cte_id, None)
+        else:
+            with track_render() as tracker:
+                context = dbt.context.runtime.generate(
+                    compiled_node, self.config, manifest)
+                context.update(extra_context)
+
+                compiled_node.compiled_sql = dbt.clients.jinja.get_rendered(
+                    node.raw_sql,
+                    context,
+                    node)
+            if cache is not None:
+                cache.put(node, compiled_node, tracker)
 
         compiled_node.compiled = True
 
@@ -225,9 +243,10 @@ def _is_writable(node):
     return True
 
 
-def compile_node(adapter, config, node, manifest, extra_context, write=True):
+def compile_node(adapter, config, node, manifest, extra_context, write=True,
+                 cache=None):
     compiler = Compiler(config)
-    node = compiler.compile_node(node, manifest, extra_context)
+    node = compiler.compile_node(node, manifest, extra_context, cache)
     node = _inject_runtime_config(adapter, node, extra_context)
 
     if write and _is_writable(node):
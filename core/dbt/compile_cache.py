@@ -0,0 +1,219 @@
+"""Reuse the compiled SQL of nodes between invocations.
+
+A node's compiled SQL is a function of its raw SQL and config, the relations
+it refers to, the macros it calls, and the project's target and vars. The
+cache stores the compiled SQL of each node under a key built from all of
+those, and only hands it back when every one of them is unchanged.
+
+Nodes that look at the database while rendering (run_query, statements,
+introspective adapter methods) or at values that change on every invocation
+(run_started_at, invocation_id, modules, graph) are never cached.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from hologram import ValidationError
+
+import dbt.flags
+import dbt.version
+from dbt.clients.jinja import RenderTracker
+from dbt.clients.system import load_file_contents
+from dbt.contracts.results import CompileCacheEntry, CompileCacheSnapshot
+from dbt.logger import GLOBAL_LOGGER as logger
+
+COMPILE_CACHE_FILE_NAME = 'compile_cache.json'
+
+# context members whose values are different in every invocation
+VOLATILE_CONTEXT_PATTERN = re.compile(
+    r'\b(run_started_at|invocation_id|modules|graph|load_agate_table)\b'
+)
+
+
+def _hash(value: Any) -> str:
+    data = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class CompileCache:
+    def __init__(
+        self,
+        config,
+        manifest,
+        entries: Optional[Dict[str, CompileCacheEntry]] = None,
+    ):
+        self.config = config
+        self.manifest = manifest
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, CompileCacheEntry] = entries or {}
+        self._macro_hashes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._base_key = self._calculate_base_key()
+
+    @staticmethod
+    def path(config) -> str:
+        return os.path.join(config.target_path, COMPILE_CACHE_FILE_NAME)
+
+    @classmethod
+    def load(cls, config, manifest) -> 'CompileCache':
+        """Load the compile cache from the target directory. A missing,
+        unreadable or outdated cache file just gives an empty cache.
+        """
+        path = cls.path(config)
+        entries: Dict[str, CompileCacheEntry] = {}
+        if os.path.exists(path):
+            try:
+                snapshot = CompileCacheSnapshot.from_dict(
+                    json.loads(load_file_contents(path))
+                )
+            except (ValueError, ValidationError) as exc:
+                logger.debug('Ignoring invalid compile cache at {}: {}'
+                             .format(path, exc))
+            else:
+                if snapshot.dbt_version == dbt.version.__version__:
+                    entries = snapshot.nodes
+        return cls(config, manifest, entries)
+
+    def write(self) -> None:
+        with self._lock:
+            nodes = {
+                unique_id: entry
+                for unique_id, entry in self._entries.items()
+                if unique_id in self.manifest.nodes
+            }
+        logger.debug('Compile cache: {} hits, {} misses'
+                     .format(self.hits, self.misses))
+        snapshot = CompileCacheSnapshot(
+            dbt_version=dbt.version.__version__,
+            generated_at=datetime.utcnow(),
+            nodes=nodes,
+        )
+        snapshot.write(self.path(self.config))
+
+    def _calculate_base_key(self) -> str:
+        """Hash everything that every node's rendering can depend on: the
+        target, vars given on the command line, quoting, flags, and which
+        macros exist (adding or removing a macro can change which macro a
+        name refers to).
+        """
+        config = self.config
+        return _hash({
+            'dbt_version': dbt.version.__version__,
+            'adapter_type': config.credentials.type,
+            'profile_name': config.profile_name,
+            'target_name': config.target_name,
+            'credentials': config.credentials.to_dict(),
+            'threads': config.threads,
+            'cli_vars': config.cli_vars,
+            'quoting': config.quoting,
+            'full_refresh': dbt.flags.FULL_REFRESH,
+            'macros': sorted(self.manifest.macros),
+        })
+
+    def _macro_hash(self, unique_id: str) -> str:
+        if unique_id not in self._macro_hashes:
+            macro_sql = self.manifest.macros[unique_id].raw_sql
+            self._macro_hashes[unique_id] = _hash(macro_sql)
+        return self._macro_hashes[unique_id]
+
+    def _parent_relation(self, unique_id: str) -> Dict[str, Any]:
+        parent = self.manifest.nodes.get(unique_id)
+        if parent is None:
+            return {'unique_id': unique_id}
+        parent_config = getattr(parent, 'config', None)
+        return {
+            'unique_id': unique_id,
+            'database': parent.database,
+            'schema': parent.schema,
+            'alias': getattr(parent, 'alias', None),
+            'identifier': getattr(parent, 'identifier', None),
+            'materialized': getattr(parent_config, 'materialized', None),
+            'quoting': getattr(parent, 'quoting', None),
+        }
+
+    def node_key(self, node) -> str:
+        """Hash the node itself and the relations it refers to."""
+        node_data = node.to_dict()
+        node_data.pop('build_path', None)
+        return _hash({
+            'base': self._base_key,
+            'node': node_data,
+            'parents': [
+                self._parent_relation(unique_id)
+                for unique_id in node.depends_on.nodes
+            ],
+        })
+
+    def _is_fresh(self, entry: CompileCacheEntry, key: str) -> bool:
+        if entry.key != key:
+            return False
+        for unique_id, macro_hash in entry.macros.items():
+            if unique_id not in self.manifest.macros:
+                return False
+            if self._macro_hash(unique_id) != macro_hash:
+                return False
+        for name, value in entry.env_vars.items():
+            if os.environ.get(name) != value:
+                return False
+        return True
+
+    def get(self, node) -> Optional[CompileCacheEntry]:
+        """Get the cached compile result for the node, if it is still
+        valid.
+        """
+        with self._lock:
+            entry = self._entries.get(node.unique_id)
+        if entry is not None:
+            if not self._is_fresh(entry, self.node_key(node)):
+                entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def _uncacheable_reason(self, node, tracker: RenderTracker):
+        if not tracker.cacheable:
+            return tracker.uncacheable_reason
+
+        sources = [node.raw_sql] + [
+            self.manifest.macros[unique_id].raw_sql
+            for unique_id in tracker.macros
+            if unique_id in self.manifest.macros
+        ]
+        for source in sources:
+            match = VOLATILE_CONTEXT_PATTERN.search(source)
+            if match is not None:
+                return match.group(0)
+        return None
+
+    def put(self, node, compiled_node, tracker: RenderTracker) -> None:
+        """Store the result of rendering the node, unless the tracker saw
+        anything that makes it unsafe to reuse.
+        """
+        reason = self._uncacheable_reason(node, tracker)
+        if reason is not None:
+            logger.debug('Not caching the compiled SQL of {}: it uses {}'
+                         .format(node.unique_id, reason))
+            with self._lock:
+                self._entries.pop(node.unique_id, None)
+            return
+
+        entry = CompileCacheEntry(
+            key=self.node_key(node),
+            compiled_sql=compiled_node.compiled_sql,
+            extra_ctes=[cte.id for cte in compiled_node.extra_ctes],
+            macros={
+                unique_id: self._macro_hash(unique_id)
+                for unique_id in tracker.macros
+            },
+            env_vars=dict(tracker.env_vars),
+        )
+        with self._lock:
+            self._entries[node.unique_id] = entry
@@ -10,16 +10,13 @@ from dbt.exceptions import DbtProjectError
 from dbt.exceptions import ValidationException
 from dbt.exceptions import RuntimeException
 from dbt.exceptions import validator_error_message
+from dbt.flags import DEFAULT_PROFILES_DIR, PROFILES_DIR  # noqa
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import parse_cli_vars
 
 from .renderer import ConfigRenderer
 
 DEFAULT_THREADS = 1
-DEFAULT_PROFILES_DIR = os.path.join(os.path.expanduser('~'), '.dbt')
-PROFILES_DIR = os.path.expanduser(
-    os.getenv('DBT_PROFILES_DIR', DEFAULT_PROFILES_DIR)
-)
 
 INVALID_PROFILE_MESSAGE = """
 dbt encountered an error while trying to read your profiles.yml file.
@@ -149,7 +149,7 @@ class Project:
                  analysis_paths, docs_paths, target_path, snapshot_paths,
                  clean_targets, log_path, modules_path, quoting, models,
                  on_run_start, on_run_end, seeds, snapshots, dbt_version,
-                 packages):
+                 packages, concurrency_groups=None):
         self.project_name = project_name
         self.version = version
         self.project_root = project_root
@@ -173,6 +173,9 @@ class Project:
         self.snapshots = snapshots
         self.dbt_version = dbt_version
         self.packages = packages
+        if concurrency_groups is None:
+            concurrency_groups = {}
+        self.concurrency_groups = concurrency_groups
 
     @staticmethod
     def _preprocess(project_dict):
@@ -256,6 +259,7 @@ class Project:
         on_run_end = project_dict.get('on-run-end', [])
         seeds = project_dict.get('seeds', {})
         snapshots = project_dict.get('snapshots', {})
+        concurrency_groups = project_dict.get('concurrency-groups', {})
         dbt_raw_version = project_dict.get('require-dbt-version', '>=0.0.0')
 
         try:
@@ -291,10 +295,18 @@ class Project:
             seeds=seeds,
             snapshots=snapshots,
             dbt_version=dbt_version,
-            packages=packages
+            packages=packages,
+            concurrency_groups=concurrency_groups,
         )
         # sanity check - this means an internal issue
         project.validate()
+        # the limits are known to be integers once the project is valid
+        for group, limit in concurrency_groups.items():
+            if limit < 1:
+                raise DbtProjectError(
+                    'Invalid concurrency group "{}": the limit must be at '
+                    'least 1, got {}'.format(group, limit)
+                )
         return project
 
     def __str__(self):
@@ -337,6 +349,7 @@ class Project:
             'on-run-end': self.on_run_end,
             'seeds': self.seeds,
             'snapshots': self.snapshots,
+            'concurrency-groups': self.concurrency_groups,
             'require-dbt-version': [
                 v.to_version_string() for v in self.dbt_version
             ],
@@ -21,7 +21,8 @@ class RuntimeConfig(Project, Profile):
                  docs_paths, target_path, snapshot_paths, clean_targets,
                  log_path, modules_path, quoting, models, on_run_start,
                  on_run_end, seeds, snapshots, dbt_version, profile_name,
-                 target_name, config, threads, credentials, packages, args):
+                 target_name, config, threads, credentials, packages, args,
+                 concurrency_groups=None):
         # 'vars'
         self.args = args
         self.cli_vars = parse_cli_vars(getattr(args, 'vars', '{}'))
@@ -50,7 +51,8 @@ class RuntimeConfig(Project, Profile):
             seeds=seeds,
             snapshots=snapshots,
             dbt_version=dbt_version,
-            packages=packages
+            packages=packages,
+            concurrency_groups=concurrency_groups,
         )
         # 'profile'
         Profile.__init__(
@@ -106,7 +108,8 @@ class RuntimeConfig(Project, Profile):
             config=profile.config,
             threads=profile.threads,
             credentials=profile.credentials,
-            args=args
+            args=args,
+            concurrency_groups=project.concurrency_groups,
         )
 
     def new_project(self, project_root):
@@ -2,7 +2,7 @@ import json
 import os
 
 import dbt.tracking
-from dbt.clients.jinja import undefined_error
+from dbt.clients.jinja import get_render_tracker, undefined_error
 from dbt.utils import merge
 
 
@@ -28,6 +28,10 @@ def add_tracking(context):
 
 
 def env_var(var, default=None):
+    tracker = get_render_tracker()
+    if tracker is not None:
+        tracker.env_vars[var] = os.environ.get(var)
+
     if var in os.environ:
         return os.environ[var]
     elif default is not None:
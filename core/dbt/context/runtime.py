@@ -128,12 +128,21 @@ class Config:
         return to_return
 
 
+# adapter methods whose results do not depend on the state of the database
+PURE_ADAPTER_METHODS = frozenset({
+    'quote', 'quote_as_configured', 'convert_type',
+})
+
+
 class DatabaseWrapper(dbt.context.common.BaseDatabaseWrapper):
     """The runtime database wrapper exposes everything the adapter marks
     available.
     """
     def __getattr__(self, name):
         if name in self.adapter._available_:
+            tracker = dbt.clients.jinja.get_render_tracker()
+            if tracker is not None and name not in PURE_ADAPTER_METHODS:
+                tracker.mark_uncacheable('adapter.{}'.format(name))
             return getattr(self.adapter, name)
         else:
             raise AttributeError(
@@ -90,6 +90,17 @@ class FileHash(JsonSchemaMixin):
         checksum = hashlib.new(name, data).hexdigest()
         return cls(name=name, checksum=checksum)
 
+    @classmethod
+    def from_file(cls, path: str, name='sha256'):
+        """Create a file hash from the raw bytes of the file at the given
+        path, without reading the whole file into memory at once.
+        """
+        hasher = hashlib.new(name)
+        with open(path, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(65536), b''):
+                hasher.update(chunk)
+        return cls(name=name, checksum=hasher.hexdigest())
+
 
 @dataclass
 class RemoteFile(JsonSchemaMixin):
@@ -151,8 +162,11 @@ class SourceFile(JsonSchemaMixin):
 
     @classmethod
     def seed(cls, path: FilePath) -> 'SourceFile':
-        """Seeds always parse the same regardless of their content."""
-        self = cls(path=path, checksum=FileHash.path(path.absolute_path))
+        """Seeds always parse the same regardless of their content, but their
+        checksum covers the data so the `state:` selector can tell when it
+        changed.
+        """
+        self = cls(path=path, checksum=FileHash.from_file(path.absolute_path))
         self.contents = ''
         return self
 
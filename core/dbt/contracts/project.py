@@ -157,6 +157,7 @@ class Project(HyphenatedJsonSchemaMixin, Replaceable):
     models: Dict[str, Any] = field(default_factory=dict)
     seeds: Dict[str, Any] = field(default_factory=dict)
     snapshots: Dict[str, Any] = field(default_factory=dict)
+    concurrency_groups: Dict[str, int] = field(default_factory=dict)
     packages: List[PackageSpec] = field(default_factory=list)
 
     @classmethod
@@ -268,3 +268,61 @@ class CatalogResults(JsonSchemaMixin, Writable):
     nodes: Dict[str, CatalogTable]
     generated_at: datetime
     _compile_results: Optional[Any] = None
+
+
+@dataclass
+class CachedCatalogRelation(JsonSchemaMixin):
+    database: str
+    schema: str
+    name: str
+    fingerprint: str
+    rows: List[Dict[str, Any]]
+
+    def key(self) -> CatalogKey:
+        return CatalogKey(
+            self.database.lower(), self.schema.lower(), self.name.lower()
+        )
+
+
+@dataclass
+class CatalogCache(JsonSchemaMixin, Writable):
+    adapter_type: str
+    profile_name: str
+    target_name: str
+    generated_at: datetime
+    # the agate type name of each catalog column
+    column_types: Dict[str, str]
+    relations: List[CachedCatalogRelation]
+
+
+@dataclass
+class CachedSchemaSnapshot(JsonSchemaMixin):
+    database: Optional[str]
+    schema: str
+    fingerprint: str
+    relations: List[Dict[str, Any]]
+
+
+@dataclass
+class RelationsCacheSnapshot(JsonSchemaMixin, Writable):
+    adapter_type: str
+    profile_name: str
+    target_name: str
+    generated_at: datetime
+    schemas: List[CachedSchemaSnapshot]
+
+
+@dataclass
+class CompileCacheEntry(JsonSchemaMixin):
+    key: str
+    compiled_sql: str
+    extra_ctes: List[str]
+    macros: Dict[str, str]
+    env_vars: Dict[str, Optional[str]]
+
+
+@dataclass
+class CompileCacheSnapshot(JsonSchemaMixin, Writable):
+    dbt_version: str
+    generated_at: datetime
+    nodes: Dict[str, CompileCacheEntry]
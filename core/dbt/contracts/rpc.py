@@ -39,6 +39,17 @@ class RPCExecParameters(RPCParameters):
     macros: Optional[str]
 
 
+@dataclass
+class RPCBatchItem(JsonSchemaMixin):
+    name: str
+    sql: str
+
+
+@dataclass
+class RPCExecBatchParameters(RPCParameters):
+    queries: List[RPCBatchItem]
+
+
 @dataclass
 class RPCCompileParameters(RPCParameters):
     models: Union[None, str, List[str]] = None
@@ -55,6 +66,7 @@ class RPCSnapshotParameters(RPCParameters):
 class RPCTestParameters(RPCCompileParameters):
     data: bool = False
     schema: bool = False
+    batch_size: Optional[int] = None
 
 
 @dataclass
@@ -162,6 +174,12 @@ class RemoteCompileResult(RemoteResult):
         return None
 
 
+@dataclass
+class RemoteCompileBatchResult(RemoteResult):
+    results: List[RemoteCompileResult]
+    elapsed_time: Real
+
+
 @dataclass
 class RemoteExecutionResult(ExecutionResult, RemoteResult):
     pass
@@ -185,6 +203,7 @@ class RemoteRunResult(RemoteCompileResult):
 
 RPCResult = Union[
     RemoteCompileResult,
+    RemoteCompileBatchResult,
     RemoteExecutionResult,
     RemoteCatalogResults,
     RemoteEmptyResult,
@@ -419,6 +438,32 @@ class PollCompileCompleteResult(RemoteCompileResult, PollResult):
         )
 
 
+@dataclass
+class PollCompileBatchCompleteResult(RemoteCompileBatchResult, PollResult):
+    state: TaskHandlerState = field(
+        metadata=restrict_to(TaskHandlerState.Success,
+                             TaskHandlerState.Failed),
+    )
+
+    @classmethod
+    def from_result(
+        cls: Type['PollCompileBatchCompleteResult'],
+        base: RemoteCompileBatchResult,
+        tags: TaskTags,
+        timing: TaskTiming,
+    ) -> 'PollCompileBatchCompleteResult':
+        return cls(
+            results=base.results,
+            elapsed_time=base.elapsed_time,
+            logs=base.logs,
+            tags=tags,
+            state=timing.state,
+            start=timing.start,
+            end=timing.end,
+            elapsed=timing.elapsed,
+        )
+
+
 @dataclass
 class PollRunCompleteResult(RemoteRunResult, PollResult):
     state: TaskHandlerState = field(
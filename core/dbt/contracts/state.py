@@ -0,0 +1,165 @@
+"""Compare the current manifest against the manifest of a previous
+invocation, as used by the `state:` selector.
+
+Two versions of a node are considered the same when they have the same
+checksum. A node's checksum covers its raw SQL, its config, and the source of
+the macros it may call; a seed's checksum also covers the checksum of its
+data file. Nodes don't record the macros they call, so any macro
+whose name (or, for adapter dispatched macros, whose name after the
+`<adapter>__` prefix) appears in the node's SQL is included, along with the
+macros those macros may call in turn and the node's materialization.
+"""
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from hologram import ValidationError
+
+from dbt.clients.system import load_file_contents
+from dbt.contracts.graph.manifest import Manifest
+from dbt.exceptions import RuntimeException
+from dbt.node_types import NodeType
+
+IDENTIFIER_PATTERN = re.compile(r'\w+')
+
+# the parts of a source definition that change what dbt reads from
+SOURCE_CHECKSUM_FIELDS = (
+    'database', 'schema', 'identifier', 'quoting', 'loaded_at_field',
+    'freshness', 'external',
+)
+
+
+def _checksum(value: Any) -> str:
+    data = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class ManifestChecksums:
+    """Calculate (and remember) the checksum of each node in a manifest."""
+    def __init__(self, manifest: Manifest):
+        self.manifest = manifest
+        self._checksums: Dict[str, str] = {}
+        self._identifiers: Dict[str, Set[str]] = {}
+        self._macros_by_name: Dict[str, List[str]] = {}
+        self._file_checksums: Dict[str, str] = {
+            unique_id: source_file.checksum.checksum
+            for source_file in manifest.files.values()
+            for unique_id in source_file.nodes
+        }
+        for unique_id, macro in manifest.macros.items():
+            names = {macro.name, macro.name.split('__', 1)[-1]}
+            for name in names:
+                self._macros_by_name.setdefault(name, []).append(unique_id)
+
+    def _macro_identifiers(self, unique_id: str) -> Set[str]:
+        if unique_id not in self._identifiers:
+            macro_sql = self.manifest.macros[unique_id].raw_sql
+            self._identifiers[unique_id] = set(
+                IDENTIFIER_PATTERN.findall(macro_sql)
+            )
+        return self._identifiers[unique_id]
+
+    def _called_macros(self, node) -> Set[str]:
+        """Find the unique IDs of the macros the node might call, directly
+        or through other macros.
+        """
+        names = set(IDENTIFIER_PATTERN.findall(node.raw_sql))
+        materialized = node.config.materialized
+        names.update(
+            name for name in self._macros_by_name
+            if name.startswith('materialization_{}_'.format(materialized))
+        )
+
+        found: Set[str] = set()
+        pending = list(names)
+        seen = set(names)
+        while pending:
+            name = pending.pop()
+            for unique_id in self._macros_by_name.get(name, ()):
+                if unique_id in found:
+                    continue
+                found.add(unique_id)
+                for called in self._macro_identifiers(unique_id) - seen:
+                    seen.add(called)
+                    pending.append(called)
+        return found
+
+    def _node_contents(self, node) -> Dict[str, Any]:
+        if node.resource_type == NodeType.Source:
+            data = node.to_dict(omit_none=False)
+            return {k: data.get(k) for k in SOURCE_CHECKSUM_FIELDS}
+
+        contents = {
+            'raw_sql': node.raw_sql,
+            'config': node.config.to_dict(),
+            'macros': {
+                unique_id: self.manifest.macros[unique_id].raw_sql
+                for unique_id in self._called_macros(node)
+            },
+        }
+        if node.resource_type == NodeType.Seed:
+            # seeds have no SQL, the data lives in the file
+            contents['file'] = self._file_checksums.get(node.unique_id)
+        return contents
+
+    def get(self, unique_id: str) -> Optional[str]:
+        """Get the checksum of the node with the given unique ID, or None if
+        it isn't in the manifest.
+        """
+        if unique_id not in self.manifest.nodes:
+            return None
+        if unique_id not in self._checksums:
+            node = self.manifest.nodes[unique_id]
+            self._checksums[unique_id] = _checksum(self._node_contents(node))
+        return self._checksums[unique_id]
+
+
+class PreviousState:
+    def __init__(self, manifest: Manifest):
+        self.manifest = manifest
+        self.checksums = ManifestChecksums(manifest)
+
+    @classmethod
+    def load(cls, path: str) -> 'PreviousState':
+        """Load the manifest written by a previous invocation.
+
+        :param path: The path to the previous manifest.json
+        """
+        if not os.path.exists(path):
+            raise RuntimeException(
+                'Could not find a manifest to compare against at {}'
+                .format(path)
+            )
+        # a node in a written manifest matches both its parsed and compiled
+        # schemas, so the manifest as a whole never validates. Each node is
+        # still validated against the node types as it's decoded.
+        try:
+            manifest = Manifest.from_dict(
+                json.loads(load_file_contents(path)), validate=False
+            )
+        except (ValueError, ValidationError) as exc:
+            raise RuntimeException(
+                'Could not read the manifest at {}: {}'.format(path, exc)
+            ) from exc
+        return cls(manifest)
+
+    def new_nodes(self, manifest: Manifest) -> Set[str]:
+        """Get the unique IDs of the nodes in the given manifest that did not
+        exist in the previous one.
+        """
+        return {
+            unique_id for unique_id in manifest.nodes
+            if unique_id not in self.manifest.nodes
+        }
+
+    def modified_nodes(self, manifest: Manifest) -> Set[str]:
+        """Get the unique IDs of the nodes in the given manifest that are new
+        or differ from their previous version.
+        """
+        current = ManifestChecksums(manifest)
+        return {
+            unique_id for unique_id in manifest.nodes
+            if current.get(unique_id) != self.checksums.get(unique_id)
+        }
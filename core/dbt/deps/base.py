@@ -2,13 +2,18 @@ import abc
 import os
 import tempfile
 from contextlib import contextmanager
-from typing import List, Optional, Generic, TypeVar
+from multiprocessing.dummy import Pool as ThreadPool
+from typing import (
+    List, Optional, Generic, TypeVar, Callable, Iterable, Tuple
+)
 
 from dbt.clients import system
 from dbt.contracts.project import ProjectPackageMetadata
 from dbt.logger import GLOBAL_LOGGER as logger
 
 DOWNLOADS_PATH = None
+# the most packages to fetch or install at once
+MAX_CONCURRENT_DOWNLOADS = 8
 
 
 def get_downloads_path():
@@ -40,6 +45,40 @@ def downloads_directory():
         DOWNLOADS_PATH = None
 
 
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def map_concurrently(func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """Call func on each of the items on a thread pool, and return the
+    results in the same order as the items. If any call raises, the first
+    exception (in item order) is raised once all calls are complete.
+    """
+    items = list(items)
+    if len(items) < 2:
+        return [func(item) for item in items]
+
+    def call(item: T) -> Tuple[Optional[Exception], Optional[R]]:
+        # Pool.map raises whichever exception happens first, without
+        # waiting for the other calls, so collect them instead
+        try:
+            return None, func(item)
+        except Exception as exc:
+            return exc, None
+
+    pool = ThreadPool(min(len(items), MAX_CONCURRENT_DOWNLOADS))
+    try:
+        outcomes = pool.map(call, items)
+    finally:
+        pool.close()
+        pool.join()
+
+    for exc, _ in outcomes:
+        if exc is not None:
+            raise exc
+    return [result for _, result in outcomes]
+
+
 class BasePackage(metaclass=abc.ABCMeta):
     @abc.abstractproperty
     def name(self) -> str:
@@ -80,6 +119,12 @@ class PinnedPackage(BasePackage):
     def nice_version_name(self):
         raise NotImplementedError
 
+    def get_locked_version(self) -> Optional[str]:
+        """The exact version this package was installed at, to record in the
+        lock file. By default, the pinned version.
+        """
+        return self.get_version()
+
     def fetch_metadata(self, project):
         if not self._cached_metadata:
             self._cached_metadata = self._fetch_metadata(project)
@@ -0,0 +1,163 @@
+"""A package cache shared by every project on the machine.
+
+Each entry is a directory holding the contents of one package at one exact
+version, keyed by what it was installed from: a registry package and version,
+or a git URL and commit SHA. Entries are never modified once they exist, so
+installing a package is a copy out of the cache. The files are copied rather
+than linked, so editing a package in dbt_modules can't change the cache.
+
+The lock file in dbt_modules records a hash of the packages that were
+requested, so that an unchanged request can be skipped without resolving it.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from dbt.clients import system
+from dbt.contracts.project import LocalPackage
+from dbt.logger import GLOBAL_LOGGER as logger
+
+DEFAULT_PACKAGE_CACHE_DIR = os.path.join(
+    os.path.expanduser('~'), '.dbt', 'package-cache'
+)
+LOCK_FILE_NAME = '.dbt_packages.lock'
+
+
+def get_package_cache_path() -> str:
+    return os.getenv('DBT_PACKAGE_CACHE_DIR') or DEFAULT_PACKAGE_CACHE_DIR
+
+
+def _safe_name(value: str) -> str:
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in value)
+
+
+def cached_path(source_type: str, name: str, version: str) -> str:
+    """Get the path of the cache entry for the given package. The name is
+    hashed so that URLs can be used as names.
+    """
+    digest = hashlib.md5(name.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(
+        get_package_cache_path(),
+        source_type,
+        '{}-{}'.format(_safe_name(name)[-40:], digest),
+        _safe_name(version),
+    )
+
+
+def store(src_path: str, path: str) -> str:
+    """Move the directory at src_path into the cache at path, unless another
+    process got there first. The entry appears atomically, so a partially
+    written entry is never used.
+
+    :returns str: The path to the cache entry.
+    """
+    if os.path.isdir(path):
+        system.rmtree(src_path)
+        return path
+    parent = os.path.dirname(path)
+    system.make_directory(parent)
+    staging = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+    staged = os.path.join(staging, 'package')
+    system.move(src_path, staged)
+    try:
+        os.rename(staged, path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+        # someone else stored the same package in the meantime
+    finally:
+        system.rmtree(staging)
+    logger.debug('  Stored package in cache at {}', path)
+    return path
+
+
+def install(path: str, dest_path: str) -> None:
+    """Install the package in the cache entry at path to dest_path, replacing
+    anything that is already there.
+    """
+    if os.path.lexists(dest_path):
+        if system.path_is_symlink(dest_path):
+            system.remove_file(dest_path)
+        else:
+            system.rmdir(dest_path)
+    shutil.copytree(path, dest_path, symlinks=True)
+
+
+def _lock_path(modules_path: str) -> str:
+    return os.path.join(modules_path, LOCK_FILE_NAME)
+
+
+def request_hash(packages, project) -> str:
+    """Hash the packages requested in packages.yml. A local package's own
+    packages.yml is included too, as it also decides what gets resolved.
+    """
+    request: List[Dict[str, Any]] = []
+    for package in packages:
+        entry: Dict[str, Any] = {'package': package.to_dict()}
+        if isinstance(package, LocalPackage):
+            path = os.path.join(
+                system.resolve_path_from_base(
+                    package.local, project.project_root
+                ),
+                'packages.yml'
+            )
+            if system.path_exists(path):
+                entry['packages'] = system.load_file_contents(path)
+        request.append(entry)
+    return hashlib.md5(
+        json.dumps(request, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+
+def lock_contents(packages, project, request: str) -> dict:
+    """Build the lock file contents for the given pinned packages, resolved
+    from the request with the given hash.
+    """
+    pins = [
+        {
+            'name': package.name,
+            'source': package.source_type(),
+            'version': package.get_locked_version(),
+            'installed': package.get_installation_path(project),
+        }
+        for package in packages
+    ]
+    return {'request': request, 'packages': pins}
+
+
+def read_lock(modules_path: str) -> Optional[dict]:
+    path = _lock_path(modules_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as fp:
+            return json.load(fp)
+    except ValueError:
+        return None
+
+
+def remove_lock(modules_path: str) -> None:
+    path = _lock_path(modules_path)
+    if os.path.exists(path):
+        system.remove_file(path)
+
+
+def write_lock(modules_path: str, lock: dict) -> None:
+    system.write_file(_lock_path(modules_path), json.dumps(lock, indent=2))
+
+
+def locked_packages(modules_path: str, request: str) -> Optional[List[dict]]:
+    """If the packages in modules_path were installed for the request with
+    the given hash, and are all still there, return their pins from the lock.
+    Otherwise, return None.
+    """
+    existing = read_lock(modules_path)
+    if existing is None or existing.get('request') != request:
+        return None
+    pins: List[dict] = existing.get('packages', [])
+    if not all(os.path.exists(p['installed']) for p in pins):
+        return None
+    return pins
@@ -1,16 +1,17 @@
 import os
 import hashlib
-from typing import List
+from typing import List, Optional
 
 from dbt.clients import git, system
 from dbt.config import Project
+from dbt.deps import cache as package_cache
 from dbt.contracts.project import (
     ProjectPackageMetadata,
     GitPackage,
 )
 from dbt.deps.base import PinnedPackage, UnpinnedPackage, get_downloads_path
 from dbt.exceptions import (
-    ExecutableError, warn_or_error, raise_dependency_error
+    CommandResultError, ExecutableError, warn_or_error, raise_dependency_error
 )
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.ui import printer
@@ -43,14 +44,18 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
         self.revision = revision
         self.warn_unpinned = warn_unpinned
         self._checkout_name = md5sum(self.git)
+        self._sha: Optional[str] = None
 
     def get_version(self):
         return self.revision
 
+    def get_locked_version(self):
+        return self._sha or self.revision
+
     def nice_version_name(self):
         return 'revision {}'.format(self.revision)
 
-    def _checkout(self):
+    def _clone(self):
         """Performs a shallow clone of the repository into the downloads
         directory. This function can be called repeatedly. If the project has
         already been checked out at this version, it will be a no-op. Returns
@@ -70,6 +75,32 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
             raise
         return os.path.join(get_downloads_path(), dir_)
 
+    def _resolve_sha(self):
+        try:
+            return git.ls_remote(get_downloads_path(), self.git, self.revision)
+        except (CommandResultError, ExecutableError) as exc:
+            logger.debug('Could not resolve {}@{} without cloning: {}',
+                         self.git, self.revision, exc)
+            return None
+
+    def _checkout(self):
+        """Get the package at this revision into the package cache, cloning
+        it if the commit it points to isn't cached yet. Returns the path to
+        the cache entry."""
+        if self._sha is None:
+            self._sha = self._resolve_sha()
+        if self._sha is not None:
+            path = package_cache.cached_path('git', self.git, self._sha)
+            if os.path.isdir(path):
+                return path
+
+        checkout = self._clone()
+        self._sha = git.get_current_sha(checkout).strip()
+        system.rmdir(os.path.join(checkout, '.git'))
+        return package_cache.store(
+            checkout, package_cache.cached_path('git', self.git, self._sha)
+        )
+
     def _fetch_metadata(self, project) -> ProjectPackageMetadata:
         path = self._checkout()
         if self.revision == 'master' and self.warn_unpinned:
@@ -84,13 +115,7 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
 
     def install(self, project):
         dest_path = self.get_installation_path(project)
-        if os.path.exists(dest_path):
-            if system.path_is_symlink(dest_path):
-                system.remove_file(dest_path)
-            else:
-                system.rmdir(dest_path)
-
-        system.move(self._checkout(), dest_path)
+        package_cache.install(self._checkout(), dest_path)
 
 
 class GitUnpinnedPackage(GitPackageMixin, UnpinnedPackage[GitPinnedPackage]):
@@ -1,8 +1,10 @@
 import os
+import tempfile
 from typing import List
 
 from dbt import semver
 from dbt.clients import registry, system
+from dbt.deps import cache as package_cache
 from dbt.contracts.project import (
     RegistryPackageMetadata,
     RegistryPackage,
@@ -51,9 +53,9 @@ class RegistryPinnedPackage(RegistryPackageMixin, PinnedPackage):
         dct = registry.package_version(self.package, self.version)
         return RegistryPackageMetadata.from_dict(dct)
 
-    def install(self, project):
-        metadata = self.fetch_metadata(project)
-
+    def _download(self, metadata):
+        """Download and unpack the package into the downloads directory.
+        Returns the path to the unpacked package."""
         tar_name = '{}.{}.tar.gz'.format(self.package, self.version)
         tar_path = os.path.realpath(
             os.path.join(get_downloads_path(), tar_name)
@@ -62,9 +64,16 @@ class RegistryPinnedPackage(RegistryPackageMixin, PinnedPackage):
 
         download_url = metadata.downloads.tarball
         system.download(download_url, tar_path)
-        deps_path = project.modules_path
-        package_name = self.get_project_name(project)
-        system.untar_package(tar_path, deps_path, package_name)
+        unpack_path = tempfile.mkdtemp(dir=os.path.dirname(tar_path))
+        system.untar_package(tar_path, unpack_path, 'package')
+        return os.path.join(unpack_path, 'package')
+
+    def install(self, project):
+        metadata = self.fetch_metadata(project)
+        path = package_cache.cached_path('hub', self.package, self.version)
+        if not os.path.isdir(path):
+            path = package_cache.store(self._download(metadata), path)
+        package_cache.install(path, self.get_installation_path(project))
 
 
 class RegistryUnpinnedPackage(
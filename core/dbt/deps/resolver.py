@@ -3,7 +3,9 @@ from typing import Dict, List, NoReturn, Union, Type, Iterator
 
 from dbt.exceptions import raise_dependency_error, InternalException
 
-from dbt.deps.base import BasePackage, PinnedPackage, UnpinnedPackage
+from dbt.deps.base import (
+    BasePackage, PinnedPackage, UnpinnedPackage, map_concurrently
+)
 from dbt.deps.local import LocalUnpinnedPackage
 from dbt.deps.git import GitUnpinnedPackage
 from dbt.deps.registry import RegistryUnpinnedPackage
@@ -114,12 +116,16 @@ def resolve_packages(
     pending = PackageListing.from_contracts(packages)
     final = PackageListing()
 
+    def fetch(package: UnpinnedPackage):
+        return final[package].resolved().fetch_metadata(config)
+
     while pending:
         next_pending = PackageListing()
-        # resolve the dependency in question
+        # incorporate the whole level first, then resolve the dependencies in
+        # question concurrently: fetching metadata means downloads and clones
         for package in pending:
             final.incorporate(package)
-            target = final[package].resolved().fetch_metadata(config)
+        for target in map_concurrently(fetch, list(pending)):
             next_pending.update_from(target.packages)
         pending = next_pending
 
@@ -1,10 +1,18 @@
 import os
 import multiprocessing
+
+DEFAULT_PROFILES_DIR = os.path.join(os.path.expanduser('~'), '.dbt')
+PROFILES_DIR = os.path.expanduser(
+    os.getenv('DBT_PROFILES_DIR', DEFAULT_PROFILES_DIR)
+)
+
 # initially all flags are set to None, the on-load call of reset() will set
 # them for their first time.
 STRICT_MODE = None
 FULL_REFRESH = None
 USE_CACHE = None
+PERSIST_CACHE = None
+COMPILE_CACHE = None
 WARN_ERROR = None
 TEST_NEW_PARSER = None
 WRITE_JSON = None
@@ -25,12 +33,15 @@ MP_CONTEXT = _get_context()
 
 
 def reset():
-    global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT
+    global STRICT_MODE, FULL_REFRESH, USE_CACHE, PERSIST_CACHE, \
+        COMPILE_CACHE, WARN_ERROR, TEST_NEW_PARSER, WRITE_JSON, \
+        PARTIAL_PARSE, MP_CONTEXT
 
     STRICT_MODE = False
     FULL_REFRESH = False
     USE_CACHE = True
+    PERSIST_CACHE = False
+    COMPILE_CACHE = False
     WARN_ERROR = False
     TEST_NEW_PARSER = False
     WRITE_JSON = True
@@ -39,10 +50,13 @@ def reset():
 
 
 def set_from_args(args):
-    global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT
+    global STRICT_MODE, FULL_REFRESH, USE_CACHE, PERSIST_CACHE, \
+        COMPILE_CACHE, WARN_ERROR, TEST_NEW_PARSER, WRITE_JSON, \
+        PARTIAL_PARSE, MP_CONTEXT
 
     USE_CACHE = getattr(args, 'use_cache', USE_CACHE)
+    PERSIST_CACHE = getattr(args, 'persist_cache', PERSIST_CACHE)
+    COMPILE_CACHE = getattr(args, 'compile_cache', COMPILE_CACHE)
 
     FULL_REFRESH = getattr(args, 'full_refresh', FULL_REFRESH)
     STRICT_MODE = getattr(args, 'strict', STRICT_MODE)
@@ -51,6 +51,7 @@ class SELECTOR_FILTERS(str, Enum):
     FQN = 'fqn'
     TAG = 'tag'
     SOURCE = 'source'
+    STATE = 'state'
 
     def __str__(self):
         return self._value_
@@ -131,8 +132,9 @@ def warn_if_useless_spec(spec, nodes):
 
 
 class ManifestSelector:
-    def __init__(self, manifest):
+    def __init__(self, manifest, previous_state=None):
         self.manifest = manifest
+        self.previous_state = previous_state
 
     def _node_iterator(self, included_nodes, exclude, include):
         for unique_id, node in self.manifest.nodes.items():
@@ -216,6 +218,37 @@ class SourceSelector(ManifestSelector):
                 yield node
 
 
+class StateSelector(ManifestSelector):
+    FILTER = SELECTOR_FILTERS.STATE
+
+    def search(self, included_nodes, selector):
+        """yields nodes that are new or modified since the manifest given
+        with --state.
+        """
+        if self.previous_state is None:
+            raise dbt.exceptions.RuntimeException(
+                'Got a state selector "{}", but no previous state to compare '
+                'against. Pass the path to a previous manifest.json with '
+                '--state'.format(selector)
+            )
+
+        if selector == 'new':
+            matched = self.previous_state.new_nodes(self.manifest)
+        elif selector == 'modified':
+            matched = self.previous_state.modified_nodes(self.manifest)
+        else:
+            raise dbt.exceptions.RuntimeException(
+                'Invalid state selector value "{}". Must be one of "new" or '
+                '"modified"'.format(selector)
+            )
+
+        for node, real_node in self._node_iterator(included_nodes,
+                                                   exclude=None,
+                                                   include=None):
+            if node in matched:
+                yield node
+
+
 class InvalidSelectorError(Exception):
     pass
 
@@ -225,15 +258,18 @@ class MultiSelector:
     selector types, including the glob operator, but does not handle any graph
     related behavior.
     """
-    SELECTORS = [QualifiedNameSelector, TagSelector, SourceSelector]
+    SELECTORS = [
+        QualifiedNameSelector, TagSelector, SourceSelector, StateSelector,
+    ]
 
-    def __init__(self, manifest):
+    def __init__(self, manifest, previous_state=None):
         self.manifest = manifest
+        self.previous_state = previous_state
 
     def get_selector(self, selector_type):
         for cls in self.SELECTORS:
             if cls.FILTER == selector_type:
-                return cls(self.manifest)
+                return cls(self.manifest, self.previous_state)
 
         raise InvalidSelectorError(selector_type)
 
@@ -293,9 +329,9 @@ class Graph:
 
 
 class NodeSelector(MultiSelector):
-    def __init__(self, graph, manifest):
+    def __init__(self, graph, manifest, previous_state=None):
         self.full_graph = Graph(graph)
-        super().__init__(manifest)
+        super().__init__(manifest, previous_state)
 
     def get_nodes_from_spec(self, graph, spec):
         try:
@@ -87,11 +87,11 @@
 {% endmacro %}
 
 
-{% macro get_catalog(information_schemas) -%}
-  {{ return(adapter_macro('get_catalog', information_schemas)) }}
+{% macro get_catalog(information_schema, schemas) -%}
+  {{ return(adapter_macro('get_catalog', information_schema, schemas)) }}
 {%- endmacro %}
 
-{% macro default__get_catalog(information_schemas) -%}
+{% macro default__get_catalog(information_schema, schemas) -%}
 
   {% set typename = adapter.type() %}
   {% set msg -%}
@@ -102,6 +102,31 @@
 {% endmacro %}
 
 
+{% macro get_catalog_relations(information_schema, relations) -%}
+  {{ return(adapter_macro('get_catalog_relations', information_schema, relations)) }}
+{%- endmacro %}
+
+{% macro default__get_catalog_relations(information_schema, relations) -%}
+
+  {% set typename = adapter.type() %}
+  {% set msg -%}
+    get_catalog_relations not implemented for {{ typename }}
+  {%- endset %}
+
+  {{ exceptions.raise_compiler_error(msg) }}
+{% endmacro %}
+
+
+{% macro get_catalog_fingerprints(information_schema, schemas) -%}
+  {{ return(adapter_macro('get_catalog_fingerprints', information_schema, schemas)) }}
+{%- endmacro %}
+
+{% macro default__get_catalog_fingerprints(information_schema, schemas) -%}
+  {#-- adapters that can't fingerprint relations always rebuild the whole catalog --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
 {% macro get_columns_in_relation(relation) -%}
   {{ return(adapter_macro('get_columns_in_relation', relation)) }}
 {% endmacro %}
@@ -229,6 +254,17 @@
 {% endmacro %}
 
 
+{% macro get_schema_fingerprint(information_schema, schema) %}
+  {{ return(adapter_macro('get_schema_fingerprint', information_schema, schema)) }}
+{% endmacro %}
+
+
+{% macro default__get_schema_fingerprint(information_schema, schema) %}
+  {#-- adapters that can't cheaply fingerprint a schema always re-list it --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
 {% macro current_timestamp() -%}
   {{ adapter_macro('current_timestamp') }}
 {%- endmacro %}
@@ -258,6 +294,28 @@
   {{ return(load_result('collect_freshness').table) }}
 {% endmacro %}
 
+{% macro collect_freshness_batch(sources) %}
+  {{ return(adapter_macro('collect_freshness_batch', sources))}}
+{% endmacro %}
+
+{% macro default__collect_freshness_batch(sources) %}
+  {#-- one scalar subquery per source, so each keeps its own column type --#}
+  {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+    select
+    {% for item in sources %}
+      (
+        select max({{ item.loaded_at_field }})
+        from {{ item.source }}
+        {% if item.filter %}
+        where {{ item.filter }}
+        {% endif %}
+      ) as max_loaded_at_{{ loop.index0 }},
+    {% endfor %}
+      {{ current_timestamp() }} as snapshotted_at
+  {% endcall %}
+  {{ return(load_result('collect_freshness_batch').table) }}
+{% endmacro %}
+
 {% macro make_temp_relation(base_relation, suffix='__dbt_tmp') %}
   {{ return(adapter_macro('make_temp_relation', base_relation, suffix))}}
 {% endmacro %}
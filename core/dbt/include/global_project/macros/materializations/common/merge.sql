@@ -1,15 +1,43 @@
 
 
-{% macro get_merge_sql(target, source, unique_key, dest_columns) -%}
-  {{ adapter_macro('get_merge_sql', target, source, unique_key, dest_columns) }}
+{% macro get_merge_sql(target, source, unique_key, dest_columns, predicates=none) -%}
+  {#-- only pass predicates when they are set, so adapter implementations without the argument keep working --#}
+  {% if predicates %}
+    {{ adapter_macro('get_merge_sql', target, source, unique_key, dest_columns, predicates=predicates) }}
+  {% else %}
+    {{ adapter_macro('get_merge_sql', target, source, unique_key, dest_columns) }}
+  {% endif %}
 {%- endmacro %}
 
-{% macro get_delete_insert_merge_sql(target, source, unique_key, dest_columns) -%}
-  {{ adapter_macro('get_delete_insert_merge_sql', target, source, unique_key, dest_columns) }}
+{% macro get_delete_insert_merge_sql(target, source, unique_key, dest_columns, predicates=none) -%}
+  {% if predicates %}
+    {{ adapter_macro('get_delete_insert_merge_sql', target, source, unique_key, dest_columns, predicates=predicates) }}
+  {% else %}
+    {{ adapter_macro('get_delete_insert_merge_sql', target, source, unique_key, dest_columns) }}
+  {% endif %}
+{%- endmacro %}
+
+{% macro get_insert_overwrite_merge_sql(target, source, partition_by, dest_columns, predicates=none) -%}
+  {% if predicates %}
+    {{ adapter_macro('get_insert_overwrite_merge_sql', target, source, partition_by, dest_columns, predicates=predicates) }}
+  {% else %}
+    {{ adapter_macro('get_insert_overwrite_merge_sql', target, source, partition_by, dest_columns) }}
+  {% endif %}
+{%- endmacro %}
+
+
+{% macro incremental_predicates_sql(predicates) -%}
+  {#-- Render extra conditions on the target rows, to bound the scan of the target --#}
+  {%- if predicates is string -%}
+    {%- set predicates = [predicates] -%}
+  {%- endif -%}
+  {%- for predicate in (predicates or []) %}
+        and {{ predicate }}
+  {%- endfor -%}
 {%- endmacro %}
 
 
-{% macro common_get_merge_sql(target, source, unique_key, dest_columns) -%}
+{% macro common_get_merge_sql(target, source, unique_key, dest_columns, predicates=none) -%}
     {%- set dest_cols_csv = dest_columns | map(attribute="name") | join(', ') -%}
 
     merge into {{ target }} as DBT_INTERNAL_DEST
@@ -17,6 +45,7 @@
 
     {% if unique_key %}
         on DBT_INTERNAL_SOURCE.{{ unique_key }} = DBT_INTERNAL_DEST.{{ unique_key }}
+        {{- incremental_predicates_sql(predicates) }}
     {% else %}
         on FALSE
     {% endif %}
@@ -36,7 +65,7 @@
 
 {%- endmacro %}
 
-{% macro default__get_merge_sql(target, source, unique_key, dest_columns) -%}
+{% macro default__get_merge_sql(target, source, unique_key, dest_columns, predicates=none) -%}
     {% set typename = adapter.type() %}
 
     {{ exceptions.raise_compiler_error(
@@ -47,7 +76,7 @@
 {% endmacro %}
 
 
-{% macro common_get_delete_insert_merge_sql(target, source, unique_key, dest_columns) -%}
+{% macro common_get_delete_insert_merge_sql(target, source, unique_key, dest_columns, predicates=none) -%}
     {%- set dest_cols_csv = dest_columns | map(attribute="name") | join(', ') -%}
 
     {% if unique_key is not none %}
@@ -55,7 +84,8 @@
     where ({{ unique_key }}) in (
         select ({{ unique_key }})
         from {{ source }}
-    );
+    )
+    {{- incremental_predicates_sql(predicates) }};
     {% endif %}
 
     insert into {{ target }} ({{ dest_cols_csv }})
@@ -66,6 +96,86 @@
 
 {%- endmacro %}
 
-{% macro default__get_delete_insert_merge_sql(target, source, unique_key, dest_columns) -%}
-    {{ common_get_delete_insert_merge_sql(target, source, unique_key, dest_columns) }}
+{% macro default__get_delete_insert_merge_sql(target, source, unique_key, dest_columns, predicates=none) -%}
+    {{ common_get_delete_insert_merge_sql(target, source, unique_key, dest_columns, predicates) }}
+{% endmacro %}
+
+
+{% macro common_get_insert_overwrite_merge_sql(target, source, partition_by, dest_columns, predicates=none) -%}
+    {#--
+      Replace every partition that appears in the source, and leave the rest
+      of the target alone. Partitions are matched with `in`, so the target can
+      be pruned by partition. Rows with a null partition value form a
+      partition of their own, which is only matched when the source has one.
+
+      In the null-safe fallback for several partition_by expressions, the
+      source's partition values are renamed, so inside the subquery the
+      partition_by expressions can only refer to the target's columns.
+    --#}
+    {%- set dest_cols_csv = dest_columns | map(attribute="name") | join(', ') -%}
+    {%- if partition_by is string -%}
+        {%- set partition_by = [partition_by] -%}
+    {%- endif -%}
+    {%- set partition_csv = partition_by | join(', ') -%}
+
+    {%- set null_partition_sql -%}
+        select 1 from {{ source }}
+        where {% for expression in partition_by -%}
+            {{ expression }} is null{% if not loop.last %} or {% endif %}
+        {%- endfor %}
+        limit 1
+    {%- endset -%}
+    {%- set has_null_partition = execute and (run_query(null_partition_sql).rows | length) > 0 -%}
+
+    delete from {{ target }}
+    where (
+        ({{ partition_csv }}) in (
+            select distinct {{ partition_csv }}
+            from {{ source }}
+            where
+            {%- for expression in partition_by %}
+                {{ expression }} is not null
+                {%- if not loop.last %} and{% endif %}
+            {%- endfor %}
+        )
+        {%- if has_null_partition and partition_by | length == 1 %}
+        or {{ partition_by[0] }} is null
+        {%- elif has_null_partition %}
+        or (
+            ({% for expression in partition_by -%}
+                {{ expression }} is null{% if not loop.last %} or {% endif %}
+            {%- endfor %})
+            and exists (
+                select 1
+                from (
+                    select distinct
+                    {%- for expression in partition_by %}
+                        {{ expression }} as dbt_internal_partition_{{ loop.index }}
+                        {%- if not loop.last %},{% endif %}
+                    {%- endfor %}
+                    from {{ source }}
+                ) as DBT_INTERNAL_SOURCE
+                where
+                {%- for expression in partition_by %}
+                    {%- set source_value = 'DBT_INTERNAL_SOURCE.dbt_internal_partition_' ~ loop.index %}
+                    ({{ source_value }} = {{ expression }}
+                     or ({{ source_value }} is null and {{ expression }} is null))
+                    {%- if not loop.last %} and {% endif %}
+                {%- endfor %}
+            )
+        )
+        {%- endif %}
+    )
+    {{- incremental_predicates_sql(predicates) }};
+
+    insert into {{ target }} ({{ dest_cols_csv }})
+    (
+        select {{ dest_cols_csv }}
+        from {{ source }}
+    );
+
+{%- endmacro %}
+
+{% macro default__get_insert_overwrite_merge_sql(target, source, partition_by, dest_columns, predicates=none) -%}
+    {{ common_get_insert_overwrite_merge_sql(target, source, partition_by, dest_columns, predicates) }}
 {% endmacro %}
@@ -1,5 +1,5 @@
 
-{% macro incremental_upsert(tmp_relation, target_relation, unique_key=none, statement_name="main") %}
+{% macro incremental_upsert(tmp_relation, target_relation, unique_key=none, statement_name="main", predicates=none) %}
     {%- set dest_columns = adapter.get_columns_in_relation(target_relation) -%}
     {%- set dest_cols_csv = dest_columns | map(attribute='quoted') | join(', ') -%}
 
@@ -9,7 +9,8 @@
     where ({{ unique_key }}) in (
         select ({{ unique_key }})
         from {{ tmp_relation }}
-    );
+    )
+    {{- incremental_predicates_sql(predicates) }};
     {%- endif %}
 
     insert into {{ target_relation }} ({{ dest_cols_csv }})
@@ -18,3 +19,29 @@
        from {{ tmp_relation }}
     );
 {%- endmacro %}
+
+
+{% macro incremental_validate_partition_by(strategy, partition_by) %}
+  {% if strategy == 'insert_overwrite' and not partition_by %}
+    {% do exceptions.raise_compiler_error(
+        "The 'insert_overwrite' incremental strategy requires a `partition_by` config"
+    ) %}
+  {% endif %}
+{% endmacro %}
+
+
+{% macro dbt_default_validate_get_incremental_strategy(config) %}
+  {#-- Find and validate the incremental strategy #}
+  {%- set strategy = config.get("incremental_strategy", default="delete+insert") -%}
+
+  {% set invalid_strategy_msg -%}
+    Invalid incremental strategy provided: {{ strategy }}
+    Expected one of: 'delete+insert', 'insert_overwrite'
+  {%- endset %}
+  {% if strategy not in ['delete+insert', 'insert_overwrite'] %}
+    {% do exceptions.raise_compiler_error(invalid_strategy_msg) %}
+  {% endif %}
+
+  {% do incremental_validate_partition_by(strategy, config.get('partition_by')) %}
+  {% do return(strategy) %}
+{% endmacro %}
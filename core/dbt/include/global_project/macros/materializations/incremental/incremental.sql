@@ -2,6 +2,8 @@
 {% materialization incremental, default -%}
 
   {% set unique_key = config.get('unique_key') %}
+  {% set partition_by = config.get('partition_by') %}
+  {% set predicates = config.get('incremental_predicates') %}
   {% set full_refresh_mode = flags.FULL_REFRESH %}
 
   {% set target_relation = this %}
@@ -12,6 +14,9 @@
   {% set backup_type = existing_relation.type | default("table") %}
   {% set backup_relation = make_temp_relation(this, "__dbt_backup").incorporate(type=backup_type) %}
 
+  {#-- Validate early so we don't run SQL if the strategy is invalid --#}
+  {% set strategy = dbt_default_validate_get_incremental_strategy(config) -%}
+
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
 
   -- `BEGIN` happens here:
@@ -30,7 +35,12 @@
       {% do adapter.expand_target_column_types(
              from_relation=tmp_relation,
              to_relation=target_relation) %}
-      {% set build_sql = incremental_upsert(tmp_relation, target_relation, unique_key=unique_key) %}
+      {% if strategy == 'insert_overwrite' %}
+          {% set dest_columns = adapter.get_columns_in_relation(target_relation) %}
+          {% set build_sql = get_insert_overwrite_merge_sql(target_relation, tmp_relation, partition_by, dest_columns, predicates) %}
+      {% else %}
+          {% set build_sql = incremental_upsert(tmp_relation, target_relation, unique_key=unique_key, predicates=predicates) %}
+      {% endif %}
   {% endif %}
 
   {% call statement("main") %}
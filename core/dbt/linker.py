@@ -1,7 +1,8 @@
-from queue import PriorityQueue
-from typing import Iterable, Set, Optional
+from queue import PriorityQueue, Empty
+from typing import Iterable, Set, Optional, Dict, List
 import networkx as nx  # type: ignore
 import threading
+import time
 
 
 from dbt.contracts.graph.manifest import Manifest
@@ -31,10 +32,25 @@ class GraphQueue:
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
+
+    Nodes configured with a `concurrency_group` that appears in
+    concurrency_limits are only handed out while fewer than that many nodes
+    of the same group are in progress.
     """
-    def __init__(self, graph, manifest):
+    def __init__(self, graph, manifest, execution_times=None,
+                 concurrency_limits=None):
         self.graph = graph
         self.manifest = manifest
+        # the recorded execution time of nodes, by unique ID
+        self.execution_times = execution_times or {}
+        # the maximum number of in-progress nodes, by concurrency group
+        self.concurrency_limits = concurrency_limits or {}
+        # the limited concurrency group of each node, by unique ID
+        self._groups = self._calculate_groups()
+        # the number of in-progress nodes, by concurrency group
+        self._group_running: Dict[str, int] = {}
+        # nodes taken off the queue while their group was full, by group
+        self._group_waiting: Dict[str, List[str]] = {}
         # store the queue as a priority queue.
         self.inner = PriorityQueue()
         # things that have been popped off the queue but not finished
@@ -57,11 +73,32 @@ class GraphQueue:
             return False
         return True
 
+    def _calculate_groups(self):
+        """Find the concurrency group of each node in the graph that has a
+        limit. Nodes without a group, or whose group has no limit, are not
+        included.
+
+        :return Dict[str, str]: The concurrency group of each limited node.
+        """
+        groups = {}
+        for node_id in self.graph.nodes():
+            config = getattr(self.manifest.expect(node_id), 'config', None)
+            if config is None:
+                continue
+            group = config.get('concurrency_group')
+            if group in self.concurrency_limits:
+                groups[node_id] = group
+        return groups
+
     def _calculate_scores(self):
         """Calculate the 'value' of each node in the graph based on how many
         blocking descendants it has. We use this score for the internal
         priority queue's ordering, so the quality of this metric is important.
 
+        If execution times were recorded, nodes are ordered by their upward
+        rank first (see `_calculate_ranks`), and the descendant count only
+        breaks ties.
+
         The score is stored as a negative number because the internal
         PriorityQueue picks lowest values first.
 
@@ -71,8 +108,9 @@ class GraphQueue:
         This operates on the graph, so it would require a lock if called from
         outside __init__.
 
-        :return Dict[str, int]: The score dict, mapping unique IDs to integer
-            scores. Lower scores are higher priority.
+        :return Dict[str, Any]: The score dict, mapping unique IDs to integer
+            scores, or to (rank, score) tuples. Lower scores are higher
+            priority.
         """
         scores = {}
         for node in self.graph.nodes():
@@ -81,7 +119,47 @@ class GraphQueue:
                 if self._include_in_cost(d)
             ])
             scores[node] = score
-        return scores
+
+        if not self.execution_times:
+            return scores
+        ranks = self._calculate_ranks()
+        return {
+            node: (-ranks[node], score) for node, score in scores.items()
+        }
+
+    def _calculate_ranks(self):
+        """Calculate the upward rank of each node in the graph: the total
+        execution time of the longest chain of nodes from it to the end of
+        the run, itself included. Running the nodes with the highest rank
+        first keeps the critical path moving.
+
+        Nodes with no recorded execution time are assumed to take the
+        average recorded time. Ephemeral models take no time.
+
+        This operates on the graph, so it would require a lock if called from
+        outside __init__.
+
+        :return Dict[str, float]: The rank of each node, in seconds.
+        """
+        known = [
+            self.execution_times[node] for node in self.graph.nodes()
+            if node in self.execution_times
+        ]
+        default = sum(known) / len(known) if known else 0.0
+
+        ranks: Dict[str, float] = {}
+        for node in reversed(list(nx.topological_sort(self.graph))):
+            if node in self.execution_times:
+                cost = self.execution_times[node]
+            elif is_ephemeral_dependency(self.manifest.expect(node)):
+                cost = 0.0
+            else:
+                cost = default
+            ranks[node] = cost + max(
+                (ranks[child] for child in self.graph.successors(node)),
+                default=0.0
+            )
+        return ranks
 
     def get(self, block=True, timeout=None):
         """Get a node off the inner priority queue. By default, this blocks.
@@ -95,11 +173,28 @@ class GraphQueue:
 
         See `queue.PriorityQueue` for more information on `get()` behavior and
         exceptions.
+
+        Nodes whose concurrency group is full are set aside until a node of
+        that group is marked done, and the next node is tried instead.
         """
-        _, node_id = self.inner.get(block=block, timeout=timeout)
-        with self.lock:
-            self._mark_in_progress(node_id)
-        return self.manifest.expect(node_id)
+        deadline = None
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        while True:
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise Empty
+            _, node_id = self.inner.get(block=block, timeout=timeout)
+            with self.lock:
+                if self._has_capacity(node_id):
+                    self._mark_in_progress(node_id)
+                    return self.manifest.expect(node_id)
+                group = self._groups[node_id]
+                self._group_waiting.setdefault(group, []).append(node_id)
+                # it'll be put back on the inner queue later
+                self.inner.task_done()
 
     def __len__(self):
         """The length of the queue is the number of tasks left for the queue to
@@ -119,6 +214,21 @@ class GraphQueue:
         """
         return len(self) == 0
 
+    def _has_capacity(self, node_id):
+        """Decide if the node's concurrency group has room for another node
+        in progress.
+
+        Callers must hold the lock.
+
+        :param str node_id: The node ID to check
+        :returns bool: If the node can be marked as in progress.
+        """
+        group = self._groups.get(node_id)
+        if group is None:
+            return True
+        running = self._group_running.get(group, 0)
+        return running < self.concurrency_limits[group]
+
     def _already_known(self, node):
         """Decide if a node is already known (either handed out as a task, or
         in the queue).
@@ -141,6 +251,22 @@ class GraphQueue:
                 self.inner.put((self._scores[node], node))
                 self.queued.add(node)
 
+    def _add_ready_successors(self, successors):
+        """Add any of the given nodes that no longer have dependencies to the
+        internal queue. Only the successors of a completed node can become
+        ready, so this avoids rescanning the whole graph.
+
+        Callers must hold the lock.
+
+        :param Iterable[str] successors: The successors of a node that was
+            just removed from the graph.
+        """
+        for node in successors:
+            if not self._already_known(node) and \
+                    self.graph.in_degree(node) == 0:
+                self.inner.put((self._scores[node], node))
+                self.queued.add(node)
+
     def mark_done(self, node_id):
         """Given a node's unique ID, mark it as done.
 
@@ -150,8 +276,14 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
+            successors = list(self.graph.successors(node_id))
             self.graph.remove_node(node_id)
-            self._find_new_additions()
+            group = self._groups.get(node_id)
+            if group is not None:
+                self._group_running[group] -= 1
+                for waiting in self._group_waiting.pop(group, []):
+                    self.inner.put((self._scores[waiting], waiting))
+            self._add_ready_successors(successors)
             self.inner.task_done()
 
     def _mark_in_progress(self, node_id):
@@ -163,6 +295,9 @@ class GraphQueue:
         """
         self.queued.remove(node_id)
         self.in_progress.add(node_id)
+        group = self._groups.get(node_id)
+        if group is not None:
+            self._group_running[group] = self._group_running.get(group, 0) + 1
 
     def join(self):
         """Join the queue. Blocks until all tasks are marked as done.
@@ -220,10 +355,17 @@ class Linker:
         return new_graph
 
     def as_graph_queue(
-        self, manifest: Manifest, limit_to: Optional[Iterable[str]] = None
+        self,
+        manifest: Manifest,
+        limit_to: Optional[Iterable[str]] = None,
+        execution_times: Optional[Dict[str, float]] = None,
+        concurrency_limits: Optional[Dict[str, int]] = None,
     ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. If execution_times are given, the queue prioritizes the
+        nodes on the longest remaining path of execution time. If
+        concurrency_limits are given, the queue never hands out more nodes of
+        a concurrency group at once than its limit.
         """
         if limit_to is None:
             graph_nodes = self.graph.nodes()
@@ -231,7 +373,9 @@ class Linker:
             graph_nodes = limit_to
 
         new_graph = self.build_subset_graph(graph_nodes)
-        return GraphQueue(new_graph, manifest)
+        return GraphQueue(
+            new_graph, manifest, execution_times, concurrency_limits
+        )
 
     def sorted_ephemeral_ancestors(
         self, manifest: Manifest, unique_id: str
@@ -1,10 +1,15 @@
 import dbt.flags
 import dbt.ui.colors
 
+import atexit
 import json
 import logging
 import os
+import queue
+import re
 import sys
+import threading
+import traceback
 import warnings
 from dataclasses import dataclass
 from datetime import datetime
@@ -44,6 +49,12 @@ DEBUG_LOG_FORMAT = (
 )
 
 
+# matches any of the color escape sequences dbt uses, to strip from files
+COLOR_ESCAPES = re.compile('|'.join(
+    re.escape(c) for c in dbt.ui.colors.COLORS.values()
+))
+
+
 ExceptionInformation = str
 Extras = Dict[str, Any]
 
@@ -335,6 +346,14 @@ _redirect_std_logging()
 
 
 class DelayedFileHandler(logbook.RotatingFileHandler, FormatterMixin):
+    """A file handler that buffers records until its path is set, and then
+    writes them from a single background thread. Records are formatted on the
+    thread that logged them, and the writer thread writes whatever has queued
+    up since its last write in one go.
+    """
+    # the most formatted records to write at once
+    _write_batch_size = 1000
+
     def __init__(
         self,
         log_dir: Optional[str] = None,
@@ -349,6 +368,11 @@ class DelayedFileHandler(logbook.RotatingFileHandler, FormatterMixin):
         # if we get 1k messages without a logfile being set, something is wrong
         self._bufmax = 1000
         self._log_path = None
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+        self._writer_lock = threading.Lock()
+        self._registered_exit = False
         # we need the base handler class' __init__ to run so handling works
         logbook.Handler.__init__(self, level, filter, bubble)
         if log_dir is not None:
@@ -364,6 +388,10 @@ class DelayedFileHandler(logbook.RotatingFileHandler, FormatterMixin):
         self._msg_buffer = []
         self.disabled = False
 
+    def close(self):
+        self._stop_writer()
+        super().close()
+
     @property
     def initialized(self):
         return self._log_path is not None
@@ -386,6 +414,9 @@ class DelayedFileHandler(logbook.RotatingFileHandler, FormatterMixin):
         self._super_init(log_path)
         self._replay_buffered()
         self._log_path = log_path
+        if not self._registered_exit:
+            atexit.register(self._stop_writer)
+            self._registered_exit = True
 
     def _super_init(self, log_path):
         logbook.RotatingFileHandler.__init__(
@@ -402,16 +433,76 @@ class DelayedFileHandler(logbook.RotatingFileHandler, FormatterMixin):
         FormatterMixin.__init__(self, DEBUG_LOG_FORMAT)
 
     def _replay_buffered(self):
-        for record in self._msg_buffer:
-            super().emit(record)
+        self._write_messages([
+            self.format(record) for record in self._msg_buffer
+        ])
         self._msg_buffer = None
 
     def format(self, record: logbook.LogRecord) -> str:
         msg = super().format(record)
-        subbed = str(msg)
-        for escape_sequence in dbt.ui.colors.COLORS.values():
-            subbed = subbed.replace(escape_sequence, '')
-        return subbed
+        return COLOR_ESCAPES.sub('', str(msg))
+
+    def _write_messages(self, messages: List[str]):
+        if not messages:
+            return
+        data = ''.join(self.encode(msg) for msg in messages)
+        with self.lock:
+            if self.should_rollover(None, len(data)):
+                self.perform_rollover()
+            self.write(data)
+            self.flush()
+
+    def _run_writer(self, messages: queue.Queue):
+        done = False
+        while not done:
+            batch = [messages.get()]
+            while len(batch) < self._write_batch_size:
+                try:
+                    batch.append(messages.get_nowait())
+                except queue.Empty:
+                    break
+            # a thread that got the queue before _stop_writer cleared it can
+            # still queue records after the sentinel, so the sentinel may be
+            # anywhere in the batch. Write everything in the batch, and stop.
+            records = [msg for msg in batch if msg is not None]
+            done = len(records) < len(batch)
+            try:
+                self._write_messages(records)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                for _ in batch:
+                    messages.task_done()
+
+    def _get_queue(self) -> queue.Queue:
+        with self._writer_lock:
+            # after a fork, the parent's writer thread is gone
+            if self._queue is None or self._writer_pid != os.getpid():
+                self._queue = queue.Queue()
+                self._writer = threading.Thread(
+                    target=self._run_writer, args=(self._queue,),
+                    name='dbt-log-writer', daemon=True
+                )
+                self._writer_pid = os.getpid()
+                self._writer.start()
+            return self._queue
+
+    def _stop_writer(self):
+        """Write everything that has been queued, and stop the writer."""
+        with self._writer_lock:
+            messages, writer = self._queue, self._writer
+            if messages is None or self._writer_pid != os.getpid():
+                return
+            self._queue = None
+            self._writer = None
+        messages.put(None)
+        writer.join()
+
+    def drain(self):
+        """Block until every record that has been queued is written."""
+        messages = self._queue
+        if messages is not None and self._writer_pid == os.getpid():
+            messages.join()
 
     def emit(self, record: logbook.LogRecord):
         """emit is not thread-safe with set_path, but it is thread-safe with
@@ -420,7 +511,7 @@ class DelayedFileHandler(logbook.RotatingFileHandler, FormatterMixin):
         if self.disabled:
             return
         elif self.initialized:
-            super().emit(record)
+            self._get_queue().put(self.format(record))
         else:
             assert self._msg_buffer is not None, \
                 '_msg_buffer should never be None if _log_path is set'
@@ -1,6 +1,7 @@
 from dbt.logger import GLOBAL_LOGGER as logger, log_cache_events, log_manager
 
 import argparse
+import importlib
 import os.path
 import sys
 import traceback
@@ -8,33 +9,26 @@ from contextlib import contextmanager
 
 import dbt.version
 import dbt.flags as flags
-import dbt.task.run as run_task
-import dbt.task.compile as compile_task
-import dbt.task.debug as debug_task
-import dbt.task.clean as clean_task
-import dbt.task.deps as deps_task
-import dbt.task.init as init_task
-import dbt.task.seed as seed_task
-import dbt.task.test as test_task
-import dbt.task.snapshot as snapshot_task
-import dbt.task.generate as generate_task
-import dbt.task.serve as serve_task
-import dbt.task.freshness as freshness_task
-import dbt.task.run_operation as run_operation_task
-from dbt.task.list import ListTask
-from dbt.task.rpc.server import RPCServerTask
-from dbt.adapters.factory import reset_adapters, cleanup_connections
-
-import dbt.tracking
-import dbt.ui.printer
-import dbt.deprecations
 import dbt.profiler
 
+from dbt.node_types import NodeType
 from dbt.utils import ExitCodes
-from dbt.config import PROFILES_DIR, read_user_config
 from dbt.exceptions import RuntimeException
 
 
+class LazyTask:
+    """A reference to a task class that is only imported once its subcommand
+    is chosen, so that each subcommand only pays for the imports it needs.
+    """
+    def __init__(self, module_name, class_name):
+        self.module_name = module_name
+        self.class_name = class_name
+
+    def load(self):
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.class_name)
+
+
 class DBTVersion(argparse.Action):
     """This is very very similar to the builtin argparse._Version action,
     except it just calls dbt.version.get_version_information().
@@ -120,12 +114,14 @@ def initialize_config_values(parsed):
     twice, but dbt's intialization is not structured in a way that makes that
     easy.
     """
+    from dbt.config import read_user_config
     cfg = read_user_config(parsed.profiles_dir)
     cfg.set_values(parsed.profiles_dir)
 
 
 @contextmanager
 def adapter_management():
+    from dbt.adapters.factory import reset_adapters, cleanup_connections
     reset_adapters()
     try:
         yield
@@ -163,25 +159,26 @@ def handle_and_check(args):
 
 @contextmanager
 def track_run(task):
-    dbt.tracking.track_invocation_start(config=task.config, args=task.args)
+    from dbt import tracking
+    tracking.track_invocation_start(config=task.config, args=task.args)
     try:
         yield
-        dbt.tracking.track_invocation_end(
+        tracking.track_invocation_end(
             config=task.config, args=task.args, result_type="ok"
         )
     except (dbt.exceptions.NotImplementedException,
             dbt.exceptions.FailedToConnectException) as e:
         logger.error('ERROR: {}'.format(e))
-        dbt.tracking.track_invocation_end(
+        tracking.track_invocation_end(
             config=task.config, args=task.args, result_type="error"
         )
     except Exception:
-        dbt.tracking.track_invocation_end(
+        tracking.track_invocation_end(
             config=task.config, args=task.args, result_type="error"
         )
         raise
     finally:
-        dbt.tracking.flush()
+        tracking.flush()
 
 
 def run_from_args(parsed):
@@ -202,7 +199,8 @@ def run_from_args(parsed):
         log_path = getattr(task.config, 'log_path', None)
     # we can finally set the file logger up
     log_manager.set_path(log_path)
-    logger.debug("Tracking: {}".format(dbt.tracking.active_user.state()))
+    from dbt import tracking
+    logger.debug("Tracking: {}".format(tracking.active_user.state()))
 
     results = None
 
@@ -227,11 +225,11 @@ def _build_base_subparser():
 
     base_subparser.add_argument(
         '--profiles-dir',
-        default=PROFILES_DIR,
+        default=flags.PROFILES_DIR,
         type=str,
         help='''
         Which directory to look in for the profiles.yml file. Default = {}
-        '''.format(PROFILES_DIR)
+        '''.format(flags.PROFILES_DIR)
     )
 
     base_subparser.add_argument(
@@ -278,6 +276,27 @@ def _build_base_subparser():
         If set, bypass the adapter-level cache of database state
         ''',
     )
+
+    base_subparser.add_argument(
+        '--persist-cache',
+        action='store_true',
+        help='''
+        If set, save the adapter-level cache of database state to the target
+        directory after a run, and reuse it on the next run for schemas that
+        have not changed since.
+        ''',
+    )
+
+    base_subparser.add_argument(
+        '--compile-cache',
+        action='store_true',
+        help='''
+        If set, save the compiled SQL of each node to the target directory,
+        and reuse it on the next run for nodes whose SQL, config, macros,
+        refs, vars and target have not changed. Nodes that query the database
+        while compiling are always compiled again.
+        ''',
+    )
     return base_subparser
 
 
@@ -318,7 +337,11 @@ def _build_init_subparser(subparsers, base_subparser):
         Name of the new project
         ''',
     )
-    sub.set_defaults(cls=init_task.InitTask, which='init', rpc_method=None)
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.init', 'InitTask'),
+        which='init',
+        rpc_method=None,
+    )
     return sub
 
 
@@ -331,7 +354,11 @@ def _build_clean_subparser(subparsers, base_subparser):
         (usually the dbt_modules and target directories.)
         '''
     )
-    sub.set_defaults(cls=clean_task.CleanTask, which='clean', rpc_method=None)
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.clean', 'CleanTask'),
+        which='clean',
+        rpc_method=None,
+    )
     return sub
 
 
@@ -352,7 +379,11 @@ def _build_debug_subparser(subparsers, base_subparser):
         If specified, DBT will show path information for this project
         '''
     )
-    sub.set_defaults(cls=debug_task.DebugTask, which='debug', rpc_method=None)
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.debug', 'DebugTask'),
+        which='debug',
+        rpc_method=None,
+    )
     return sub
 
 
@@ -364,7 +395,11 @@ def _build_deps_subparser(subparsers, base_subparser):
         Pull the most recent version of the dependencies listed in packages.yml
         '''
     )
-    sub.set_defaults(cls=deps_task.DepsTask, which='deps', rpc_method='deps')
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.deps', 'DepsTask'),
+        which='deps',
+        rpc_method='deps',
+    )
     return sub
 
 
@@ -385,8 +420,11 @@ def _build_snapshot_subparser(subparsers, base_subparser):
         Overrides settings in profiles.yml.
         '''
     )
-    sub.set_defaults(cls=snapshot_task.SnapshotTask, which='snapshot',
-                     rpc_method='snapshot')
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.snapshot', 'SnapshotTask'),
+        which='snapshot',
+        rpc_method='snapshot',
+    )
     return sub
 
 
@@ -397,7 +435,9 @@ def _build_run_subparser(subparsers, base_subparser):
         help='''
         Compile SQL and execute against the current target database.
         ''')
-    run_sub.set_defaults(cls=run_task.RunTask, which='run', rpc_method='run')
+    run_sub.set_defaults(
+        cls=LazyTask('dbt.task.run', 'RunTask'), which='run', rpc_method='run'
+    )
     return run_sub
 
 
@@ -410,8 +450,11 @@ def _build_compile_subparser(subparsers, base_subparser):
         Compiled SQL files are written to the target/ directory.
         '''
     )
-    sub.set_defaults(cls=compile_task.CompileTask, which='compile',
-                     rpc_method='compile')
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.compile', 'CompileTask'),
+        which='compile',
+        rpc_method='compile',
+    )
     sub.add_argument('--parse-only', action='store_true')
     return sub
 
@@ -420,8 +463,11 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
     # it might look like docs_sub is the correct parents entry, but that
     # will cause weird errors about 'conflicting option strings'.
     generate_sub = subparsers.add_parser('generate', parents=[base_subparser])
-    generate_sub.set_defaults(cls=generate_task.GenerateTask,
-                              which='generate', rpc_method='docs.generate')
+    generate_sub.set_defaults(
+        cls=LazyTask('dbt.task.generate', 'GenerateTask'),
+        which='generate',
+        rpc_method='docs.generate',
+    )
     generate_sub.add_argument(
         '--no-compile',
         action='store_false',
@@ -430,6 +476,16 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
         Do not run "dbt compile" as part of docs generation
         ''',
     )
+    generate_sub.add_argument(
+        '--incremental',
+        action='store_true',
+        help='''
+        Only query the catalog of relations that changed since the last
+        incremental "dbt docs generate", and reuse the cached catalog entries
+        of the rest. Adapters that can't detect changes always query the
+        whole catalog.
+        ''',
+    )
     return generate_sub
 
 
@@ -454,6 +510,15 @@ def _add_selection_arguments(*subparsers, **kwargs):
             Specify the models to exclude.
             ''',
         )
+        sub.add_argument(
+            '--state',
+            required=False,
+            help='''
+            The path to the target directory of a previous invocation. The
+            "state:new" and "state:modified" selectors compare the project
+            against the manifest.json found there.
+            ''',
+        )
 
 
 def _add_table_mutability_arguments(*subparsers):
@@ -468,6 +533,19 @@ def _add_table_mutability_arguments(*subparsers):
         )
 
 
+def _add_defer_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--defer',
+            action='store_true',
+            help='''
+            If set, ref() to a node that is not selected and does not exist
+            in the current target resolves to its relation in the manifest
+            given with --state.
+            '''
+        )
+
+
 def _add_common_arguments(*subparsers):
     for sub in subparsers:
         sub.add_argument(
@@ -488,6 +566,17 @@ def _add_common_arguments(*subparsers):
             the dbt_project.yml file ('require-dbt-version')
             '''
         )
+        sub.add_argument(
+            '--critical-path',
+            action='store_true',
+            help='''
+            If set, start the nodes on the longest remaining chain of
+            execution time first, using the execution times recorded in the
+            previous run_results.json. Nodes without a recorded time are
+            assumed to take the average time, and ties are broken by how many
+            models depend on each node, as usual.
+            '''
+        )
 
 
 def _build_seed_subparser(subparsers, base_subparser):
@@ -512,8 +601,11 @@ def _build_seed_subparser(subparsers, base_subparser):
         Show a sample of the loaded data in the terminal
         '''
     )
-    seed_sub.set_defaults(cls=seed_task.SeedTask, which='seed',
-                          rpc_method='seed')
+    seed_sub.set_defaults(
+        cls=LazyTask('dbt.task.seed', 'SeedTask'),
+        which='seed',
+        rpc_method='seed',
+    )
     return seed_sub
 
 
@@ -527,8 +619,11 @@ def _build_docs_serve_subparser(subparsers, base_subparser):
         Specify the port number for the docs server.
         '''
     )
-    serve_sub.set_defaults(cls=serve_task.ServeTask, which='serve',
-                           rpc_method=None)
+    serve_sub.set_defaults(
+        cls=LazyTask('dbt.task.serve', 'ServeTask'),
+        which='serve',
+        rpc_method=None,
+    )
     return serve_sub
 
 
@@ -555,7 +650,22 @@ def _build_test_subparser(subparsers, base_subparser):
         '''
     )
 
-    sub.set_defaults(cls=test_task.TestTask, which='test', rpc_method='test')
+    sub.add_argument(
+        '--batch-size',
+        type=int,
+        required=False,
+        help='''
+        If set, combine up to this many schema tests on the same models into
+        a single query. Tests in a batch that fails are retried one at a
+        time.
+        '''
+    )
+
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.test', 'TestTask'),
+        which='test',
+        rpc_method='test',
+    )
     return sub
 
 
@@ -594,8 +704,21 @@ def _build_source_snapshot_freshness_subparser(subparsers, base_subparser):
         Specify number of threads to use. Overrides settings in profiles.yml
         '''
     )
-    sub.set_defaults(cls=freshness_task.FreshnessTask,
-                     which='snapshot-freshness', rpc_method=None)
+    sub.add_argument(
+        '--batch-size',
+        type=int,
+        required=False,
+        help='''
+        If set, collect the freshness of up to this many sources in the same
+        database with a single query. Sources in a batch that fails are
+        retried one at a time.
+        '''
+    )
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.freshness', 'FreshnessTask'),
+        which='snapshot-freshness',
+        rpc_method=None,
+    )
     return sub
 
 
@@ -622,7 +745,11 @@ def _build_rpc_subparser(subparsers, base_subparser):
         Specify the port number for the rpc server.
         ''',
     )
-    sub.set_defaults(cls=RPCServerTask, which='rpc', rpc_method=None)
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.rpc.server', 'RPCServerTask'),
+        which='rpc',
+        rpc_method=None,
+    )
     # the rpc task does a 'compile', so we need these attributes to exist, but
     # we don't want users to be allowed to set them.
     sub.set_defaults(models=None, exclude=None)
@@ -638,8 +765,16 @@ def _build_list_subparser(subparsers, base_subparser):
         ''',
         aliases=['ls'],
     )
-    sub.set_defaults(cls=ListTask, which='list', rpc_method=None)
-    resource_values = list(ListTask.ALL_RESOURCE_VALUES) + ['default', 'all']
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.list', 'ListTask'),
+        which='list',
+        rpc_method=None,
+    )
+    # these are ListTask.ALL_RESOURCE_VALUES, without importing it
+    resource_values = [
+        NodeType.Model, NodeType.Snapshot, NodeType.Seed, NodeType.Test,
+        NodeType.Source, NodeType.Analysis, 'default', 'all',
+    ]
     sub.add_argument('--resource-type',
                      choices=resource_values,
                      action='append',
@@ -678,6 +813,15 @@ def _build_list_subparser(subparsers, base_subparser):
         Specify the models to exclude.
         '''
     )
+    sub.add_argument(
+        '--state',
+        required=False,
+        help='''
+        The path to the target directory of a previous invocation. The
+        "state:new" and "state:modified" selectors compare the project against
+        the manifest.json found there.
+        ''',
+    )
     return sub
 
 
@@ -706,8 +850,11 @@ def _build_run_operation_subparser(subparsers, base_subparser):
         be a YAML string, eg. '{my_variable: my_value}'
         '''
     )
-    sub.set_defaults(cls=run_operation_task.RunOperationTask,
-                     which='run-operation', rpc_method='run-operation')
+    sub.set_defaults(
+        cls=LazyTask('dbt.task.run_operation', 'RunOperationTask'),
+        which='run-operation',
+        rpc_method='run-operation',
+    )
     return sub
 
 
@@ -858,7 +1005,7 @@ def parse_args(args, cls=DBTArgumentParser):
     generate_sub = _build_docs_generate_subparser(docs_subs, base_subparser)
     test_sub = _build_test_subparser(subs, base_subparser)
     seed_sub = _build_seed_subparser(subs, base_subparser)
-    # --threads, --no-version-check
+    # --threads, --no-version-check, --critical-path
     _add_common_arguments(run_sub, compile_sub, generate_sub, test_sub,
                           rpc_sub, seed_sub)
     # --models, --exclude
@@ -866,6 +1013,8 @@ def parse_args(args, cls=DBTArgumentParser):
     _add_selection_arguments(snapshot_sub, models_name='select')
     # --full-refresh
     _add_table_mutability_arguments(run_sub, compile_sub)
+    # --defer
+    _add_defer_arguments(run_sub, compile_sub, test_sub)
 
     _build_docs_serve_subparser(docs_subs, base_subparser)
     _build_source_snapshot_freshness_subparser(source_subs, base_subparser)
@@ -884,4 +1033,6 @@ def parse_args(args, cls=DBTArgumentParser):
         p.print_help()
         p.exit(1)
 
+    # only now import the chosen subcommand's task
+    parsed.cls = parsed.cls.load()
     return parsed
@@ -1,7 +1,7 @@
 import threading
 import time
 import traceback
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from dbt import deprecations
 from dbt.adapters.base import BaseRelation
@@ -69,6 +69,7 @@ class BaseRunner:
 
         self.skip = False
         self.skip_cause = None
+        self.compile_cache = None
 
     def get_result_status(self, result) -> Dict[str, str]:
         if result.error:
@@ -319,7 +320,8 @@ class CompileRunner(BaseRunner):
         return RunModelResult(compiled_node)
 
     def compile(self, manifest):
-        return compile_node(self.adapter, self.config, self.node, manifest, {})
+        return compile_node(self.adapter, self.config, self.node, manifest, {},
+                            cache=self.compile_cache)
 
 
 # make sure that we got an ok result back from a materialization
@@ -443,6 +445,11 @@ class ModelRunner(CompileRunner):
 
 
 class FreshnessRunner(BaseRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set by the task if this source's freshness was collected in a batch
+        self.batched_freshness: Optional[Dict[str, Any]] = None
+
     def on_skip(self):
         raise RuntimeException(
             'Freshness: nodes cannot be skipped!'
@@ -494,16 +501,19 @@ class FreshnessRunner(BaseRunner):
                 'loaded_at_field!'
             )
 
-        relation = self.adapter.Relation.create_from_source(compiled_node)
-        # given a Source, calculate its fresnhess.
-        with self.adapter.connection_named(compiled_node.unique_id):
-            self.adapter.clear_transaction()
-            freshness = self.adapter.calculate_freshness(
-                relation,
-                compiled_node.loaded_at_field,
-                compiled_node.freshness.filter,
-                manifest=manifest
-            )
+        if self.batched_freshness is not None:
+            freshness = self.batched_freshness
+        else:
+            relation = self.adapter.Relation.create_from_source(compiled_node)
+            # given a Source, calculate its fresnhess.
+            with self.adapter.connection_named(compiled_node.unique_id):
+                self.adapter.clear_transaction()
+                freshness = self.adapter.calculate_freshness(
+                    relation,
+                    compiled_node.loaded_at_field,
+                    compiled_node.freshness.filter,
+                    manifest=manifest
+                )
 
         status = compiled_node.freshness.status(freshness['age'])
 
@@ -523,6 +533,12 @@ class FreshnessRunner(BaseRunner):
 
 
 class TestRunner(CompileRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set by the task if this test was compiled and run in a batch
+        self.batched_node = None
+        self.batched_failures: Optional[int] = None
+
     def describe_node(self):
         node_name = self.node.name
         return "test {}".format(node_name)
@@ -539,7 +555,15 @@ class TestRunner(CompileRunner):
         dbt.ui.printer.print_start_line(description, self.node_index,
                                         self.num_nodes)
 
+    def compile(self, manifest):
+        if self.batched_node is not None:
+            return self.batched_node
+        return super().compile(manifest)
+
     def execute_test(self, test):
+        if self.batched_failures is not None:
+            return self.batched_failures
+
         res, table = self.adapter.execute(
             test.wrapped_sql,
             auto_begin=True,
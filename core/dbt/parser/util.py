@@ -263,10 +263,17 @@ class ParserUtils:
         # it's ok for macros to silently override a local project macro name
         manifest.macros.update(macros)
 
+        cls.add_new_node(manifest, current_project, node)
+        return manifest
+
+    @classmethod
+    def add_new_node(cls, manifest, current_project: Project, node):
+        """Insert a new node into the manifest in place, and process its
+        refs, sources, and docs.
+        """
         manifest.add_nodes({node.unique_id: node})
         cls.process_sources_for_node(
             manifest, current_project.project_name, node
         )
         cls.process_refs_for_node(manifest, current_project.project_name, node)
         cls.process_docs_for_node(manifest, current_project.project_name, node)
-        return manifest
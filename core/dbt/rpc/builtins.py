@@ -19,6 +19,7 @@ from dbt.contracts.rpc import (
     RemoteExecutionResult,
     RemoteRunResult,
     RemoteCompileResult,
+    RemoteCompileBatchResult,
     RemoteCatalogResults,
     RemoteEmptyResult,
     RemoteRunOperationResult,
@@ -29,6 +30,7 @@ from dbt.contracts.rpc import (
     PollExecuteCompleteResult,
     PollRunCompleteResult,
     PollCompileCompleteResult,
+    PollCompileBatchCompleteResult,
     PollCatalogCompleteResult,
     PollRemoteEmptyCompleteResult,
     PollRunOperationCompleteResult,
@@ -141,6 +143,7 @@ def poll_complete(
         PollExecuteCompleteResult,
         PollRunCompleteResult,
         PollCompileCompleteResult,
+        PollCompileBatchCompleteResult,
         PollCatalogCompleteResult,
         PollRemoteEmptyCompleteResult,
         PollRunOperationCompleteResult,
@@ -153,6 +156,8 @@ def poll_complete(
         cls = PollRunCompleteResult
     elif isinstance(result, RemoteCompileResult):
         cls = PollCompileCompleteResult
+    elif isinstance(result, RemoteCompileBatchResult):
+        cls = PollCompileBatchCompleteResult
     elif isinstance(result, RemoteCatalogResults):
         cls = PollCatalogCompleteResult
     elif isinstance(result, RemoteEmptyResult):
@@ -13,6 +13,7 @@ from hologram import JsonSchemaMixin, ValidationError
 
 import dbt.exceptions
 import dbt.flags
+import dbt.tracking
 from dbt.adapters.factory import (
     cleanup_connections, load_plugin, register_adapter,
 )
@@ -116,7 +117,11 @@ class BootstrapProcess(dbt.flags.MP_CONTEXT.Process):
                 handler.emit_error(error.error)
 
     def run(self):
-        self.task_exec()
+        try:
+            self.task_exec()
+        finally:
+            # the child exits via os._exit, which skips atexit handlers
+            dbt.tracking.flush()
 
 
 class TaskManagerProtocol(Protocol):
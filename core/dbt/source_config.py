@@ -16,8 +16,12 @@ class SourceConfig:
         'unique_key',
         'database',
         'severity',
+        'concurrency_group',
 
         'incremental_strategy',
+        'partition_by',
+        # a list, but it should replace and not append
+        'incremental_predicates',
 
         # snapshots
         'target_database',
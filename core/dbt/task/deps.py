@@ -2,7 +2,9 @@ import dbt.utils
 import dbt.deprecations
 import dbt.exceptions
 
-from dbt.deps.base import downloads_directory
+from dbt.deps import cache as package_cache
+from dbt.deps.base import downloads_directory, map_concurrently
+from dbt.deps.local import LocalPinnedPackage
 from dbt.deps.resolver import resolve_packages
 
 from dbt.logger import GLOBAL_LOGGER as logger
@@ -27,6 +29,23 @@ class DepsTask(ProjectOnlyTask):
             "version": h_version
         })
 
+    def _install(self, package):
+        package.install(self.config)
+
+    def _install_packages(self, packages):
+        # install concurrently, but report in a stable order
+        for package in packages:
+            logger.info('Installing {}', package)
+        map_concurrently(self._install, packages)
+        for package in packages:
+            logger.info('  Installed {} from {}\n', package,
+                        package.nice_version_name())
+
+            self.track_package_install(
+                package_name=package.name,
+                source_type=package.source_type(),
+                version=package.get_version())
+
     def run(self):
         system.make_directory(self.config.modules_path)
         packages = self.config.packages.packages
@@ -34,16 +53,25 @@ class DepsTask(ProjectOnlyTask):
             logger.info('Warning: No packages were found in packages.yml')
             return
 
+        modules_path = self.config.modules_path
+        request = package_cache.request_hash(packages, self.config)
+        locked = package_cache.locked_packages(modules_path, request)
+        if locked is not None:
+            # local packages can change without packages.yml changing, so
+            # they are always installed again
+            self._install_packages([
+                LocalPinnedPackage(pin['name']) for pin in locked
+                if pin['source'] == 'local'
+            ])
+            logger.info('All packages are already installed at the '
+                        'locked versions')
+            return
+
         with downloads_directory():
             final_deps = resolve_packages(packages, self.config)
-
-            for package in final_deps:
-                logger.info('Installing {}', package)
-                package.install(self.config)
-                logger.info('  Installed from {}\n',
-                            package.nice_version_name())
-
-                self.track_package_install(
-                    package_name=package.name,
-                    source_type=package.source_type(),
-                    version=package.get_version())
+            lock = package_cache.lock_contents(
+                final_deps, self.config, request
+            )
+            package_cache.remove_lock(modules_path)
+            self._install_packages(final_deps)
+            package_cache.write_lock(modules_path, lock)
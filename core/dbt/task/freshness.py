@@ -1,14 +1,22 @@
 import os
+from multiprocessing.dummy import Pool as ThreadPool
+
 from dbt.task.runnable import GraphRunnableTask
 from dbt.node_runners import FreshnessRunner
 from dbt.node_types import NodeType
+from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.ui.printer import print_timestamped_line, print_run_result_error
 from dbt.contracts.results import FreshnessExecutionResult
+import dbt.exceptions
 
 RESULT_FILE_NAME = 'sources.json'
 
 
 class FreshnessTask(GraphRunnableTask):
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self._batched_freshness = {}
+
     def result_path(self):
         if self.args.output:
             return os.path.realpath(self.args.output)
@@ -34,6 +42,77 @@ class FreshnessTask(GraphRunnableTask):
     def get_runner_type(self):
         return FreshnessRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.batched_freshness = self._batched_freshness.get(
+            node.unique_id
+        )
+        return runner
+
+    def _get_batches(self, selected_uids, batch_size):
+        """Group the selected sources by database, and split each group into
+        batches of at most batch_size sources.
+        """
+        by_database = {}
+        for node in self._flattened_nodes:
+            if node.unique_id in selected_uids:
+                by_database.setdefault(node.database, []).append(node)
+
+        batches = []
+        for database in sorted(by_database, key=lambda d: d or ''):
+            nodes = by_database[database]
+            for start in range(0, len(nodes), batch_size):
+                batches.append(nodes[start:start + batch_size])
+        return batches
+
+    def _collect_batch(self, adapter, index, nodes):
+        sources = [
+            (
+                adapter.Relation.create_from_source(node),
+                node.loaded_at_field,
+                node.freshness.filter,
+            )
+            for node in nodes
+        ]
+        try:
+            with adapter.connection_named('freshness_batch_{}'.format(index)):
+                adapter.clear_transaction()
+                results = adapter.calculate_freshness_batch(
+                    sources, manifest=self.manifest
+                )
+        except dbt.exceptions.RuntimeException as exc:
+            # some source in the batch is broken: let each source run on its
+            # own so the error is attributed to the right one
+            logger.debug(
+                'Batched freshness query failed, retrying {} sources one at '
+                'a time: {}'.format(len(nodes), exc)
+            )
+            return {}
+        return {
+            node.unique_id: freshness
+            for node, freshness in zip(nodes, results)
+        }
+
+    def before_run(self, adapter, selected_uids):
+        self._batched_freshness = {}
+        batch_size = getattr(self.args, 'batch_size', None)
+        if not batch_size or batch_size < 2:
+            return
+
+        batches = self._get_batches(selected_uids, batch_size)
+        pool = ThreadPool(self.config.threads)
+        try:
+            results = pool.starmap(
+                self._collect_batch,
+                [(adapter, idx, nodes) for idx, nodes in enumerate(batches)]
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        for result in results:
+            self._batched_freshness.update(result)
+
     def get_result(self, results, elapsed_time, generated_at):
         return FreshnessExecutionResult(
             elapsed_time=elapsed_time,
@@ -1,8 +1,10 @@
+import json
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping
 
+import agate
 from hologram import ValidationError
 
 from dbt.adapters.factory import get_adapter
@@ -10,8 +12,10 @@ from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.results import (
     TableMetadata, CatalogTable, CatalogResults, Primitive, CatalogKey,
-    StatsItem, StatsDict, ColumnMetadata
+    StatsItem, StatsDict, ColumnMetadata, CatalogCache, CachedCatalogRelation
 )
+from dbt.clients.system import load_file_contents
+from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
 import dbt.ui.printer
 import dbt.utils
@@ -23,6 +27,13 @@ from dbt.task.runnable import write_manifest
 
 
 CATALOG_FILENAME = 'catalog.json'
+CATALOG_CACHE_FILENAME = 'catalog_cache.json'
+
+# catalog column types whose values are strings once written to JSON
+CACHED_COLUMN_TYPES: Dict[str, Any] = {
+    'Date': agate.data_types.Date(),
+    'DateTime': agate.data_types.DateTime(),
+}
 
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
@@ -177,10 +188,92 @@ def _coerce_decimal(value):
     return value
 
 
+def _row_key(row: PrimitiveDict) -> CatalogKey:
+    return CatalogKey(
+        str(row.get('table_database')).lower(),
+        str(row.get('table_schema')).lower(),
+        str(row.get('table_name')).lower(),
+    )
+
+
+def _restore_column_types(
+    rows: List[PrimitiveDict], column_types: Mapping[str, str]
+) -> None:
+    for row in rows:
+        for name, value in row.items():
+            data_type = CACHED_COLUMN_TYPES.get(column_types.get(name, ''))
+            if data_type is not None and value is not None:
+                row[name] = data_type.cast(value)
+
+
 class GenerateTask(CompileTask):
     def _get_manifest(self) -> Manifest:
         return self.manifest
 
+    def _catalog_cache_path(self) -> str:
+        return os.path.join(self.config.target_path, CATALOG_CACHE_FILENAME)
+
+    def _load_catalog_cache(
+        self, adapter
+    ) -> Mapping[CatalogKey, CachedCatalogRelation]:
+        path = self._catalog_cache_path()
+        if not os.path.exists(path):
+            return {}
+        try:
+            cache = CatalogCache.from_dict(
+                json.loads(load_file_contents(path))
+            )
+        except (ValueError, ValidationError) as exc:
+            logger.debug('Ignoring invalid catalog cache {}: {}'
+                         .format(path, exc))
+            return {}
+
+        if (cache.adapter_type != adapter.type() or
+                cache.profile_name != self.config.profile_name or
+                cache.target_name != self.config.target_name):
+            logger.debug('Ignoring catalog cache {} from another target'
+                         .format(path))
+            return {}
+        for relation in cache.relations:
+            _restore_column_types(relation.rows, cache.column_types)
+        return {relation.key(): relation for relation in cache.relations}
+
+    def _write_catalog_cache(
+        self,
+        adapter,
+        catalog_table: agate.Table,
+        catalog_data: List[PrimitiveDict],
+        fingerprints: Mapping[CatalogKey, str],
+    ) -> None:
+        rows_by_key: Dict[CatalogKey, List[PrimitiveDict]] = {}
+        for row in catalog_data:
+            key = _row_key(row)
+            if key in fingerprints:
+                rows_by_key.setdefault(key, []).append(row)
+
+        cache = CatalogCache(
+            adapter_type=adapter.type(),
+            profile_name=self.config.profile_name,
+            target_name=self.config.target_name,
+            generated_at=datetime.utcnow(),
+            column_types={
+                name: type(data_type).__name__
+                for name, data_type in zip(catalog_table.column_names,
+                                           catalog_table.column_types)
+            },
+            relations=[
+                CachedCatalogRelation(
+                    database=key.database,
+                    schema=key.schema,
+                    name=key.name,
+                    fingerprint=fingerprints[key],
+                    rows=rows,
+                )
+                for key, rows in sorted(rows_by_key.items())
+            ],
+        )
+        cache.write(self._catalog_cache_path())
+
     def run(self):
         compile_results = None
         if self.args.compile:
@@ -196,14 +289,24 @@ class GenerateTask(CompileTask):
             os.path.join(self.config.target_path, 'index.html'))
 
         adapter = get_adapter(self.config)
+        incremental = getattr(self.args, 'incremental', False)
         with adapter.connection_named('generate_catalog'):
             dbt.ui.printer.print_timestamped_line("Building catalog")
-            catalog_table = adapter.get_catalog(self.manifest)
+            if incremental:
+                catalog_table, fingerprints = adapter.get_catalog_incremental(
+                    self.manifest, self._load_catalog_cache(adapter)
+                )
+            else:
+                catalog_table = adapter.get_catalog(self.manifest)
 
         catalog_data: List[PrimitiveDict] = [
             dict(zip(catalog_table.column_names, map(_coerce_decimal, row)))
             for row in catalog_table
         ]
+        if incremental:
+            self._write_catalog_cache(
+                adapter, catalog_table, catalog_data, fingerprints
+            )
 
         catalog = Catalog(catalog_data)
         results = self.get_catalog_results(
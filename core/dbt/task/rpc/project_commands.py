@@ -80,6 +80,7 @@ class RemoteTestProjectTask(RPCCommandTask[RPCTestParameters], TestTask):
         self.args.exclude = self._listify(params.exclude)
         self.args.data = params.data
         self.args.schema = params.schema
+        self.args.batch_size = params.batch_size
 
 
 class RemoteDocsGenerateProjectTask(
@@ -1,19 +1,29 @@
 import base64
+from dataclasses import replace
 from datetime import datetime
+from multiprocessing.dummy import Pool as ThreadPool
 import signal
 import threading
+from typing import Dict, Iterable, List, Set
 
 from dbt.adapters.factory import get_adapter
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.compilation import compile_manifest, compile_node
-from dbt.contracts.rpc import RPCExecParameters
-from dbt.contracts.rpc import RemoteExecutionResult
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.contracts.rpc import (
+    RPCExecParameters,
+    RPCExecBatchParameters,
+    RemoteCompileBatchResult,
+    RemoteExecutionResult,
+)
 from dbt.exceptions import RPCKilledException
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.parser.results import ParseResult
 from dbt.parser.rpc import RPCCallParser, RPCMacroParser
 from dbt.parser.util import ParserUtils
 from dbt.rpc.error import invalid_params
+from dbt.rpc.method import Parameters
 from dbt.rpc.node_runners import RPCCompileRunner, RPCExecuteRunner
 from dbt.task.compile import CompileTask
 from dbt.task.run import RunTask
@@ -21,7 +31,7 @@ from dbt.task.run import RunTask
 from .base import RPCTask
 
 
-class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
+class RemoteSQLTask(RPCTask[Parameters]):
     def runtime_cleanup(self, selected_uids):
         """Do some pre-run cleanup that is usually performed in Task __init__.
         """
@@ -31,6 +41,7 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
         self._skipped_children = {}
         self._skipped_children = {}
         self._raise_next_tick = None
+        self.compile_cache = None
 
     def decode_sql(self, sql: str) -> str:
         """Base64 decode a string. This should only be used for sql in calls.
@@ -71,14 +82,20 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
         sql = ''.join(data_chunks)
         return sql, macros
 
-    def _compile_ancestors(self, unique_id: str):
+    def _compile_ancestors(self, unique_ids: Iterable[str]):
         # this just gets a transitive closure of the nodes. We could build a
         # special GraphQueue around this, but we do them all in the main thread
         # so we only care about preserving dependency order anyway
-        sorted_ancestors = self.linker.sorted_ephemeral_ancestors(
-            self.manifest,
-            unique_id,
-        )
+        sorted_ancestors: List[str] = []
+        seen: Set[str] = set()
+        for unique_id in unique_ids:
+            for ancestor in self.linker.sorted_ephemeral_ancestors(
+                self.manifest, unique_id
+            ):
+                # batched requests may share ancestors, only compile once
+                if ancestor not in seen:
+                    seen.add(ancestor)
+                    sorted_ancestors.append(ancestor)
         # We're just compiling, so we don't need to use a graph queue
         adapter = get_adapter(self.config)  # type: ignore
 
@@ -89,35 +106,66 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
                 adapter, self.config, parsed, self.manifest, {}, write=False
             )
 
-    def _get_exec_node(self):
-        results = ParseResult.rpc()
+    def _parse_macros(self, results, macros: str) -> Dict[str, ParsedMacro]:
         macro_overrides = {}
-        macros = self.args.macros
-        sql, macros = self._extract_request_data(self.args.sql)
-
         if macros:
             macro_parser = RPCMacroParser(results, self.config)
             for node in macro_parser.parse_remote(macros):
                 macro_overrides[node.unique_id] = node
+        return macro_overrides
 
-        self.manifest.macros.update(macro_overrides)
+    def _parse_sql(self, results, macro_manifest: Manifest, sql: str,
+                   name: str):
         rpc_parser = RPCCallParser(
             results=results,
             project=self.config,
             root_project=self.config,
-            macro_manifest=self.manifest,
+            macro_manifest=macro_manifest,
         )
-        node = rpc_parser.parse_remote(sql, self.args.name)
+        return rpc_parser.parse_remote(sql, name)
+
+    def _parse_remote_node(self, results, sql: str, name: str):
+        sql, macros = self._extract_request_data(sql)
+        macro_overrides = self._parse_macros(results, macros)
+
+        self.manifest.macros.update(macro_overrides)
+        node = self._parse_sql(results, self.manifest, sql, name)
         self.manifest = ParserUtils.add_new_refs(
             manifest=self.manifest,
             current_project=self.config,
             node=node,
             macros=macro_overrides
         )
+        return node
+
+    def _cancel_connections(self) -> bool:
+        """Cancel the queries running on any open connections. Returns
+        whether the adapter supports cancelling queries.
+        """
+        adapter = get_adapter(self.config)  # type: ignore
+        if adapter.is_cancelable():
+            for conn_name in adapter.cancel_open_connections():
+                logger.debug('canceled query {}'.format(conn_name))
+            return True
+
+        msg = ("The {} adapter does not support query "
+               "cancellation. Some queries may still be "
+               "running!".format(adapter.type()))
+        logger.debug(msg)
+        return False
+
+    def interpret_results(self, results):
+        return True
+
+
+class RemoteRunSQLTask(RemoteSQLTask[RPCExecParameters]):
+    def _get_exec_node(self):
+        results = ParseResult.rpc()
+        node = self._parse_remote_node(results, self.args.sql, self.args.name)
 
         # don't write our new, weird manifest!
         self.linker = compile_manifest(self.config, self.manifest, write=False)
-        self._compile_ancestors(node.unique_id)
+        self._compile_ancestors([node.unique_id])
         return node
 
     def _raise_set_error(self):
@@ -155,19 +203,8 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
             thread.start()
             thread_done.wait()
         except KeyboardInterrupt:
-            adapter = get_adapter(self.config)  # type: ignore
-            if adapter.is_cancelable():
-
-                for conn_name in adapter.cancel_open_connections():
-                    logger.debug('canceled query {}'.format(conn_name))
-                if thread:
-                    thread.join()
-            else:
-                msg = ("The {} adapter does not support query "
-                       "cancellation. Some queries may still be "
-                       "running!".format(adapter.type()))
-
-                logger.debug(msg)
+            if self._cancel_connections() and thread:
+                thread.join()
 
             raise RPCKilledException(signal.SIGINT)
 
@@ -181,9 +218,6 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
             generated_at=ended,
         )
 
-    def interpret_results(self, results):
-        return True
-
 
 class RemoteCompileTask(RemoteRunSQLTask, CompileTask):
     METHOD_NAME = 'compile_sql'
@@ -197,3 +231,103 @@ class RemoteRunTask(RemoteRunSQLTask, RunTask):
 
     def get_runner_type(self):
         return RPCExecuteRunner
+
+
+class RemoteCompileBatchTask(
+    RemoteSQLTask[RPCExecBatchParameters], CompileTask
+):
+    """Compile many SQL snippets in one request. All snippets are parsed into
+    the same manifest snapshot up front, and then compiled concurrently on a
+    thread pool. Results are returned in request order.
+
+    Macros defined in a snippet are only visible to that snippet. Ephemeral
+    models the snippets use are compiled once, with the project's macros.
+    """
+    METHOD_NAME = 'compile_sql_batch'
+
+    def get_runner_type(self):
+        return RPCCompileRunner
+
+    def set_args(self, params: RPCExecBatchParameters):
+        self.args.queries = params.queries
+
+    def _get_exec_nodes(self):
+        names = [q.name for q in self.args.queries]
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            raise invalid_params(
+                data={
+                    'message': 'query names must be unique within a batch',
+                    'duplicates': duplicates,
+                }
+            )
+
+        results = ParseResult.rpc()
+        nodes = []
+        self._macro_overrides: Dict[str, Dict[str, ParsedMacro]] = {}
+        # copy the manifest once for the whole batch
+        manifest = self.manifest.deepcopy()
+        for query in self.args.queries:
+            sql, macros = self._extract_request_data(query.sql)
+            macro_overrides = self._parse_macros(results, macros)
+            # keep the query's macros out of the shared manifest, so the
+            # other queries in the batch don't see them
+            node = self._parse_sql(
+                results, self._with_macros(self.manifest, macro_overrides),
+                sql, query.name
+            )
+            ParserUtils.add_new_node(manifest, self.config, node)
+            self._macro_overrides[node.unique_id] = macro_overrides
+            nodes.append(node)
+        self.manifest = manifest
+        # one link + ancestor compile for the whole batch
+        self.linker = compile_manifest(self.config, self.manifest, write=False)
+        self._compile_ancestors(n.unique_id for n in nodes)
+        return nodes
+
+    @staticmethod
+    def _with_macros(
+        manifest: Manifest, macros: Dict[str, ParsedMacro]
+    ) -> Manifest:
+        if not macros:
+            return manifest
+        return replace(manifest, macros={**manifest.macros, **macros})
+
+    def handle_request(self) -> RemoteCompileBatchResult:
+        pool = None
+        started = datetime.utcnow()
+        try:
+            nodes = self._get_exec_nodes()
+            self.runtime_cleanup([n.unique_id for n in nodes])
+
+            runners = [self.get_runner(node) for node in nodes]
+            manifests = [
+                self._with_macros(
+                    self.manifest, self._macro_overrides[node.unique_id]
+                )
+                for node in nodes
+            ]
+            pool = ThreadPool(self.config.threads)
+            pending = [
+                pool.apply_async(runner.safe_run, args=(manifest,))
+                for runner, manifest in zip(runners, manifests)
+            ]
+            pool.close()
+            # get() re-raises in request order, so the first failing query
+            # in the batch is the error that gets reported.
+            compiled = [p.get() for p in pending]
+            pool.join()
+        except KeyboardInterrupt:
+            self._cancel_connections()
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            raise RPCKilledException(signal.SIGINT)
+
+        ended = datetime.utcnow()
+        elapsed = (ended - started).total_seconds()
+        return RemoteCompileBatchResult(
+            results=compiled,
+            elapsed_time=elapsed,
+            logs=[],
+        )
@@ -57,7 +57,9 @@ class RunTask(CompileTask):
         return False
 
     def populate_adapter_cache(self, adapter):
-        adapter.set_relations_cache(self.manifest)
+        adapter.set_relations_cache(
+            self.manifest, new_schemas=self._created_schemas
+        )
 
     def get_hook_sql(self, adapter, hook, idx, num_hooks, extra_context):
         compiled = compile_node(adapter, self.config, hook, self.manifest,
@@ -157,6 +159,10 @@ class RunTask(CompileTask):
             if not any((r.error is not None, r.fail, r.skipped))
         ))
         with adapter.connection_named('master'):
+            # persist the cache before on-run-end hooks run: any relations
+            # they change then show up as a fingerprint mismatch next time
+            if not any(r.error is not None for r in results):
+                adapter.persist_relations_cache(self.manifest)
             self.safe_run_hooks(adapter, RunHookType.End,
                                 {'schemas': schemas, 'results': results})
 
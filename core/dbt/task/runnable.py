@@ -1,3 +1,4 @@
+import json
 import os
 import time
 from datetime import datetime
@@ -15,8 +16,12 @@ from dbt.logger import (
     NodeMetadata,
     NodeCount,
 )
+from dbt.clients.system import load_file_contents
 from dbt.compilation import compile_manifest
+from dbt.compile_cache import CompileCache
 from dbt.contracts.results import ExecutionResult
+from dbt.contracts.state import PreviousState
+from dbt.node_types import NodeType
 from dbt.perf_utils import get_full_manifest
 
 import dbt.exceptions
@@ -36,11 +41,47 @@ def write_manifest(config, manifest):
         manifest.write(os.path.join(config.target_path, MANIFEST_FILE_NAME))
 
 
+def load_execution_times(path):
+    """Read the execution time of each node from a previous run_results.json.
+    Skipped nodes are left out, and a missing or unreadable file gives no
+    times at all.
+
+    :param str path: The path to the run results file.
+    :return Dict[str, float]: The execution times, by unique ID.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        results = json.loads(load_file_contents(path))['results']
+        return {
+            result['node']['unique_id']: float(result['execution_time'])
+            for result in results
+            if not result.get('skip')
+        }
+    except (ValueError, KeyError, TypeError) as exc:
+        logger.debug('Ignoring unreadable run results at {}: {}'
+                     .format(path, exc))
+        return {}
+
+
 class ManifestTask(ConfiguredTask):
     def __init__(self, args, config):
         super().__init__(args, config)
         self.manifest = None
         self.linker = None
+        self.previous_state = None
+
+    def load_previous_state(self):
+        self.previous_state = None
+        state_path = getattr(self.args, 'state', None)
+        if state_path is not None:
+            self.previous_state = PreviousState.load(
+                os.path.join(state_path, MANIFEST_FILE_NAME)
+            )
+        elif getattr(self.args, 'defer', False):
+            raise dbt.exceptions.RuntimeException(
+                'Got --defer, but no --state to defer to'
+            )
 
     def load_manifest(self):
         self.manifest = get_full_manifest(self.config)
@@ -51,6 +92,9 @@ class ManifestTask(ConfiguredTask):
         self.manifest.build_flat_graph()
 
     def _runtime_initialize(self):
+        # load the previous state first: --state may point at the target
+        # path, where load_manifest() writes the new manifest
+        self.load_previous_state()
         self.load_manifest()
         self.compile_manifest()
 
@@ -66,10 +110,12 @@ class GraphRunnableTask(ManifestTask):
         self.node_results = []
         self._skipped_children = {}
         self._raise_next_tick = None
+        self._created_schemas = set()
+        self.compile_cache = None
 
     def select_nodes(self):
         selector = dbt.graph.selector.NodeSelector(
-            self.linker.graph, self.manifest
+            self.linker.graph, self.manifest, self.previous_state
         )
         selected_nodes = selector.select(self.build_query())
         return selected_nodes
@@ -77,8 +123,18 @@ class GraphRunnableTask(ManifestTask):
     def _runtime_initialize(self):
         super()._runtime_initialize()
         selected_nodes = self.select_nodes()
-        self.job_queue = self.linker.as_graph_queue(self.manifest,
-                                                    selected_nodes)
+        execution_times = None
+        if getattr(self.args, 'critical_path', False):
+            execution_times = load_execution_times(
+                os.path.join(self.config.target_path, RESULT_FILE_NAME)
+            )
+        self.job_queue = self.linker.as_graph_queue(
+            self.manifest, selected_nodes, execution_times,
+            self.config.concurrency_groups
+        )
+        self.compile_cache = None
+        if dbt.flags.COMPILE_CACHE:
+            self.compile_cache = CompileCache.load(self.config, self.manifest)
 
         # we use this a couple times. order does not matter.
         self._flattened_nodes = [
@@ -114,7 +170,9 @@ class GraphRunnableTask(ManifestTask):
             num_nodes = self.num_nodes
 
         cls = self.get_runner_type()
-        return cls(self.config, adapter, node, run_count, num_nodes)
+        runner = cls(self.config, adapter, node, run_count, num_nodes)
+        runner.compile_cache = self.compile_cache
+        return runner
 
     def call_runner(self, runner):
         uid_context = UniqueID(runner.node.unique_id)
@@ -273,6 +331,8 @@ class GraphRunnableTask(ManifestTask):
         try:
             self.before_hooks(adapter)
             started = time.time()
+            if getattr(self.args, 'defer', False):
+                self.defer_unselected_nodes(adapter, selected_uids)
             self.before_run(adapter, selected_uids)
             res = self.execute_nodes()
             self.after_run(adapter, res)
@@ -312,6 +372,8 @@ class GraphRunnableTask(ManifestTask):
 
         if dbt.flags.WRITE_JSON:
             result.write(self.result_path())
+        if self.compile_cache is not None:
+            self.compile_cache.write()
 
         self.task_end_messages(result.results)
         return result
@@ -333,18 +395,112 @@ class GraphRunnableTask(ManifestTask):
 
         return schemas
 
+    def _list_schemas(self, adapter, db):
+        with adapter.connection_named('list_{}'.format(db)):
+            return [(db.lower(), s.lower()) for s in adapter.list_schemas(db)]
+
+    def _create_schema(self, adapter, db, schema):
+        with adapter.connection_named('create_{}_{}'.format(db, schema)):
+            adapter.create_schema(db, schema)
+
+    def _map_with_pool(self, func, arguments):
+        pool = ThreadPool(self.config.threads)
+        try:
+            return pool.starmap(func, arguments)
+        finally:
+            pool.close()
+            pool.join()
+
     def create_schemas(self, adapter, selected_uids):
+        """Create the schemas of the selected nodes that don't exist yet. The
+        existing schemas are listed once per database and the missing ones
+        are created, each step running concurrently across the configured
+        threads. The created schemas are remembered in `_created_schemas`,
+        since they are known to be empty.
+        """
         required_schemas = self.get_model_schemas(selected_uids)
-        required_databases = set(db for db, _ in required_schemas)
+        required_databases = sorted(set(db for db, _ in required_schemas))
 
         existing_schemas_lowered = set()
-        for db in required_databases:
-            existing_schemas_lowered.update(
-                (db.lower(), s.lower()) for s in adapter.list_schemas(db))
+        listed = self._map_with_pool(
+            self._list_schemas,
+            [(adapter, db) for db in required_databases]
+        )
+        for schemas in listed:
+            existing_schemas_lowered.update(schemas)
+
+        missing = sorted(
+            (db, schema) for db, schema in required_schemas
+            if (db.lower(), schema.lower()) not in existing_schemas_lowered
+        )
+        self._map_with_pool(
+            self._create_schema,
+            [(adapter, db, schema) for db, schema in missing]
+        )
+        self._created_schemas = set(missing)
+
+    def _list_relations(self, adapter, db, schema):
+        with adapter.connection_named('list_{}_{}'.format(db, schema)):
+            return [
+                (db.lower(), schema.lower(), r.identifier.lower())
+                for r in adapter.list_relations(db, schema)
+            ]
+
+    def defer_unselected_nodes(self, adapter, selected_uids):
+        """Point the unselected nodes that don't exist in the current target
+        at their relations in the --state manifest, so that ref() to them
+        resolves to those relations and only the selected nodes have to be
+        built.
+        """
+        refable = NodeType.refable()
+        candidates = {}
+        for unique_id, node in self.manifest.nodes.items():
+            if unique_id in selected_uids:
+                continue
+            if node.resource_type not in refable or node.is_ephemeral:
+                continue
+            previous = self.previous_state.manifest.nodes.get(unique_id)
+            if previous is None or previous.is_ephemeral:
+                continue
+            candidates[unique_id] = previous
 
-        for db, schema in required_schemas:
-            if (db.lower(), schema.lower()) not in existing_schemas_lowered:
-                adapter.create_schema(db, schema)
+        schemas = set()
+        for unique_id in candidates:
+            node = self.manifest.nodes[unique_id]
+            schemas.add((node.database, node.schema))
+        existing_schemas_lowered = set()
+        listed = self._map_with_pool(
+            self._list_schemas,
+            [(adapter, db) for db in sorted(set(db for db, _ in schemas))]
+        )
+        for listed_schemas in listed:
+            existing_schemas_lowered.update(listed_schemas)
+
+        existing_relations_lowered = set()
+        listed = self._map_with_pool(
+            self._list_relations,
+            [
+                (adapter, db, schema) for db, schema in sorted(schemas)
+                if (db.lower(), schema.lower()) in existing_schemas_lowered
+            ]
+        )
+        for relations in listed:
+            existing_relations_lowered.update(relations)
+
+        for unique_id, previous in sorted(candidates.items()):
+            node = self.manifest.nodes[unique_id]
+            key = (node.database.lower(), node.schema.lower(),
+                   node.alias.lower())
+            if key in existing_relations_lowered:
+                continue
+            logger.debug('Deferring {} to {}.{}.{}'.format(
+                unique_id, previous.database, previous.schema, previous.alias
+            ))
+            self.manifest.nodes[unique_id] = node.replace(
+                database=previous.database,
+                schema=previous.schema,
+                alias=previous.alias,
+            )
 
     def get_result(self, results, elapsed_time, generated_at):
         return ExecutionResult(
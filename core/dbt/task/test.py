@@ -1,6 +1,25 @@
+from multiprocessing.dummy import Pool as ThreadPool
+
+from dbt.compilation import compile_node
+from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_runners import TestRunner
 from dbt.node_types import NodeType
 from dbt.task.run import RunTask
+import dbt.exceptions
+
+
+def _batched_test_sql(tests):
+    """Combine the given compiled schema tests into a single query that
+    returns one (test_index, failures) row per test.
+    """
+    selects = []
+    for idx, test in enumerate(tests):
+        selects.append(
+            'select {idx} as test_index, dbt_batched_test_{idx}.* from (\n'
+            '{sql}\n'
+            ') dbt_batched_test_{idx}'.format(idx=idx, sql=test.wrapped_sql)
+        )
+    return '\nunion all\n'.join(selects)
 
 
 class TestTask(RunTask):
@@ -9,6 +28,11 @@ class TestTask(RunTask):
         Read schema files + custom data tests and validate that
         constraints are satisfied.
     """
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self._batched_nodes = {}
+        self._batched_failures = {}
+
     def raise_on_first_error(self):
         return False
 
@@ -38,3 +62,95 @@ class TestTask(RunTask):
 
     def get_runner_type(self):
         return TestRunner
+
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.batched_node = self._batched_nodes.get(node.unique_id)
+        runner.batched_failures = self._batched_failures.get(node.unique_id)
+        return runner
+
+    def _get_batches(self, selected_uids, batch_size):
+        """Group the selected schema tests by the models they test, and split
+        each group into batches of at most batch_size tests.
+        """
+        by_parents = {}
+        for node in self._flattened_nodes:
+            if node.unique_id not in selected_uids:
+                continue
+            if 'schema' not in node.tags:
+                continue
+            key = tuple(sorted(node.depends_on.nodes))
+            by_parents.setdefault(key, []).append(node)
+
+        batches = []
+        for key in sorted(by_parents):
+            nodes = by_parents[key]
+            for start in range(0, len(nodes), batch_size):
+                batches.append(nodes[start:start + batch_size])
+        return batches
+
+    def _run_batch(self, adapter, index, nodes):
+        compiled = []
+        for node in nodes:
+            try:
+                compiled.append(compile_node(
+                    adapter, self.config, node, self.manifest, {}
+                ))
+            except dbt.exceptions.RuntimeException as exc:
+                # leave it to the test's own runner to report this
+                logger.debug('Not batching test {}: {}'.format(
+                    node.unique_id, exc
+                ))
+
+        failures = {}
+        if not compiled:
+            return compiled, failures
+
+        sql = _batched_test_sql(compiled)
+        try:
+            with adapter.connection_named('test_batch_{}'.format(index)):
+                _, table = adapter.execute(sql, auto_begin=True, fetch=True)
+        except dbt.exceptions.RuntimeException as exc:
+            # some test in the batch is broken: run each test on its own so
+            # the error is attributed to the right one
+            logger.debug(
+                'Batched test query failed, retrying {} tests one at a time: '
+                '{}'.format(len(compiled), exc)
+            )
+            return compiled, failures
+
+        rows_by_index = {}
+        for row in table:
+            rows_by_index.setdefault(int(row[0]), []).append(row[1])
+
+        for idx, test in enumerate(compiled):
+            values = rows_by_index.get(idx, [])
+            # tests that didn't return exactly one row get retried, so they
+            # raise the usual "bad test" error
+            if len(values) == 1:
+                failures[test.unique_id] = values[0]
+        return compiled, failures
+
+    def _run_batched_tests(self, adapter, selected_uids, batch_size):
+        batches = self._get_batches(selected_uids, batch_size)
+        pool = ThreadPool(self.config.threads)
+        try:
+            results = pool.starmap(
+                self._run_batch,
+                [(adapter, idx, nodes) for idx, nodes in enumerate(batches)]
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        for compiled, failures in results:
+            self._batched_nodes.update((n.unique_id, n) for n in compiled)
+            self._batched_failures.update(failures)
+
+    def before_run(self, adapter, selected_uids):
+        super().before_run(adapter, selected_uids)
+        self._batched_nodes = {}
+        self._batched_failures = {}
+        batch_size = getattr(self.args, 'batch_size', None)
+        if batch_size and batch_size > 1:
+            self._run_batched_tests(adapter, selected_uids, batch_size)
@@ -4,9 +4,13 @@ from snowplow_tracker import Subject, Tracker, Emitter, logger as sp_logger
 from snowplow_tracker import SelfDescribingJson
 from datetime import datetime
 
+import atexit
 import logbook
 import pytz
 import platform
+import queue
+import threading
+import time
 import uuid
 import requests
 import yaml
@@ -27,24 +31,125 @@ RPC_REQUEST_SPEC = 'iglu:com.dbt/rpc_request/jsonschema/1-0-1'
 DBT_INVOCATION_ENV = 'DBT_INVOCATION_ENV'
 
 
-class TimeoutEmitter(Emitter):
+# the most events waiting to be sent. Further events are dropped.
+MAX_QUEUED_EVENTS = 1000
+# how long to wait for more events to fill a batch before sending it
+BATCH_LINGER = 1.0
+REQUEST_TIMEOUT = 5.0
+FLUSH_TIMEOUT = 5.0
+
+
+class _FlushRequest:
     def __init__(self):
-        super().__init__(COLLECTOR_URL, protocol=COLLECTOR_PROTOCOL,
-                         buffer_size=1, on_failure=self.handle_failure)
+        self.done = threading.Event()
+
 
-    @staticmethod
-    def handle_failure(num_ok, unsent):
-        # num_ok will always be 0, unsent will always be 1 entry long, because
-        # the buffer is length 1, so not much to talk about
+class TimeoutEmitter(Emitter):
+    """An emitter that sends events from a background thread, so tracking
+    never blocks the thread an event comes from. Events wait in a bounded
+    queue and are POSTed in batches.
+    """
+    def __init__(self, endpoint=COLLECTOR_URL, protocol=COLLECTOR_PROTOCOL,
+                 port=None, buffer_size=50):
+        super().__init__(endpoint, protocol=protocol, port=port,
+                         method='post', buffer_size=buffer_size,
+                         on_failure=self.handle_failure)
+        self.disabled = False
+        self.queue = None
+        self._worker = None
+        self._worker_pid = None
+
+    def handle_failure(self, num_ok, unsent):
         logger.warning('Error sending message, disabling tracking')
+        self.disabled = True
         do_not_track()
 
-    def http_get(self, payload):
-        sp_logger.info("Sending GET request to {}...".format(self.endpoint))
-        sp_logger.debug("Payload: {}".format(payload))
-        r = requests.get(self.endpoint, params=payload, timeout=5.0)
-
-        msg = "GET request finished with status code: " + str(r.status_code)
+    def _ensure_worker(self):
+        with self.lock:
+            # after a fork, the worker thread is gone and the queue's locks
+            # can't be trusted, so start over
+            if self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+            self.queue = queue.Queue(maxsize=MAX_QUEUED_EVENTS)
+            self._worker = threading.Thread(
+                target=self._run, args=(self.queue,), name='dbt-tracking',
+                daemon=True
+            )
+            self._worker_pid = os.getpid()
+            self._worker.start()
+
+    def _next_batch(self, events):
+        """Take events off the queue until the batch is full, or the queue
+        has been empty for a while. Returns the batch, and the flush requests
+        that were waiting for it.
+        """
+        batch = []
+        flushes = []
+        item = events.get()
+        deadline = time.monotonic() + BATCH_LINGER
+        while True:
+            if isinstance(item, _FlushRequest):
+                flushes.append(item)
+                break
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.buffer_size or remaining <= 0:
+                break
+            try:
+                item = events.get(timeout=remaining)
+            except queue.Empty:
+                break
+        return batch, flushes
+
+    def _run(self, events):
+        while True:
+            batch, flushes = self._next_batch(events)
+            if batch and not self.disabled:
+                try:
+                    self.send_events(batch)
+                except Exception:
+                    logger.debug('An error was encountered while trying to '
+                                 'send events', exc_info=True)
+            for request in flushes:
+                request.done.set()
+
+    def input(self, payload):
+        if self.disabled:
+            return
+        self._ensure_worker()
+        try:
+            self.queue.put_nowait({k: str(v) for k, v in payload.items()})
+        except queue.Full:
+            logger.debug('Too many queued usage events, dropping one')
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """Send all queued events, waiting at most timeout seconds for them
+        to be sent.
+        """
+        with self.lock:
+            if self._worker_pid != os.getpid() or not self._worker.is_alive():
+                return
+        deadline = time.monotonic() + timeout
+        request = _FlushRequest()
+        try:
+            self.queue.put(request, timeout=timeout)
+        except queue.Full:
+            return
+        if not request.done.wait(max(deadline - time.monotonic(), 0)):
+            logger.debug('Timed out sending usage events')
+
+    def sync_flush(self):
+        self.flush()
+
+    def http_post(self, data):
+        sp_logger.info("Sending POST request to {}...".format(self.endpoint))
+        sp_logger.debug("Payload: {}".format(data))
+        r = requests.post(
+            self.endpoint, data=data, timeout=REQUEST_TIMEOUT,
+            headers={'content-type': 'application/json; charset=utf-8'}
+        )
+
+        msg = "POST request finished with status code: " + str(r.status_code)
         if self.is_good_status_code(r.status_code):
             sp_logger.info(msg)
         else:
@@ -323,6 +428,16 @@ def flush():
     tracker.flush()
 
 
+def _flush_at_exit():
+    # events tracked outside of a run (like invalid invocations) are never
+    # flushed explicitly, so give them one more chance before exiting. This
+    # waits at most FLUSH_TIMEOUT, and returns at once if nothing was tracked.
+    tracker.flush()
+
+
+atexit.register(_flush_at_exit)
+
+
 def do_not_track():
     global active_user
     active_user = User(None)
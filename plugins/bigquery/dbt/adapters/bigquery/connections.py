@@ -1,6 +1,7 @@
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Callable, Iterator
 
 import google.auth
 import google.api_core
@@ -48,6 +49,63 @@ class BigQueryCredentials(Credentials):
         return ('method', 'database', 'schema', 'location')
 
 
+class JobPoller:
+    """Wait for a BigQuery job by polling it with exponential backoff.
+
+    Short jobs are noticed quickly, and long jobs don't flood the API with
+    `jobs.get` requests. Queries don't need this: `QueryJob.result()` waits
+    with a server-side long poll, which is cheaper than reloading the job.
+    """
+    def __init__(
+        self,
+        initial_delay: float = 0.1,
+        max_delay: float = 5.0,
+        multiplier: float = 2.0,
+        sleep: Callable[[float], Any] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.sleep = sleep
+        self.clock = clock
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial_delay
+        while True:
+            yield delay
+            delay = min(delay * self.multiplier, self.max_delay)
+
+    @staticmethod
+    def is_done(job) -> bool:
+        if job.state == 'DONE':
+            return True
+        job.reload()
+        return job.state == 'DONE'
+
+    def wait(self, job, timeout: Optional[float] = None) -> None:
+        """Block until the job is done. This does not check whether the job
+        succeeded.
+
+        :param job: The submitted job to wait for.
+        :param timeout: The number of seconds to wait, or None to wait
+            forever.
+        :raises RuntimeException: If the job didn't finish in time.
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        delays = self.delays()
+        while not self.is_done(job):
+            delay = next(delays)
+            if deadline is not None:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    raise dbt.exceptions.RuntimeException(
+                        "BigQuery Timeout Exceeded"
+                    )
+                delay = min(delay, remaining)
+            self.sleep(delay)
+
+
 class BigQueryConnectionManager(BaseConnectionManager):
     TYPE = 'bigquery'
 
@@ -57,6 +115,8 @@ class BigQueryConnectionManager(BaseConnectionManager):
 
     QUERY_TIMEOUT = 300
 
+    job_poller = JobPoller()
+
     @classmethod
     def handle_error(cls, error, message, sql):
         logger.debug(message.format(sql=sql))
@@ -5,6 +5,7 @@ import dbt.clients.gcloud
 import dbt.clients.agate_helper
 
 from dbt.adapters.base import BaseAdapter, available, RelationType
+from dbt.adapters.base.meta import introspection
 from dbt.adapters.bigquery.relation import (
     BigQueryRelation
 )
@@ -19,7 +20,6 @@ import google.oauth2
 import google.cloud.exceptions
 import google.cloud.bigquery
 
-import time
 import agate
 
 
@@ -264,19 +264,10 @@ class BigQueryAdapter(BaseAdapter):
 
         return "CREATE TABLE"
 
-    @classmethod
-    def poll_until_job_completes(cls, job, timeout):
-        retry_count = timeout
-
-        while retry_count > 0 and job.state != 'DONE':
-            retry_count -= 1
-            time.sleep(1)
-            job.reload()
-
-        if job.state != 'DONE':
-            raise dbt.exceptions.RuntimeException("BigQuery Timeout Exceeded")
+    def poll_until_job_completes(self, job, timeout):
+        self.connections.job_poller.wait(job, timeout)
 
-        elif job.error_result:
+        if job.error_result:
             message = '\n'.join(
                 error['message'].strip() for error in job.errors
             )
@@ -378,6 +369,7 @@ class BigQueryAdapter(BaseAdapter):
             and table_cluster == conf_cluster
 
     @available.parse_none
+    @introspection.invalidates
     def alter_table_add_columns(self, relation, columns):
 
         logger.debug('Adding columns ({}) to table {}".'.format(
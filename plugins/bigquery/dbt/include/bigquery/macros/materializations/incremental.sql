@@ -1,4 +1,87 @@
 
+{% macro dbt_bigquery_validate_get_incremental_strategy(config) %}
+  {#-- Find and validate the incremental strategy #}
+  {%- set strategy = config.get("incremental_strategy", default="merge") -%}
+
+  {% set invalid_strategy_msg -%}
+    Invalid incremental strategy provided: {{ strategy }}
+    Expected one of: 'merge', 'insert_overwrite'
+  {%- endset %}
+  {% if strategy not in ['merge', 'insert_overwrite'] %}
+    {% do exceptions.raise_compiler_error(invalid_strategy_msg) %}
+  {% endif %}
+
+  {% do incremental_validate_partition_by(strategy, config.get('partition_by')) %}
+  {% do return(strategy) %}
+{% endmacro %}
+
+
+{% macro bq_insert_overwrite(tmp_relation, target_relation, partition_by, dest_columns, predicates=none) %}
+  {#--
+    Replace each partition found in tmp_relation with a single merge, so the
+    target is replaced atomically. The replaced partitions are given as
+    literals so BigQuery only scans those partitions of the target. Rows
+    without a partition value belong to the null partition.
+
+    The source columns are renamed, so the partition_by expression and the
+    incremental_predicates in the `not matched by source` clause can only
+    refer to the target's columns.
+  --#}
+  {%- set partitions_sql -%}
+    select distinct {{ partition_by }} as partition_value
+    from {{ tmp_relation }}
+  {%- endset -%}
+  {%- set partitions = run_query(partitions_sql).columns[0].values() -%}
+  {%- set partition_dates = partitions | reject('none') | list -%}
+  {%- set has_null_partition = partitions | select('none') | list | length > 0 -%}
+
+  {% set merge_sql %}
+    merge into {{ target_relation }} as DBT_INTERNAL_DEST
+    using (
+      select
+      {%- for column in dest_columns %}
+        {{ adapter.quote(column.name) }} as {{ adapter.quote('DBT_INTERNAL_' ~ column.name) }}
+        {%- if not loop.last %},{% endif %}
+      {%- endfor %}
+      from {{ tmp_relation }}
+    ) as DBT_INTERNAL_SOURCE
+    on FALSE
+
+    when not matched by source and (
+      {%- if partition_dates %}
+      {{ partition_by }} in (
+        {%- for partition in partition_dates -%}
+          date '{{ partition }}'{{ ', ' if not loop.last }}
+        {%- endfor -%}
+      )
+      {%- else %}
+      FALSE
+      {%- endif %}
+      {%- if has_null_partition %}
+      or {{ partition_by }} is null
+      {%- endif %}
+    )
+    {{- incremental_predicates_sql(predicates) }} then delete
+
+    when not matched then insert
+      ({% for column in dest_columns %}{{ adapter.quote(column.name) }}{{ ', ' if not loop.last }}{% endfor %})
+    values
+      ({% for column in dest_columns %}{{ adapter.quote('DBT_INTERNAL_' ~ column.name) }}{{ ', ' if not loop.last }}{% endfor %})
+  {% endset %}
+
+  {% if partitions %}
+    {% do run_query(merge_sql) %}
+  {% endif %}
+
+  {% set num_partitions = partitions | length %}
+  {% if num_partitions == 1 %}
+    {% do return('REPLACED 1 PARTITION') %}
+  {% else %}
+    {% do return('REPLACED ' ~ num_partitions ~ ' PARTITIONS') %}
+  {% endif %}
+{% endmacro %}
+
+
 {% materialization incremental, adapter='bigquery' -%}
 
   {%- set unique_key = config.get('unique_key') -%}
@@ -10,9 +93,15 @@
 
   {%- set partition_by = config.get('partition_by', none) -%}
   {%- set cluster_by = config.get('cluster_by', none) -%}
+  {%- set predicates = config.get('incremental_predicates', none) -%}
+
+  {#-- Validate early so we don't run SQL if the strategy is invalid --#}
+  {% set strategy = dbt_bigquery_validate_get_incremental_strategy(config) -%}
 
   {{ run_hooks(pre_hooks) }}
 
+  {% set build_status = none %}
+
   {% if existing_relation is none %}
       {% set build_sql = create_table_as(False, target_relation, sql) %}
   {% elif existing_relation.is_view %}
@@ -26,6 +115,12 @@
           {{ adapter.drop_relation(existing_relation) }}
       {% endif %}
       {% set build_sql = create_table_as(False, target_relation, sql) %}
+  {% elif strategy == 'insert_overwrite' %}
+     {% set dest_columns = adapter.get_columns_in_relation(existing_relation) %}
+     {#-- the temp table expires on its own if the merge fails, see bigquery_table_options --#}
+     {% do run_query(create_table_as(True, tmp_relation, sql)) %}
+     {% set build_status = bq_insert_overwrite(tmp_relation, target_relation, partition_by, dest_columns, predicates) %}
+     {% do adapter.drop_relation(tmp_relation) %}
   {% else %}
      {% set dest_columns = adapter.get_columns_in_relation(existing_relation) %}
 
@@ -35,12 +130,16 @@
          {{ sql }}
        )
      {%- endset -%}
-     {% set build_sql = get_merge_sql(target_relation, source_sql, unique_key, dest_columns) %}
+     {% set build_sql = get_merge_sql(target_relation, source_sql, unique_key, dest_columns, predicates) %}
   {% endif %}
 
-  {%- call statement('main') -%}
-    {{ build_sql }}
-  {% endcall %}
+  {% if build_status is not none %}
+    {{ store_result('main', status=build_status) }}
+  {% else %}
+    {%- call statement('main') -%}
+      {{ build_sql }}
+    {% endcall %}
+  {% endif %}
 
   {{ run_hooks(post_hooks) }}
 
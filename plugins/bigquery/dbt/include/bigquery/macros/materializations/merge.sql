@@ -1,3 +1,3 @@
-{% macro bigquery__get_merge_sql(target, source, unique_key, dest_columns) %}
-    {{ common_get_merge_sql(target, source, unique_key, dest_columns) }}
+{% macro bigquery__get_merge_sql(target, source, unique_key, dest_columns, predicates=none) %}
+    {{ common_get_merge_sql(target, source, unique_key, dest_columns, predicates) }}
 {% endmacro %}
@@ -83,6 +83,7 @@ class PostgresAdapter(SQLAdapter):
 
         self._link_cached_database_relations(schemas)
 
-    def _relations_cache_for_schemas(self, manifest):
-        super()._relations_cache_for_schemas(manifest)
+    def _relations_cache_for_schemas(self, manifest, new_schemas=(),
+                                     clear=False):
+        super()._relations_cache_for_schemas(manifest, new_schemas, clear)
         self._link_cached_relations(manifest)
@@ -72,6 +72,23 @@
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
+{% macro postgres__get_schema_fingerprint(information_schema, schema) %}
+  {#-- postgres doesn't track when relations change, so hash their names --#}
+  {% call statement('get_schema_fingerprint', fetch_result=True) -%}
+    select
+      count(*) as relation_count,
+      md5(coalesce(
+        string_agg(c.relname || ':' || c.relkind::text, ',' order by c.relname, c.relkind),
+        ''
+      )) as relations_hash
+    from pg_class c
+    join pg_namespace n on n.oid = c.relnamespace
+    where lower(n.nspname) = lower('{{ schema }}')
+      and c.relkind in ('r', 'p', 'v', 'm')
+  {% endcall %}
+  {{ return(load_result('get_schema_fingerprint').table) }}
+{% endmacro %}
+
 {% macro postgres__information_schema_name(database) -%}
   {% if database_name -%}
     {{ adapter.verify_database(database_name) }}
@@ -1,11 +1,42 @@
 
-{% macro postgres__get_catalog(information_schemas) -%}
+{% macro postgres__get_catalog(information_schema, schemas) -%}
+  {{ return(postgres__get_catalog_filtered(information_schema, schemas=schemas)) }}
+{%- endmacro %}
+
+
+{% macro postgres__get_catalog_relations(information_schema, relations) -%}
+  {{ return(postgres__get_catalog_filtered(information_schema, relations=relations)) }}
+{%- endmacro %}
+
+
+{% macro postgres__catalog_filter(schemas, relations) -%}
+  {%- if relations is not none -%}
+    (
+      {%- for relation in relations -%}
+        (upper(sch.nspname) = upper('{{ relation.schema }}') and upper(tbl.relname) = upper('{{ relation.identifier }}')){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+  {%- else -%}
+    (
+      {%- for schema in schemas -%}
+        upper(sch.nspname) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+  {%- endif %}
+      and sch.nspname != 'information_schema'
+      and sch.nspname not like 'pg_%' -- avoid postgres system schemas
+      and not pg_is_other_temp_schema(sch.oid) -- not a temporary schema belonging to another session
+      and tbl.relpersistence = 'p' -- [p]ermanent table. Other values are [u]nlogged table, [t]emporary table
+      and tbl.relkind in ('r', 'v', 'f', 'p') -- o[r]dinary table, [v]iew, [f]oreign table, [p]artitioned table. Other values are [i]ndex, [S]equence, [c]omposite type, [t]OAST table, [m]aterialized view
+      and col.attnum > 0 -- negative numbers are used for system columns such as oid
+      and not col.attisdropped -- column as not been dropped
+{%- endmacro %}
+
+
+{% macro postgres__get_catalog_filtered(information_schema, schemas=none, relations=none) -%}
 
   {%- call statement('catalog', fetch_result=True) -%}
-    {% if (information_schemas | length) != 1 %}
-        {{ exceptions.raise_compiler_error('postgres get_catalog requires exactly one database') }}
-    {% endif %}
-    {% set database = information_schemas[0].database %}
+    {% set database = information_schema.database %}
     {{ adapter.verify_database(database) }}
 
     select
@@ -27,13 +58,7 @@
     join pg_catalog.pg_class tbl on tbl.relnamespace = sch.oid
     join pg_catalog.pg_attribute col on col.attrelid = tbl.oid
 
-    where sch.nspname != 'information_schema'
-      and sch.nspname not like 'pg_%' -- avoid postgres system schemas
-      and not pg_is_other_temp_schema(sch.oid) -- not a temporary schema belonging to another session
-      and tbl.relpersistence = 'p' -- [p]ermanent table. Other values are [u]nlogged table, [t]emporary table
-      and tbl.relkind in ('r', 'v', 'f', 'p') -- o[r]dinary table, [v]iew, [f]oreign table, [p]artitioned table. Other values are [i]ndex, [S]equence, [c]omposite type, [t]OAST table, [m]aterialized view
-      and col.attnum > 0 -- negative numbers are used for system columns such as oid
-      and not col.attisdropped -- column as not been dropped
+    where {{ postgres__catalog_filter(schemas, relations) }}
 
     order by
         sch.nspname,
@@ -45,3 +70,38 @@
   {{ return(load_result('catalog').table) }}
 
 {%- endmacro %}
+
+
+{% macro postgres__get_catalog_fingerprints(information_schema, schemas) -%}
+
+  {%- call statement('catalog_fingerprints', fetch_result=True) -%}
+    {% set database = information_schema.database %}
+    {{ adapter.verify_database(database) }}
+
+    -- pg_stat_* doesn't see DDL, so hash the catalog metadata itself
+    select
+        '{{ database }}' as table_database,
+        sch.nspname as table_schema,
+        tbl.relname as table_name,
+        md5(
+            tbl.relkind::text || ':' ||
+            pg_get_userbyid(tbl.relowner) || ':' ||
+            string_agg(
+                col.attname || ' ' || pg_catalog.format_type(col.atttypid, col.atttypmod),
+                ',' order by col.attnum
+            )
+        ) as fingerprint
+
+    from pg_catalog.pg_namespace sch
+    join pg_catalog.pg_class tbl on tbl.relnamespace = sch.oid
+    join pg_catalog.pg_attribute col on col.attrelid = tbl.oid
+
+    where {{ postgres__catalog_filter(schemas, none) }}
+
+    group by sch.nspname, tbl.relname, tbl.relkind, tbl.relowner
+
+  {%- endcall -%}
+
+  {{ return(load_result('catalog_fingerprints').table) }}
+
+{%- endmacro %}
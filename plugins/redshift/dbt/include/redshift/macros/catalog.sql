@@ -1,10 +1,7 @@
 
-{% macro redshift__get_base_catalog(information_schemas) -%}
+{% macro redshift__get_base_catalog(information_schema, schemas) -%}
   {%- call statement('base_catalog', fetch_result=True) -%}
-    {% if (information_schemas | length) != 1 %}
-        {{ exceptions.raise_compiler_error('redshift get_catalog requires exactly one database') }}
-    {% endif %}
-    {% set database = information_schemas[0].database %}
+    {% set database = information_schema.database %}
     {{ adapter.verify_database(database) }}
 
     with late_binding as (
@@ -97,7 +94,12 @@
     from unioned
     join table_owners using (table_database, table_schema, table_name)
 
-    where table_schema != 'information_schema'
+    where (
+      {%- for schema in schemas -%}
+        upper(table_schema) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+      and table_schema != 'information_schema'
       and table_schema not like 'pg_%'
 
     order by "column_index"
@@ -106,7 +108,7 @@
   {{ return(load_result('base_catalog').table) }}
 {%- endmacro %}
 
-{% macro redshift__get_extended_catalog(information_schemas) %}
+{% macro redshift__get_extended_catalog(schemas) %}
   {%- call statement('extended_catalog', fetch_result=True) -%}
 
     select
@@ -183,6 +185,11 @@
         (skew_rows is not null) as "stats:skew_rows:include"
 
     from svv_table_info
+    where (
+      {%- for schema in schemas -%}
+        upper("schema") = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
 
   {%- endcall -%}
 
@@ -218,16 +225,16 @@
 {% endmacro %}
 
 
-{% macro redshift__get_catalog(information_schemas) %}
+{% macro redshift__get_catalog(information_schema, schemas) %}
 
     {#-- Compute a left-outer join in memory. Some Redshift queries are
       -- leader-only, and cannot be joined to other compute-based queries #}
 
-    {% set catalog = redshift__get_base_catalog(information_schemas) %}
+    {% set catalog = redshift__get_base_catalog(information_schema, schemas) %}
 
     {% set select_extended =  redshift__can_select_from('svv_table_info') %}
     {% if select_extended %}
-        {% set extended_catalog = redshift__get_extended_catalog() %}
+        {% set extended_catalog = redshift__get_extended_catalog(schemas) %}
         {% set catalog = catalog.join(extended_catalog, 'table_id') %}
     {% else %}
         {{ redshift__no_svv_table_info_warning() }}
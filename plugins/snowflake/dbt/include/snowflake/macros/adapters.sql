@@ -87,13 +87,26 @@
            else table_type
       end as table_type
     from {{ information_schema }}.tables
-    where table_schema ilike '{{ schema }}'
-      and table_catalog ilike '{{ information_schema.database.lower() }}'
+    where upper(table_schema) = upper('{{ schema }}')
+      and upper(table_catalog) = upper('{{ information_schema.database }}')
   {% endcall %}
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
 
+{% macro snowflake__get_schema_fingerprint(information_schema, schema) %}
+  {% call statement('get_schema_fingerprint', fetch_result=True) -%}
+    select
+      count(*) as relation_count,
+      max(last_altered) as last_altered
+    from {{ information_schema }}.tables
+    where upper(table_schema) = upper('{{ schema }}')
+      and upper(table_catalog) = upper('{{ information_schema.database }}')
+  {% endcall %}
+  {{ return(load_result('get_schema_fingerprint').table) }}
+{% endmacro %}
+
+
 {% macro snowflake__check_schema_exists(information_schema, schema) -%}
   {% call statement('check_schema_exists', fetch_result=True) -%}
         select count(*)
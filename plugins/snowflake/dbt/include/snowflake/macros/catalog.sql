@@ -1,68 +1,110 @@
 
-{% macro snowflake__get_catalog(information_schemas) -%}
+{% macro snowflake__get_catalog(information_schema, schemas) -%}
+  {{ return(snowflake__get_catalog_filtered(information_schema, schemas=schemas)) }}
+{%- endmacro %}
+
+
+{% macro snowflake__get_catalog_relations(information_schema, relations) -%}
+  {{ return(snowflake__get_catalog_filtered(information_schema, relations=relations)) }}
+{%- endmacro %}
+
+
+{% macro snowflake__catalog_filter(schemas, relations) -%}
+  {%- if relations is not none -%}
+    (
+      {%- for relation in relations -%}
+        (upper(table_schema) = upper('{{ relation.schema }}') and upper(table_name) = upper('{{ relation.identifier }}')){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+  {%- else -%}
+    (
+      {%- for schema in schemas -%}
+        upper(table_schema) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+  {%- endif -%}
+{%- endmacro %}
 
-    {%- call statement('catalog', fetch_result=True) -%}
-    {% for information_schema in information_schemas %}
 
-        (
-            with tables as (
+{% macro snowflake__get_catalog_filtered(information_schema, schemas=none, relations=none) -%}
 
-                select
-                    table_catalog as "table_database",
-                    table_schema as "table_schema",
-                    table_name as "table_name",
-                    table_type as "table_type",
+    {%- call statement('catalog', fetch_result=True) -%}
+        with tables as (
 
-                    -- note: this is the _role_ that owns the table
-                    table_owner as "table_owner",
+            select
+                table_catalog as "table_database",
+                table_schema as "table_schema",
+                table_name as "table_name",
+                table_type as "table_type",
 
-                    'Clustering Key' as "stats:clustering_key:label",
-                    clustering_key as "stats:clustering_key:value",
-                    'The key used to cluster this table' as "stats:clustering_key:description",
-                    (clustering_key is not null) as "stats:clustering_key:include",
+                -- note: this is the _role_ that owns the table
+                table_owner as "table_owner",
 
-                    'Row Count' as "stats:row_count:label",
-                    row_count as "stats:row_count:value",
-                    'An approximate count of rows in this table' as "stats:row_count:description",
-                    (row_count is not null) as "stats:row_count:include",
+                'Clustering Key' as "stats:clustering_key:label",
+                clustering_key as "stats:clustering_key:value",
+                'The key used to cluster this table' as "stats:clustering_key:description",
+                (clustering_key is not null) as "stats:clustering_key:include",
 
-                    'Approximate Size' as "stats:bytes:label",
-                    bytes as "stats:bytes:value",
-                    'Approximate size of the table as reported by Snowflake' as "stats:bytes:description",
-                    (bytes is not null) as "stats:bytes:include"
+                'Row Count' as "stats:row_count:label",
+                row_count as "stats:row_count:value",
+                'An approximate count of rows in this table' as "stats:row_count:description",
+                (row_count is not null) as "stats:row_count:include",
 
-                from {{ information_schema }}.tables
+                'Approximate Size' as "stats:bytes:label",
+                bytes as "stats:bytes:value",
+                'Approximate size of the table as reported by Snowflake' as "stats:bytes:description",
+                (bytes is not null) as "stats:bytes:include"
 
-            ),
+            from {{ information_schema }}.tables
+            where {{ snowflake__catalog_filter(schemas, relations) }}
 
-            columns as (
+        ),
 
-                select
-                    table_catalog as "table_database",
-                    table_schema as "table_schema",
-                    table_name as "table_name",
-                    null as "table_comment",
+        columns as (
 
-                    column_name as "column_name",
-                    ordinal_position as "column_index",
-                    data_type as "column_type",
-                    null as "column_comment"
+            select
+                table_catalog as "table_database",
+                table_schema as "table_schema",
+                table_name as "table_name",
+                null as "table_comment",
 
-                from {{ information_schema }}.columns
+                column_name as "column_name",
+                ordinal_position as "column_index",
+                data_type as "column_type",
+                null as "column_comment"
 
-            )
+            from {{ information_schema }}.columns
+            where {{ snowflake__catalog_filter(schemas, relations) }}
 
-            select *
-            from tables
-            join columns using ("table_database", "table_schema", "table_name")
-            where "table_schema" != 'INFORMATION_SCHEMA'
-            order by "column_index"
         )
-        {% if not loop.last %} union all {% endif %}
 
-    {% endfor %}
+        select *
+        from tables
+        join columns using ("table_database", "table_schema", "table_name")
+        where "table_schema" != 'INFORMATION_SCHEMA'
+        order by "column_index"
   {%- endcall -%}
 
   {{ return(load_result('catalog').table) }}
 
 {%- endmacro %}
+
+
+{% macro snowflake__get_catalog_fingerprints(information_schema, schemas) -%}
+
+    {%- call statement('catalog_fingerprints', fetch_result=True) -%}
+        -- last_altered moves on DDL and DML, which covers the row count and
+        -- size stats in the catalog too
+        select
+            table_catalog,
+            table_schema,
+            table_name,
+            coalesce(table_owner, '') || ':' || to_varchar(last_altered) as fingerprint
+        from {{ information_schema }}.tables
+        where {{ snowflake__catalog_filter(schemas, none) }}
+          and table_schema != 'INFORMATION_SCHEMA'
+  {%- endcall -%}
+
+  {{ return(load_result('catalog_fingerprints').table) }}
+
+{%- endmacro %}
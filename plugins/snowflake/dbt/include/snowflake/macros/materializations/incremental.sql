@@ -5,20 +5,24 @@
 
   {% set invalid_strategy_msg -%}
     Invalid incremental strategy provided: {{ strategy }}
-    Expected one of: 'merge', 'delete+insert'
+    Expected one of: 'merge', 'delete+insert', 'insert_overwrite'
   {%- endset %}
-  {% if strategy not in ['merge', 'delete+insert'] %}
+  {% if strategy not in ['merge', 'delete+insert', 'insert_overwrite'] %}
     {% do exceptions.raise_compiler_error(invalid_strategy_msg) %}
   {% endif %}
 
+  {% do incremental_validate_partition_by(strategy, config.get('partition_by')) %}
+
   {% do return(strategy) %}
 {% endmacro %}
 
-{% macro dbt_snowflake_get_incremental_sql(strategy, tmp_relation, target_relation, unique_key, dest_columns) %}
+{% macro dbt_snowflake_get_incremental_sql(strategy, tmp_relation, target_relation, unique_key, partition_by, dest_columns, predicates=none) %}
   {% if strategy == 'merge' %}
-    {% do return(get_merge_sql(target_relation, tmp_relation, unique_key, dest_columns)) %}
+    {% do return(get_merge_sql(target_relation, tmp_relation, unique_key, dest_columns, predicates)) %}
   {% elif strategy == 'delete+insert' %}
-    {% do return(get_delete_insert_merge_sql(target_relation, tmp_relation, unique_key, dest_columns)) %}
+    {% do return(get_delete_insert_merge_sql(target_relation, tmp_relation, unique_key, dest_columns, predicates)) %}
+  {% elif strategy == 'insert_overwrite' %}
+    {% do return(get_insert_overwrite_merge_sql(target_relation, tmp_relation, partition_by, dest_columns, predicates)) %}
   {% else %}
     {% do exceptions.raise_compiler_error('invalid strategy: ' ~ strategy) %}
   {% endif %}
@@ -27,6 +31,8 @@
 {% materialization incremental, adapter='snowflake' -%}
 
   {%- set unique_key = config.get('unique_key') -%}
+  {%- set partition_by = config.get('partition_by') -%}
+  {%- set predicates = config.get('incremental_predicates') -%}
   {%- set full_refresh_mode = (flags.FULL_REFRESH == True) -%}
 
   {% set target_relation = this %}
@@ -57,7 +63,7 @@
            from_relation=tmp_relation,
            to_relation=target_relation) %}
     {% set dest_columns = adapter.get_columns_in_relation(target_relation) %}
-    {% set build_sql = dbt_snowflake_get_incremental_sql(strategy, tmp_relation, target_relation, unique_key, dest_columns) %}
+    {% set build_sql = dbt_snowflake_get_incremental_sql(strategy, tmp_relation, target_relation, unique_key, partition_by, dest_columns, predicates) %}
   {% endif %}
 
   {%- call statement('main') -%}
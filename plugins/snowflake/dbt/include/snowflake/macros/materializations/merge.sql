@@ -1,4 +1,4 @@
-{% macro snowflake__get_merge_sql(target, source_sql, unique_key, dest_columns) -%}
+{% macro snowflake__get_merge_sql(target, source_sql, unique_key, dest_columns, predicates=none) -%}
 
     {#
        Workaround for Snowflake not being happy with a merge on a constant-false predicate.
@@ -18,7 +18,7 @@
 
     {%- else -%}
 
-        {{ common_get_merge_sql(target, source_sql, unique_key, dest_columns) }}
+        {{ common_get_merge_sql(target, source_sql, unique_key, dest_columns, predicates) }}
 
     {%- endif -%}
 
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""Simulate how long a run takes with each GraphQueue scheduling policy.
+
+The DAG and the node execution times come from a manifest.json and a
+run_results.json written by a previous run (or from a random DAG, with
+--synthetic). Each policy is replayed on a simulated clock at every thread
+count given, and the resulting makespans are printed:
+
+- "descendants": the default ordering, by number of blocking descendants.
+- "critical-path": the --critical-path ordering, by the longest remaining
+  chain of recorded execution time.
+
+The recorded times are both the history the critical-path policy schedules
+from and the durations it is replayed with, which is optimistic. Use --noise
+to perturb the replayed durations, as if the next run were a bit different.
+
+    python scripts/benchmarks/critical_path_schedule.py \\
+        --manifest target/manifest.json \\
+        --run-results target/run_results.json \\
+        --threads 1 4 8 16
+"""
+import argparse
+import heapq
+import json
+import random
+from queue import Empty
+from types import SimpleNamespace
+
+from dbt.linker import Linker
+from dbt.node_types import NodeType
+
+
+class FakeManifest:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def expect(self, unique_id):
+        return self.nodes[unique_id]
+
+
+def make_node(unique_id, resource_type, materialized):
+    return SimpleNamespace(
+        unique_id=unique_id,
+        resource_type=resource_type,
+        get_materialization=lambda: materialized,
+    )
+
+
+def load_recorded(manifest_path, run_results_path):
+    with open(manifest_path) as fp:
+        manifest = json.load(fp)
+    with open(run_results_path) as fp:
+        run_results = json.load(fp)
+
+    times = {
+        r['node']['unique_id']: float(r['execution_time'])
+        for r in run_results['results']
+    }
+    linker = Linker()
+    nodes = {}
+    for unique_id in times:
+        node = manifest['nodes'][unique_id]
+        nodes[unique_id] = make_node(
+            unique_id,
+            NodeType(node['resource_type']),
+            node.get('config', {}).get('materialized'),
+        )
+        linker.add_node(unique_id)
+        for parent in node.get('depends_on', {}).get('nodes', []):
+            if parent in times:
+                linker.dependency(unique_id, parent)
+    return linker, FakeManifest(nodes), times
+
+
+def make_synthetic(size, seed):
+    rng = random.Random(seed)
+    linker = Linker()
+    nodes = {}
+    times = {}
+    for idx in range(size):
+        unique_id = 'model.synthetic.m{}'.format(idx)
+        nodes[unique_id] = make_node(unique_id, NodeType.Model, 'table')
+        # most models are quick, a few are very slow
+        times[unique_id] = rng.lognormvariate(1.0, 1.5)
+        linker.add_node(unique_id)
+        if idx:
+            for parent in rng.sample(range(idx), min(idx, rng.randint(0, 3))):
+                linker.dependency(unique_id,
+                                  'model.synthetic.m{}'.format(parent))
+    return linker, FakeManifest(nodes), times
+
+
+def simulate(linker, manifest, durations, threads, execution_times):
+    queue = linker.as_graph_queue(manifest, execution_times=execution_times)
+    clock = 0.0
+    running = []
+    remaining = len(durations)
+    while remaining:
+        while len(running) < threads:
+            try:
+                node = queue.get(block=False)
+            except Empty:
+                break
+            heapq.heappush(
+                running, (clock + durations[node.unique_id], node.unique_id)
+            )
+        clock, unique_id = heapq.heappop(running)
+        queue.mark_done(unique_id)
+        remaining -= 1
+    return clock
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--manifest', default='target/manifest.json')
+    parser.add_argument('--run-results', default='target/run_results.json')
+    parser.add_argument('--synthetic', type=int, default=None,
+                        help='simulate a random DAG with this many models')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--noise', type=float, default=0.0,
+                        help='sigma of the lognormal factor applied to each '
+                             'replayed duration')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        linker, manifest, times = make_synthetic(args.synthetic, args.seed)
+    else:
+        linker, manifest, times = load_recorded(args.manifest,
+                                                args.run_results)
+
+    rng = random.Random(args.seed)
+    durations = {
+        unique_id: time * rng.lognormvariate(0.0, args.noise)
+        for unique_id, time in times.items()
+    }
+
+    print('{} nodes, {:.1f}s of total execution time'
+          .format(len(durations), sum(durations.values())))
+    print('{:>8} {:>14} {:>14} {:>8}'
+          .format('threads', 'descendants', 'critical-path', 'speedup'))
+    for threads in args.threads:
+        baseline = simulate(linker, manifest, durations, threads, None)
+        critical = simulate(linker, manifest, durations, threads, times)
+        print('{:>8} {:>13.1f}s {:>13.1f}s {:>7.2f}x'.format(
+            threads, baseline, critical, baseline / critical
+        ))
+
+
+if __name__ == '__main__':
+    main()
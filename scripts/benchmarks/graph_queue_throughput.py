@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Measure how quickly a GraphQueue hands out the nodes of a large DAG.
+
+Each node is run by a no-op runner, so the time measured is spent in the
+scheduler: building the queue, and then getting and marking done every node.
+The queue is drained both from a single thread, and from a thread pool the
+way GraphRunnableTask drains it (the main thread gets nodes, the workers mark
+them done).
+
+    python scripts/benchmarks/graph_queue_throughput.py --nodes 1000 15000
+"""
+import argparse
+import random
+import time
+from multiprocessing.dummy import Pool as ThreadPool
+from types import SimpleNamespace
+
+from dbt.linker import Linker
+from dbt.node_types import NodeType
+
+
+class FakeManifest:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def expect(self, unique_id):
+        return self.nodes[unique_id]
+
+
+def make_synthetic(size, seed):
+    """Build a random layered DAG, shaped like a test run: a few models, each
+    with many tests hanging off of it.
+    """
+    rng = random.Random(seed)
+    linker = Linker()
+    nodes = {}
+    models = []
+    for idx in range(size):
+        if not models or rng.random() < 0.1:
+            unique_id = 'model.synthetic.m{}'.format(idx)
+            resource_type = NodeType.Model
+        else:
+            unique_id = 'test.synthetic.t{}'.format(idx)
+            resource_type = NodeType.Test
+        nodes[unique_id] = SimpleNamespace(
+            unique_id=unique_id,
+            resource_type=resource_type,
+            config={},
+            get_materialization=lambda: 'table',
+        )
+        linker.add_node(unique_id)
+        for parent in rng.sample(models, min(len(models), rng.randint(0, 2))):
+            linker.dependency(unique_id, parent)
+        if resource_type == NodeType.Model:
+            models.append(unique_id)
+    return linker, FakeManifest(nodes)
+
+
+def drain_serial(queue):
+    while not queue.empty():
+        node = queue.get()
+        queue.mark_done(node.unique_id)
+    queue.join()
+
+
+def drain_pool(queue, threads):
+    pool = ThreadPool(threads)
+
+    def callback(unique_id):
+        queue.mark_done(unique_id)
+
+    try:
+        while not queue.empty():
+            node = queue.get()
+            pool.apply_async(lambda n: n.unique_id, args=(node,),
+                             callback=callback)
+        queue.join()
+    finally:
+        pool.close()
+        pool.join()
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--nodes', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print('{:>8} {:>10} {:>10} {:>10} {:>12}'.format(
+        'nodes', 'build', 'serial', 'pool', 'nodes/s'
+    ))
+    for size in args.nodes:
+        linker, manifest = make_synthetic(size, args.seed)
+        build, queue = timed(linker.as_graph_queue, manifest)
+        serial, _ = timed(drain_serial, queue)
+        pooled, _ = timed(drain_pool, linker.as_graph_queue(manifest),
+                          args.threads)
+        print('{:>8} {:>9.2f}s {:>9.2f}s {:>9.2f}s {:>12.0f}'.format(
+            size, build, serial, pooled, size / serial
+        ))
+
+
+if __name__ == '__main__':
+    main()
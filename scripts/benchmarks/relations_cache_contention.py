@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Measure contention on the adapter relations cache.
+
+Worker threads look like materializations: mostly `get_relations` calls, with
+some `add`/`rename`/`drop` calls in their own schema. While they run, one
+thread repopulates the cache with a simulated per-schema query latency, the
+way `set_relations_cache` does.
+
+The "held" mode replays the old population behavior for comparison: the
+cache lock is held across all of the population queries. The "bulk" mode is
+what `set_relations_cache` does now: run the queries first, then insert the
+results under one short hold of the lock.
+
+    python scripts/benchmarks/relations_cache_contention.py --threads 32
+"""
+import argparse
+import threading
+import time
+
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.cache import RelationsCache
+
+
+started = None
+
+
+def make_relation(schema, identifier):
+    return BaseRelation.create(
+        database='dbt', schema=schema, identifier=identifier
+    )
+
+
+def build_cache(schemas, relations_per_schema):
+    cache = RelationsCache()
+    for schema in schemas:
+        cache.add_relations(
+            [make_relation(schema, 'r{}'.format(i))
+             for i in range(relations_per_schema)],
+            [('dbt', schema)],
+        )
+    return cache
+
+
+def populate(cache, held, schemas, relations_per_schema, latency):
+    # building relations is slow, do it up front so only the cache is timed
+    results = {
+        schema: [make_relation(schema, 'p{}'.format(i))
+                 for i in range(relations_per_schema)]
+        for schema in schemas
+    }
+
+    def query(schema):
+        time.sleep(latency)
+        return results[schema]
+
+    started.wait()
+
+    searched = [('dbt', s) for s in schemas]
+    if held:
+        with cache.lock:
+            for schema in schemas:
+                for relation in query(schema):
+                    cache.add(relation)
+            cache.update_schemas(searched)
+    else:
+        relations = []
+        for schema in schemas:
+            relations.extend(query(schema))
+        cache.add_relations(relations, searched)
+
+
+def worker(cache, schema, name, iterations, write_every, think, latencies):
+    writes = {
+        idx: (make_relation(schema, '{}_{}__tmp'.format(name, idx)),
+              make_relation(schema, '{}_{}'.format(name, idx)))
+        for idx in range(0, iterations, write_every)
+    }
+    started.wait()
+    for idx in range(iterations):
+        start = time.perf_counter()
+        if idx in writes:
+            tmp, final = writes[idx]
+            cache.add(tmp)
+            cache.rename(tmp, final)
+            cache.drop(final)
+        else:
+            cache.get_relations('dbt', schema)
+        latencies.append(time.perf_counter() - start)
+        # the rest of a materialization is mostly waiting on the warehouse
+        time.sleep(think)
+
+
+def run(args, held):
+    global started
+    started = threading.Barrier(args.threads + 2)
+    schemas = ['schema_{}'.format(i) for i in range(args.schemas)]
+    cache = build_cache(schemas, args.relations)
+    latencies = []
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(cache, schemas[i % len(schemas)], 't{}'.format(i),
+                  args.iterations, args.write_every, args.think, latencies),
+        )
+        for i in range(args.threads)
+    ]
+    populator = threading.Thread(
+        target=populate,
+        args=(cache, held, schemas, args.relations, args.latency),
+    )
+
+    populator.start()
+    for thread in threads:
+        thread.start()
+    started.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    populator.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'elapsed': elapsed,
+        'ops/s': len(latencies) / elapsed,
+        'p50 ms': latencies[len(latencies) // 2] * 1000,
+        'p99 ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'max ms': latencies[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--schemas', type=int, default=16)
+    parser.add_argument('--relations', type=int, default=200,
+                        help='relations per schema')
+    parser.add_argument('--iterations', type=int, default=500,
+                        help='cache operations per thread')
+    parser.add_argument('--write-every', type=int, default=10)
+    parser.add_argument('--think', type=float, default=0.001,
+                        help='simulated seconds between cache operations')
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='simulated seconds per schema query')
+    args = parser.parse_args()
+
+    for name, held in (('held', True), ('bulk', False)):
+        result = run(args, held)
+        print('{:>4}: {}'.format(name, ', '.join(
+            '{}={:.2f}'.format(k, v) for k, v in result.items()
+        )))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+{# an override that does not take the predicates argument #}
+{% macro postgres__get_insert_overwrite_merge_sql(target, source, partition_by, dest_columns) -%}
+    {{ common_get_insert_overwrite_merge_sql(target, source, partition_by, dest_columns) }}
+{%- endmacro %}
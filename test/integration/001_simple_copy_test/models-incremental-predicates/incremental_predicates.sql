@@ -0,0 +1,22 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='id',
+        incremental_predicates=["updated_day > cast('2019-01-02' as date)"]
+    )
+}}
+
+{% if not is_incremental() %}
+
+select 1 as id, cast('2019-01-01' as date) as updated_day, 'initial' as status
+union all
+select 2 as id, cast('2019-01-05' as date) as updated_day, 'initial' as status
+
+{% else %}
+
+-- the target row for id 1 is outside of the predicate, so it is not replaced
+select 1 as id, cast('2019-01-01' as date) as updated_day, 'updated' as status
+union all
+select 2 as id, cast('2019-01-05' as date) as updated_day, 'updated' as status
+
+{% endif %}
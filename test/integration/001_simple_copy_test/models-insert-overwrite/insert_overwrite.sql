@@ -0,0 +1,33 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='insert_overwrite',
+        partition_by='updated_day',
+        incremental_predicates=var('predicates', none)
+    )
+}}
+
+{% if not is_incremental() %}
+
+select 1 as id, cast('2019-01-01' as date) as updated_day, 'initial' as status
+union all
+select 2 as id, cast('2019-01-01' as date) as updated_day, 'initial' as status
+union all
+select 3 as id, cast('2019-01-02' as date) as updated_day, 'initial' as status
+union all
+select 4 as id, cast('2019-01-02' as date) as updated_day, 'initial' as status
+union all
+select 7 as id, cast(null as date) as updated_day, 'initial' as status
+
+{% else %}
+
+-- only 2019-01-02 and the null partition are replaced, and 2019-01-03 is new
+select 5 as id, cast('2019-01-02' as date) as updated_day, 'updated' as status
+union all
+select 6 as id, cast('2019-01-03' as date) as updated_day, 'updated' as status
+{% if not var('without_nulls', false) %}
+union all
+select 8 as id, cast(null as date) as updated_day, 'updated' as status
+{% endif %}
+
+{% endif %}
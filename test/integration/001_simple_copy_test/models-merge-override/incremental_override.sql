@@ -0,0 +1,9 @@
+{{
+  config(
+    materialized='incremental',
+    incremental_strategy='insert_overwrite',
+    partition_by='id'
+  )
+}}
+
+select 1 as id, '{{ "updated" if is_incremental() else "initial" }}' as status
@@ -300,6 +300,142 @@ class TestSnowflakeIncrementalOverwrite(BaseTestSimpleCopy):
         self.assertEqual(len(results),  1)
 
 
+class TestIncrementalInsertOverwrite(BaseTestSimpleCopy):
+    @property
+    def models(self):
+        return self.dir("models-insert-overwrite")
+
+    def _partitions(self):
+        rows = self.run_sql(
+            """
+            select updated_day, count(*), min(status)
+            from {schema}.insert_overwrite
+            group by updated_day
+            """,
+            fetch='all'
+        )
+        # databases disagree on where nulls sort, so key by the partition
+        return {
+            (None if day is None else str(day)): (count, status)
+            for day, count, status in rows
+        }
+
+    def _check_insert_overwrite(self):
+        results = self.run_dbt(["run", "--models", "insert_overwrite"])
+        self.assertEqual(len(results),  1)
+        self.assertEqual(self._partitions(), {
+            '2019-01-01': (2, 'initial'),
+            '2019-01-02': (2, 'initial'),
+            None: (1, 'initial'),
+        })
+
+        results = self.run_dbt(["run", "--models", "insert_overwrite"])
+        self.assertEqual(len(results),  1)
+        self.assertEqual(self._partitions(), {
+            '2019-01-01': (2, 'initial'),
+            '2019-01-02': (1, 'updated'),
+            '2019-01-03': (1, 'updated'),
+            None: (1, 'updated'),
+        })
+
+        # without nulls in the source, the null partition is left alone
+        results = self.run_dbt(["run", "--models", "insert_overwrite",
+                                "--vars", "{without_nulls: true}"])
+        self.assertEqual(len(results),  1)
+        self.assertEqual(self._partitions(), {
+            '2019-01-01': (2, 'initial'),
+            '2019-01-02': (1, 'updated'),
+            '2019-01-03': (1, 'updated'),
+            None: (1, 'updated'),
+        })
+
+        results = self.run_dbt(["run", "--models", "missing_partition_by"],
+                               expect_pass=False)
+        self.assertIn('partition_by', results[0].error)
+
+    def _check_insert_overwrite_predicates(self):
+        self.run_dbt(["run", "--models", "insert_overwrite"])
+        # the predicates keep the null partition from being replaced
+        results = self.run_dbt([
+            "run", "--models", "insert_overwrite",
+            "--vars", "{predicates: ['updated_day is not null']}",
+        ])
+        self.assertEqual(len(results),  1)
+        self.assertEqual(self._partitions(), {
+            '2019-01-01': (2, 'initial'),
+            '2019-01-02': (1, 'updated'),
+            '2019-01-03': (1, 'updated'),
+            None: (2, 'initial'),
+        })
+
+    @use_profile("postgres")
+    def test__postgres__insert_overwrite(self):
+        self._check_insert_overwrite()
+
+    @use_profile("postgres")
+    def test__postgres__insert_overwrite_predicates(self):
+        self._check_insert_overwrite_predicates()
+
+    @use_profile("snowflake")
+    def test__snowflake__insert_overwrite(self):
+        self._check_insert_overwrite()
+
+    @use_profile("snowflake")
+    def test__snowflake__insert_overwrite_predicates(self):
+        self._check_insert_overwrite_predicates()
+
+    @use_profile("bigquery")
+    def test__bigquery__insert_overwrite(self):
+        self._check_insert_overwrite()
+
+    @use_profile("bigquery")
+    def test__bigquery__insert_overwrite_predicates(self):
+        self._check_insert_overwrite_predicates()
+
+
+class TestIncrementalPredicates(BaseTestSimpleCopy):
+    @property
+    def models(self):
+        return self.dir("models-incremental-predicates")
+
+    @use_profile("postgres")
+    def test__postgres__incremental_predicates(self):
+        self.run_dbt(["run"])
+        self.run_dbt(["run"])
+        rows = self.run_sql(
+            """
+            select id, status
+            from {schema}.incremental_predicates
+            order by id, status
+            """,
+            fetch='all'
+        )
+        self.assertEqual(
+            [tuple(row) for row in rows],
+            [(1, 'initial'), (1, 'updated'), (2, 'updated')]
+        )
+
+
+class TestMergeMacroOverride(BaseTestSimpleCopy):
+    @property
+    def models(self):
+        return self.dir("models-merge-override")
+
+    @property
+    def project_config(self):
+        return {"macro-paths": [self.dir("macros-merge-override")]}
+
+    @use_profile("postgres")
+    def test__postgres__merge_override_without_predicates(self):
+        self.run_dbt(["run"])
+        self.run_dbt(["run"])
+        rows = self.run_sql(
+            "select id, status from {schema}.incremental_override",
+            fetch='all'
+        )
+        self.assertEqual([tuple(row) for row in rows], [(1, 'updated')])
+
+
 class TestShouting(BaseTestSimpleCopy):
     @property
     def models(self):
@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+
+import dbt.exceptions
+from test.integration.base import DBTIntegrationTest, use_profile
+
+
+class TestStateSelection(DBTIntegrationTest):
+
+    @property
+    def schema(self):
+        return "graph_selection_tests_007"
+
+    @property
+    def models(self):
+        return "models"
+
+    def copy_state(self):
+        state_path = os.path.join(self.test_root_dir, 'state')
+        os.makedirs(state_path, exist_ok=True)
+        shutil.copyfile('target/manifest.json',
+                        os.path.join(state_path, 'manifest.json'))
+        return state_path
+
+    def list_models(self, selector, state_path, expect_pass=True):
+        results = self.run_dbt([
+            'ls', '--resource-type', 'model', '--output', 'name',
+            '--select', selector, '--state', state_path,
+        ], expect_pass=expect_pass)
+        return set(results)
+
+    @use_profile('postgres')
+    def test__postgres__state_modified(self):
+        self.run_sql_file("seed.sql")
+        self.run_dbt(['compile'])
+        state_path = self.copy_state()
+
+        # nothing changed, so nothing is selected
+        self.assertEqual(
+            self.list_models('state:modified', state_path, expect_pass=False),
+            set()
+        )
+
+        self.use_default_project({
+            'models': {'test': {'users': {'tags': 'changed'}}}
+        })
+        self.assertEqual(self.list_models('state:modified', state_path),
+                         {'users'})
+        self.assertEqual(
+            self.list_models('state:modified+', state_path),
+            {'users', 'users_rollup', 'users_rollup_dependency',
+             'emails_alt'}
+        )
+
+        results = self.run_dbt(['run', '--models', 'state:modified',
+                                '--state', state_path])
+        self.assertEqual([r.node.name for r in results], ['users'])
+
+    @use_profile('postgres')
+    def test__postgres__state_new(self):
+        self.run_dbt(['compile'])
+        state_path = self.copy_state()
+        manifest_path = os.path.join(state_path, 'manifest.json')
+        with open(manifest_path) as fp:
+            manifest = json.load(fp)
+        del manifest['nodes']['model.test.emails_alt']
+        with open(manifest_path, 'w') as fp:
+            json.dump(manifest, fp)
+
+        self.assertEqual(self.list_models('state:new', state_path),
+                         {'emails_alt'})
+        self.assertEqual(self.list_models('state:modified', state_path),
+                         {'emails_alt'})
+
+    @use_profile('postgres')
+    def test__postgres__state_modified_seed(self):
+        os.makedirs('data')
+        seed_path = os.path.join('data', 'seed_state.csv')
+        with open(seed_path, 'w') as fp:
+            fp.write('id,name\n1,Alice\n')
+        self.use_default_project({'data-paths': ['data']})
+        self.run_dbt(['compile'])
+        state_path = self.copy_state()
+
+        def list_seeds(expect_pass=True):
+            results = self.run_dbt([
+                'ls', '--resource-type', 'seed', '--output', 'name',
+                '--select', 'state:modified', '--state', state_path,
+            ], expect_pass=expect_pass)
+            return set(results)
+
+        self.assertEqual(list_seeds(expect_pass=False), set())
+
+        with open(seed_path, 'w') as fp:
+            fp.write('id,name\n1,Alice\n2,Bob\n')
+        self.assertEqual(list_seeds(), {'seed_state'})
+
+    @use_profile('postgres')
+    def test__postgres__state_selector_without_state(self):
+        with self.assertRaises(dbt.exceptions.RuntimeException) as exc:
+            self.run_dbt(['run', '--models', 'state:modified'])
+        self.assertIn('--state', str(exc.exception))
+
+
+class TestDeferState(DBTIntegrationTest):
+
+    @property
+    def schema(self):
+        return "graph_selection_tests_007"
+
+    @property
+    def models(self):
+        return "models"
+
+    @property
+    def other_schema(self):
+        return self.unique_schema() + '_other'
+
+    def use_other_schema(self):
+        # build into a different schema than the "previous" run
+        self.use_default_project({'models': {'test': {'schema': 'other'}}})
+        self._created_schemas.add(
+            self._get_schema_fqn(self.default_database, self.other_schema)
+        )
+
+    def compiled_sql(self, name):
+        path = os.path.join('target', 'compiled', 'test', name + '.sql')
+        with open(path) as fp:
+            return fp.read()
+
+    @use_profile('postgres')
+    def test__postgres__defer_state(self):
+        self.run_sql_file("seed.sql")
+        self.run_dbt(['run', '--models', '+users_rollup'])
+        state_path = os.path.join(self.test_root_dir, 'state')
+        shutil.copytree('target', state_path)
+
+        self.use_other_schema()
+
+        # without --defer, users doesn't exist in the new schema
+        self.run_dbt(['run', '--models', 'users_rollup'], expect_pass=False)
+
+        results = self.run_dbt(['run', '--models', 'users_rollup', '--defer',
+                                '--state', state_path])
+        self.assertEqual([r.node.name for r in results], ['users_rollup'])
+        self.assertIn(
+            '"{}"."users"'.format(self.unique_schema()),
+            self.compiled_sql('users_rollup')
+        )
+        self.assertTablesEqual('summary_expected', 'users_rollup',
+                               table_b_schema=self.other_schema)
+
+        # once users exists in the current target, it is used instead
+        self.run_sql('create table "{}"."users" as select * from "{}"."users"'
+                     .format(self.other_schema, self.unique_schema()))
+        self.run_dbt(['run', '--models', 'users_rollup', '--defer',
+                      '--state', state_path])
+        self.assertIn(
+            '"{}"."users"'.format(self.other_schema),
+            self.compiled_sql('users_rollup')
+        )
+
+    @use_profile('postgres')
+    def test__postgres__defer_without_state(self):
+        with self.assertRaises(dbt.exceptions.RuntimeException) as exc:
+            self.run_dbt(['run', '--defer'])
+        self.assertIn('--state', str(exc.exception))
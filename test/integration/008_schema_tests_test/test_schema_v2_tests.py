@@ -56,6 +56,49 @@ class TestSchemaTests(DBTIntegrationTest):
 
         self.assertEqual(sum(x.status for x in test_results), 6)
 
+class TestBatchedSchemaTests(TestSchemaTests):
+    def run_schema_validations(self, batch_size=None):
+        args = FakeArgs()
+        args.batch_size = batch_size
+
+        self.test_task = TestTask(args, self.config)
+        return self.test_task.run()
+
+    def assert_same_results(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        expected = {r.node.unique_id: r for r in expected}
+        for result in actual:
+            other = expected[result.node.unique_id]
+            self.assertEqual(result.status, other.status)
+            self.assertEqual(result.fail, other.fail)
+            self.assertEqual(result.error is None, other.error is None)
+
+    @use_profile('postgres')
+    def test_postgres_batched_schema_tests(self):
+        self.run_dbt()
+        unbatched = self.run_schema_validations()
+        batched = self.run_schema_validations(batch_size=3)
+        self.assert_same_results(unbatched, batched)
+        # every test ran as part of a batch
+        self.assertEqual(
+            set(self.test_task._batched_failures),
+            {r.node.unique_id for r in batched}
+        )
+
+        # every batch with a test on table_summary now fails, so those
+        # tests are retried one at a time
+        self.run_sql('drop table {schema}.table_summary')
+        unbatched = self.run_schema_validations()
+        self.assertTrue(any(r.error is not None for r in unbatched))
+        batched = self.run_schema_validations(batch_size=3)
+        self.assert_same_results(unbatched, batched)
+        for result in batched:
+            self.assertEqual(
+                result.node.unique_id in self.test_task._batched_failures,
+                result.error is None
+            )
+
+
 class TestMalformedSchemaTests(DBTIntegrationTest):
 
     def setUp(self):
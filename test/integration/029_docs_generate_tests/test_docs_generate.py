@@ -1120,10 +1120,7 @@ class TestDocsGenerate(DBTIntegrationTest):
                 },
                 normalize('seed/seed.csv'): {
                     'path': self._path_to('seed', 'seed.csv'),
-                    'checksum': {
-                        'name': 'path',
-                        'checksum': self._absolute_path_to('seed', 'seed.csv'),
-                    },
+                    'checksum': self._checksum_file('seed/seed.csv'),
                     'docs': [],
                     'macros': [],
                     'nodes': ['seed.test.seed'],
@@ -1603,10 +1600,7 @@ class TestDocsGenerate(DBTIntegrationTest):
                     'sources': [],
                 },
                 normalize('seed/seed.csv'): {
-                    'checksum': {
-                        'name': 'path',
-                        'checksum': self._absolute_path_to('seed', 'seed.csv'),
-                    },
+                    'checksum': self._checksum_file('seed/seed.csv'),
                     'docs': [],
                     'macros': [],
                     'nodes': ['seed.test.seed'],
@@ -2016,10 +2010,7 @@ class TestDocsGenerate(DBTIntegrationTest):
                     'sources': [],
                 },
                 normalize('seed/seed.csv'): {
-                    'checksum': {
-                        'name': 'path',
-                        'checksum': self._absolute_path_to('seed', 'seed.csv'),
-                    },
+                    'checksum': self._checksum_file('seed/seed.csv'),
                     'path': self._path_to('seed', 'seed.csv'),
                     'nodes': ['seed.test.seed'],
                     'patches': [],
@@ -2057,13 +2048,6 @@ class TestDocsGenerate(DBTIntegrationTest):
             'project_root': normalize(self.test_root_dir),
         }
 
-    def _absolute_path_to(self, searched_path: str, relative_path: str):
-        return os.path.join(
-            normalize(self.test_root_dir),
-            normalize(searched_path),
-            normalize(relative_path)
-        )
-
     def expected_redshift_incremental_view_manifest(self):
         model_sql_path = self.dir('rs_models/model.sql')
         my_schema_name = self.unique_schema()
@@ -2223,10 +2207,7 @@ class TestDocsGenerate(DBTIntegrationTest):
                     'sources': [],
                 },
                 normalize('seed/seed.csv'): {
-                    'checksum': {
-                        'name': 'path',
-                        'checksum': self._absolute_path_to('seed', 'seed.csv'),
-                    },
+                    'checksum': self._checksum_file('seed/seed.csv'),
                     'path': self._path_to('seed', 'seed.csv'),
                     'docs': [],
                     'macros': [],
@@ -2992,3 +2973,78 @@ class TestDocsGenerate(DBTIntegrationTest):
         self.verify_run_results(self.expected_run_results(
             model_database=self.default_database
         ))
+
+
+class TestIncrementalDocsGenerate(DBTIntegrationTest):
+    @property
+    def schema(self):
+        return 'docs_generate_029'
+
+    @property
+    def models(self):
+        return normalize('models')
+
+    @property
+    def project_config(self):
+        return {
+            'data-paths': [normalize('seed')],
+            'models': {
+                'vars': {'alternate_db': 'dbt'},
+            },
+        }
+
+    def generate(self, *args):
+        self.run_dbt(['docs', 'generate'] + list(args))
+        with open('./target/catalog.json') as fp:
+            return json.load(fp)['nodes']
+
+    def read_cache(self):
+        with open('./target/catalog_cache.json') as fp:
+            return json.load(fp)
+
+    def write_cache(self, cache):
+        with open('./target/catalog_cache.json', 'w') as fp:
+            json.dump(cache, fp)
+
+    @use_profile('postgres')
+    def test_postgres_incremental_catalog(self):
+        self.run_dbt(['seed'])
+        self.run_dbt(['run'])
+
+        full = self.generate()
+        self.assertEqual(self.generate('--incremental'), full)
+        cache = self.read_cache()
+        self.assertEqual(
+            sorted(r['name'] for r in cache['relations']),
+            ['model', 'seed']
+        )
+
+        # unchanged relations come from the cache, not the database
+        for relation in cache['relations']:
+            if relation['name'] == 'model':
+                for row in relation['rows']:
+                    row['column_type'] = 'tampered'
+        self.write_cache(cache)
+        nodes = self.generate('--incremental')
+        self.assertEqual(
+            nodes['model.test.model']['columns']['id']['type'], 'tampered'
+        )
+
+        # changed relations are queried again
+        self.run_sql('alter table {}.seed add column extra text'.format(
+            self.unique_schema()
+        ))
+        nodes = self.generate('--incremental')
+        self.assertIn('extra', nodes['seed.test.seed']['columns'])
+        self.assertEqual(
+            nodes['model.test.model']['columns']['id']['type'], 'tampered'
+        )
+
+        # a cache from another target is ignored
+        cache = self.read_cache()
+        cache['target_name'] = 'other'
+        self.write_cache(cache)
+        nodes = self.generate('--incremental')
+        self.assertEqual(
+            nodes['model.test.model']['columns']['id']['type'], 'integer'
+        )
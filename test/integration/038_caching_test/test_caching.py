@@ -1,3 +1,7 @@
+import copy
+import json
+import os
+
 from test.integration.base import DBTIntegrationTest, use_profile
 from dbt.adapters.factory import FACTORY
 
@@ -58,3 +62,67 @@ class TestCachingUppercaseModel(TestBaseCaching):
     @use_profile('postgres')
     def test_postgres_cache(self):
         self.cache_run()
+
+
+class TestPersistedCache(TestBaseCaching):
+    @property
+    def models(self):
+        return "models"
+
+    def snapshot_path(self):
+        return os.path.join(self.test_root_dir, 'target', 'relations_cache.json')
+
+    def cached_identifiers(self, adapter):
+        return {r.identifier for r in adapter.cache.relations.values()}
+
+    def add_fake_relation(self):
+        with open(self.snapshot_path()) as fp:
+            snapshot = json.load(fp)
+        self.assertEqual(len(snapshot['schemas']), 1)
+        schema = snapshot['schemas'][0]
+        self.assertEqual(schema['schema'], self.unique_schema())
+        self.assertEqual(len(schema['relations']), 1)
+
+        # a relation that only exists in the snapshot proves it was reused
+        fake = copy.deepcopy(schema['relations'][0])
+        fake['path']['identifier'] = 'only_in_snapshot'
+        schema['relations'].append(fake)
+        with open(self.snapshot_path(), 'w') as fp:
+            json.dump(snapshot, fp)
+
+    def persist_run(self):
+        self.run_dbt(['run', '--persist-cache'])
+        self.add_fake_relation()
+
+        self.run_dbt(['run', '--persist-cache'])
+        adapter = FACTORY.adapters[self.adapter_type]
+        self.assertIn('only_in_snapshot', self.cached_identifiers(adapter))
+
+        # changing the schema outside of dbt invalidates its fingerprint
+        self.run_sql('create table {schema}.outside_dbt as (select 1 as id)')
+        self.run_dbt(['run', '--persist-cache'])
+        adapter = FACTORY.adapters[self.adapter_type]
+        identifiers = self.cached_identifiers(adapter)
+        self.assertNotIn('only_in_snapshot', identifiers)
+        self.assertIn('outside_dbt', identifiers)
+
+        # without the flag, the snapshot is ignored
+        self.run_dbt(['run'])
+        adapter = FACTORY.adapters[self.adapter_type]
+        self.assertNotIn('only_in_snapshot', self.cached_identifiers(adapter))
+
+    @use_profile('postgres')
+    def test_postgres_persisted_cache(self):
+        self.persist_run()
+
+    @use_profile('postgres')
+    def test_postgres_persisted_cache_materialized_view(self):
+        self.run_dbt(['run', '--persist-cache'])
+        self.add_fake_relation()
+
+        self.run_sql(
+            'create materialized view {schema}.outside_dbt as (select 1 as id)'
+        )
+        self.run_dbt(['run', '--persist-cache'])
+        adapter = FACTORY.adapters[self.adapter_type]
+        self.assertNotIn('only_in_snapshot', self.cached_identifiers(adapter))
@@ -298,6 +298,23 @@ class TestSourceFreshnessErrors(SuccessfulSourcesTest):
         self.assertIsNotNone(results[0].error)
 
 
+class BatchedFreshnessMixin:
+    def run_dbt_with_vars(self, cmd, *args, **kwargs):
+        if cmd[:2] == ['source', 'snapshot-freshness']:
+            cmd = cmd + ['--batch-size', '10']
+        return super().run_dbt_with_vars(cmd, *args, **kwargs)
+
+
+class TestSourceFreshnessBatched(BatchedFreshnessMixin, TestSourceFreshness):
+    pass
+
+
+class TestSourceFreshnessErrorsBatched(BatchedFreshnessMixin,
+                                       TestSourceFreshnessErrors):
+    # the batch fails, so the source is retried on its own
+    pass
+
+
 class TestSourceFreshnessFilter(SuccessfulSourcesTest):
     @property
     def models(self):
@@ -0,0 +1 @@
+select * from {{ ref('ephemeral_parent') }}
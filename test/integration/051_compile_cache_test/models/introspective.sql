@@ -0,0 +1,5 @@
+{% if execute %}
+    {% set result = run_query('select 1 as id') %}
+{% endif %}
+
+select 1 as id
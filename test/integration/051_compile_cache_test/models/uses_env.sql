@@ -0,0 +1 @@
+select '{{ env_var("DBT_TEST_051_VALUE", "default") }}' as value
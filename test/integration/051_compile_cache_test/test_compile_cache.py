@@ -0,0 +1,67 @@
+import json
+import os
+
+from test.integration.base import DBTIntegrationTest, use_profile
+
+
+class TestCompileCache(DBTIntegrationTest):
+    @property
+    def schema(self):
+        return "compile_cache_051"
+
+    @property
+    def models(self):
+        return "models"
+
+    def tearDown(self):
+        os.environ.pop('DBT_TEST_051_VALUE', None)
+        super().tearDown()
+
+    def _cache_path(self):
+        return os.path.join('target', 'compile_cache.json')
+
+    def _read_cache(self):
+        with open(self._cache_path()) as fp:
+            return json.load(fp)
+
+    def _write_cache(self, data):
+        with open(self._cache_path(), 'w') as fp:
+            json.dump(data, fp)
+
+    def _selected(self, query):
+        return self.run_sql(query, fetch='one')[0]
+
+    @use_profile('postgres')
+    def test_postgres_compile_cache(self):
+        self.run_dbt(['run', '--compile-cache'])
+        nodes = self._read_cache()['nodes']
+        self.assertIn('model.test.cached', nodes)
+        self.assertIn('model.test.uses_env', nodes)
+        self.assertIn('model.test.ephemeral_parent', nodes)
+        self.assertNotIn('model.test.introspective', nodes)
+        self.assertEqual(
+            nodes['model.test.cached']['extra_ctes'],
+            ['model.test.ephemeral_parent']
+        )
+
+        # prove that the cached SQL is used, by changing it
+        data = self._read_cache()
+        data['nodes']['model.test.cached']['compiled_sql'] = 'select 2 as id'
+        self._write_cache(data)
+        self.run_dbt(['run', '--compile-cache'])
+        self.assertEqual(
+            self._selected('select id from {schema}.cached'), 2
+        )
+
+        # a change to the vars invalidates everything
+        self.run_dbt(['run', '--compile-cache', '--vars', '{"x": 1}'])
+        self.assertEqual(
+            self._selected('select id from {schema}.cached'), 1
+        )
+
+        # so does a change to an env var the node read
+        os.environ['DBT_TEST_051_VALUE'] = 'changed'
+        self.run_dbt(['run', '--compile-cache', '--vars', '{"x": 1}'])
+        self.assertEqual(
+            self._selected('select value from {schema}.uses_env'), 'changed'
+        )
@@ -31,6 +31,65 @@ def test_rpc_basics(project_root, profiles_root, postgres_profile, unique_schema
         querier.is_error(querier.async_wait(token))
 
 
+def test_rpc_compile_sql_batch(project_root, profiles_root, postgres_profile, unique_schema):
+    project = ProjectDefinition(
+        models={
+            'my_model.sql': 'select 1 as id',
+            'ephemeral_model.sql': '{{ config(materialized="ephemeral") }} select 2 as id',
+        }
+    )
+    querier_ctx = get_querier(
+        project_def=project,
+        project_dir=project_root,
+        profiles_dir=profiles_root,
+        schema=unique_schema,
+        test_kwargs={},
+    )
+
+    with querier_ctx as querier:
+        token = querier.is_async_result(querier.compile_sql_batch([
+            ('first', 'select * from {{ ref("my_model") }}'),
+            ('second', 'select * from {{ ref("ephemeral_model") }}'),
+            ('third', '{% macro my_id() %}3{% endmacro %}select {{ my_id() }} as id'),
+        ]))
+        result = querier.is_result(querier.async_wait(token))
+        assert len(result['results']) == 3
+        # results come back in request order
+        names = [r['node']['name'] for r in result['results']]
+        assert names == ['first', 'second', 'third']
+        assert 'my_model' in result['results'][0]['compiled_sql']
+        assert '__dbt__CTE__ephemeral_model' in result['results'][1]['compiled_sql']
+        assert result['results'][2]['compiled_sql'] == 'select 3 as id'
+
+        token = querier.is_async_result(querier.compile_sql_batch([
+            ('ok', 'select 1 as id'),
+            ('bad', 'select * from {{ reff("my_model") }}'),
+        ]))
+        querier.is_error(querier.async_wait(token))
+
+        # macros only apply to the query that defines them
+        token = querier.is_async_result(querier.compile_sql_batch([
+            ('three', '{% macro my_id() %}3{% endmacro %}select {{ my_id() }} as id'),
+            ('four', '{% macro my_id() %}4{% endmacro %}select {{ my_id() }} as id'),
+        ]))
+        result = querier.is_result(querier.async_wait(token))
+        compiled = [r['compiled_sql'] for r in result['results']]
+        assert compiled == ['select 3 as id', 'select 4 as id']
+
+        token = querier.is_async_result(querier.compile_sql_batch([
+            ('defines', '{% macro my_id() %}3{% endmacro %}select {{ my_id() }} as id'),
+            ('uses', 'select {{ my_id() }} as id'),
+        ]))
+        querier.is_error(querier.async_wait(token))
+
+        # names have to be unique within a batch
+        token = querier.is_async_result(querier.compile_sql_batch([
+            ('same', 'select 1 as id'),
+            ('same', 'select 2 as id'),
+        ]))
+        querier.is_error(querier.async_wait(token))
+
+
 def deps_with_packages(packages, bad_packages, project_dir, profiles_dir, schema):
     project = ProjectDefinition(
         models={
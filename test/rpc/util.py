@@ -7,7 +7,7 @@ import signal
 import socket
 import time
 from contextlib import contextmanager
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 
 import requests
 import yaml
@@ -301,6 +301,24 @@ class Querier:
             method='compile_sql', params=params, request_id=request_id
         )
 
+    def compile_sql_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        request_id: int = 1,
+    ):
+        params = {
+            'queries': [
+                {
+                    'name': name,
+                    'sql': base64.b64encode(sql.encode('utf-8')).decode('utf-8'),
+                }
+                for name, sql in queries
+            ],
+        }
+        return self.request(
+            method='compile_sql_batch', params=params, request_id=request_id
+        )
+
     def run_sql(
         self,
         sql: str,
@@ -63,3 +63,21 @@ class TestAgateHelper(unittest.TestCase):
         self.assertEqual(len(tbl), len(EXPECTED))
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_merge_tables(self):
+        first = agate_helper.table_from_data(
+            [{'a': 1, 'b': None}, {'a': 2, 'b': None}], ['a', 'b']
+        )
+        second = agate_helper.table_from_data(
+            [{'a': 3, 'b': 'text', 'c': 'extra'}], ['a', 'b', 'c']
+        )
+        tbl = agate_helper.merge_tables([first, second])
+        self.assertEqual(tbl.column_names, ('a', 'b', 'c'))
+        self.assertEqual(
+            [list(row) for row in tbl],
+            [[1, None, None], [2, None, None], [3, 'text', 'extra']]
+        )
+
+    def test_merge_no_tables(self):
+        tbl = agate_helper.merge_tables([])
+        self.assertEqual(len(tbl), 0)
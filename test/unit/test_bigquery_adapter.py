@@ -7,6 +7,7 @@ import dbt.flags as flags
 
 from dbt.adapters.bigquery import BigQueryAdapter
 from dbt.adapters.bigquery import BigQueryRelation
+from dbt.adapters.bigquery.connections import JobPoller
 import dbt.exceptions
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 
@@ -276,3 +277,74 @@ class TestBigQueryRelation(unittest.TestCase):
         }
         with self.assertRaises(hologram.ValidationError):
             BigQueryRelation.from_dict(kwargs)
+
+
+class FakeJob:
+    def __init__(self, polls_until_done, error_result=None, errors=None):
+        self.polls_until_done = polls_until_done
+        self.reloads = 0
+        self.error_result = error_result
+        self.errors = errors or []
+
+    @property
+    def state(self):
+        if self.reloads >= self.polls_until_done:
+            return 'DONE'
+        return 'RUNNING'
+
+    def reload(self):
+        self.reloads += 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestJobPoller(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.poller = JobPoller(
+            initial_delay=0.1, max_delay=1.0, multiplier=2.0,
+            sleep=self.clock.sleep, clock=self.clock,
+        )
+
+    def test_done_job_is_not_polled(self):
+        job = FakeJob(0)
+        self.poller.wait(job, timeout=10)
+        self.assertEqual(job.reloads, 0)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_backoff(self):
+        job = FakeJob(7)
+        self.poller.wait(job, timeout=10)
+        self.assertEqual(job.reloads, 7)
+        self.assertEqual(self.clock.sleeps, [0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+    def test_timeout(self):
+        job = FakeJob(1000)
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            self.poller.wait(job, timeout=2.5)
+        self.assertAlmostEqual(self.clock.now, 2.5)
+
+    def test_no_timeout(self):
+        job = FakeJob(100)
+        self.poller.wait(job)
+        self.assertEqual(job.reloads, 100)
+
+    def test_poll_until_job_completes_error(self):
+        adapter = MagicMock()
+        adapter.connections.job_poller = self.poller
+        job = FakeJob(2, error_result={'reason': 'invalid'},
+                      errors=[{'message': ' bad query '}])
+        with self.assertRaises(dbt.exceptions.RuntimeException) as exc:
+            BigQueryAdapter.poll_until_job_completes(adapter, job, 10)
+        self.assertIn('bad query', str(exc.exception))
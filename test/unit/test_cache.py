@@ -1,10 +1,12 @@
 from unittest import TestCase
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import IntrospectionCache, RelationsCache
 from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
 
 import random
+import sys
+import threading
 import time
 
 
@@ -239,6 +241,25 @@ class TestAdd(TestCache):
         self.assertEqual(self.cache.schemas, {('dbt', 'foo')})
         self.assert_relations_exist('dbt', 'foo', 'bar')
 
+    def test_add_relations(self):
+        self.cache.add_relations(
+            [make_relation('dbt', 'foo', 'baz'), make_relation('DBT', 'FOO', 'qux')],
+            [('dbt', 'foo'), ('dbt', 'empty')],
+        )
+        self.assertEqual(len(self.cache.get_relations('dbt', 'foo')), 3)
+        self.assertEqual(len(self.cache.get_relations('dbt', 'empty')), 0)
+        self.assertIn(('dbt', 'empty'), self.cache)
+        self.assertEqual(self.cache.schemas, {('dbt', 'foo'), ('dbt', 'empty')})
+
+    def test_add_relations_clear(self):
+        self.cache.add_relations(
+            [make_relation('dbt', 'other', 'baz')], [('dbt', 'other')],
+            clear=True,
+        )
+        self.assertEqual(len(self.cache.get_relations('dbt', 'foo')), 0)
+        self.assertEqual(self.cache.schemas, {('dbt', 'other')})
+        self.assert_relations_exist('dbt', 'other', 'baz')
+
     def add_uppercase_schema(self):
         self.cache.add(make_relation('dbt', 'FOO', 'baz'))
 
@@ -260,6 +281,60 @@ class TestAdd(TestCache):
         self.assertIsNot(self.cache.relations[('dbt_2', 'foo', 'bar')].inner, None)
 
 
+class TestReadWriteLock(TestCase):
+    def setUp(self):
+        self.lock = RelationsCache().lock
+
+    def _in_thread(self, func, timeout=5):
+        thread = threading.Thread(target=func, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def test_readers_share(self):
+        with self.lock.read():
+            self.assertTrue(self._in_thread(self.lock.acquire_read))
+        # the other thread still holds its read
+        self.assertFalse(self._in_thread(self.lock.acquire_write, 0.1))
+
+    def test_writer_excludes_readers(self):
+        read = threading.Event()
+
+        def reader():
+            with self.lock.read():
+                read.set()
+
+        with self.lock:
+            thread = threading.Thread(target=reader, daemon=True)
+            thread.start()
+            self.assertFalse(read.wait(0.1))
+        self.assertTrue(read.wait(5))
+
+    def test_waiting_writer_blocks_new_readers(self):
+        self.lock.acquire_read()
+        writer = threading.Thread(target=self.lock.acquire_write, daemon=True)
+        writer.start()
+        while not self.lock._waiting_writers:
+            time.sleep(0.01)
+        self.assertFalse(self._in_thread(self.lock.acquire_read, 0.1))
+        self.lock.release_read()
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+
+    def test_reentrant(self):
+        with self.lock, self.lock, self.lock.read():
+            pass
+        with self.lock.read(), self.lock.read():
+            pass
+        self.assertTrue(self._in_thread(self.lock.acquire_write))
+
+    def test_no_upgrade(self):
+        with self.lock.read():
+            with self.assertRaises(dbt.exceptions.InternalException):
+                self.lock.acquire_write()
+        self.assertTrue(self._in_thread(self.lock.acquire_write))
+
+
 class TestLikeDbt(TestCase):
     def setUp(self):
         self.cache = RelationsCache()
@@ -486,3 +561,149 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+    def test_schema_index_consistent(self):
+        def assert_consistent():
+            indexed = {}
+            for (db, schema), bucket in self.cache._schema_index.items():
+                self.assertTrue(bucket, 'empty bucket for {}.{}'.format(db, schema))
+                for key, relation in bucket.items():
+                    self.assertEqual((key.database, key.schema), (db, schema))
+                    indexed[key] = relation
+            self.assertEqual(indexed, self.cache.relations)
+
+        assert_consistent()
+        self.cache.add(make_relation('DBT', 'FOO', 'TABLE5'))
+        assert_consistent()
+        self.cache.rename(make_relation('dbt', 'foo', 'table3'),
+                          make_relation('dbt_2', 'baz', 'table3'))
+        assert_consistent()
+        self.assertEqual(len(self.cache.get_relations('dbt_2', 'baz')), 1)
+        self.cache.drop(make_relation('dbt', 'foo', 'table1'))
+        assert_consistent()
+        self.assertNotIn(('dbt_2', 'baz'), self.cache._schema_index)
+        self.cache.clear()
+        assert_consistent()
+        self.assertEqual(self.cache._schema_index, {})
+
+
+class TestDeepCache(TestCase):
+    def setUp(self):
+        self.cache = RelationsCache()
+
+    def test_drop_deep_chain(self):
+        # each view refers to the one before it - deeper than the default
+        # recursion limit
+        depth = sys.getrecursionlimit() + 100
+        for idx in range(depth):
+            self.cache.add(make_relation('dbt', 'schema', 'v{}'.format(idx)))
+        for idx in range(1, depth):
+            self.cache.add_link(
+                make_relation('dbt', 'schema', 'v{}'.format(idx - 1)),
+                make_relation('dbt', 'schema', 'v{}'.format(idx)),
+            )
+        self.cache.add(make_relation('dbt', 'schema', 'other'))
+
+        self.cache.drop(make_relation('dbt', 'schema', 'v1'))
+        remaining = self.cache.get_relations('dbt', 'schema')
+        self.assertEqual({r.identifier for r in remaining}, {'v0', 'other'})
+        self.assertEqual(self.cache.relations[('dbt', 'schema', 'v0')].referenced_by, {})
+
+    def test_drop_diamond(self):
+        # b and c both refer to a, d refers to both b and c
+        for ident in 'abcde':
+            self.cache.add(make_relation('dbt', 'schema', ident))
+        for referenced, dependent in ('ab', 'ac', 'bd', 'cd', 'ce'):
+            self.cache.add_link(make_relation('dbt', 'schema', referenced),
+                                make_relation('dbt', 'schema', dependent))
+
+        consequences = self.cache.relations[('dbt', 'schema', 'b')].collect_consequences()
+        self.assertEqual({k.identifier for k in consequences}, {'b', 'd'})
+
+        self.cache.drop(make_relation('dbt', 'schema', 'b'))
+        remaining = self.cache.get_relations('dbt', 'schema')
+        self.assertEqual({r.identifier for r in remaining}, {'a', 'c', 'e'})
+        a = self.cache.relations[('dbt', 'schema', 'a')]
+        c = self.cache.relations[('dbt', 'schema', 'c')]
+        self.assertEqual({k.identifier for k in a.referenced_by}, {'c'})
+        self.assertEqual({k.identifier for k in c.referenced_by}, {'e'})
+        self.assertEqual({k.identifier for k in c.references}, {'a'})
+
+    def test_rename_updates_references(self):
+        for ident in 'abc':
+            self.cache.add(make_relation('dbt', 'schema', ident))
+        self.cache.add_link(make_relation('dbt', 'schema', 'a'),
+                            make_relation('dbt', 'schema', 'b'))
+        self.cache.add_link(make_relation('dbt', 'schema', 'b'),
+                            make_relation('dbt', 'schema', 'c'))
+
+        self.cache.rename(make_relation('dbt', 'schema', 'b'),
+                          make_relation('dbt', 'schema', 'b2'))
+        a = self.cache.relations[('dbt', 'schema', 'a')]
+        b2 = self.cache.relations[('dbt', 'schema', 'b2')]
+        c = self.cache.relations[('dbt', 'schema', 'c')]
+        self.assertEqual({k.identifier for k in a.referenced_by}, {'b2'})
+        self.assertEqual({k.identifier for k in b2.references}, {'a'})
+        self.assertEqual({k.identifier for k in c.references}, {'b2'})
+
+        self.cache.drop(make_relation('dbt', 'schema', 'b2'))
+        self.assertEqual(
+            {r.identifier for r in self.cache.get_relations('dbt', 'schema')},
+            {'a'}
+        )
+        self.assertEqual(a.referenced_by, {})
+
+
+class TestIntrospectionCache(TestCase):
+    def setUp(self):
+        self.cache = IntrospectionCache()
+        self.columns = {'relation': make_relation('dbt', 'foo', 'bar')}
+        self.exists = {'database': 'dbt', 'schema': 'FOO'}
+        self.schemas = {'database': 'DBT'}
+        for name, arguments in (('columns', self.columns),
+                                ('exists', self.exists),
+                                ('schemas', self.schemas)):
+            key = self.cache.make_key(name, arguments)
+            self.cache.set(key, [name], self.cache.describes(arguments))
+
+    def assert_cached(self, name, arguments, expect=True):
+        found, value = self.cache.get(self.cache.make_key(name, arguments))
+        self.assertEqual(found, expect)
+        if expect:
+            self.assertEqual(value, [name])
+
+    def test_keys_ignore_case(self):
+        self.assert_cached('columns', {
+            'relation': make_relation('DBT', 'Foo', 'BAR')
+        })
+        self.assert_cached('exists', {'database': 'DBT', 'schema': 'foo'})
+
+    def test_unhashable_arguments(self):
+        self.assertIsNone(self.cache.make_key('x', {'columns': []}))
+
+    def test_values_are_copied(self):
+        _, value = self.cache.get(self.cache.make_key('columns', self.columns))
+        value.append('extra')
+        self.assert_cached('columns', self.columns)
+
+    def test_invalidate_other_relation(self):
+        self.cache.invalidate(make_relation('dbt', 'foo', 'baz'))
+        self.assert_cached('columns', self.columns)
+        self.assert_cached('schemas', self.schemas)
+
+    def test_invalidate_relation(self):
+        self.cache.invalidate(make_relation('dbt', 'FOO', 'Bar'))
+        self.assert_cached('columns', self.columns, False)
+        self.assert_cached('schemas', self.schemas)
+
+    def test_invalidate_schema(self):
+        self.cache.invalidate(make_relation('dbt', 'foo', None))
+        self.assert_cached('columns', self.columns, False)
+        self.assert_cached('exists', self.exists, False)
+        self.assert_cached('schemas', self.schemas, False)
+
+    def test_invalidate_other_database(self):
+        self.cache.invalidate(make_relation('other', 'foo', None))
+        self.assert_cached('columns', self.columns)
+        self.assert_cached('exists', self.exists)
+        self.assert_cached('schemas', self.schemas)
@@ -0,0 +1,189 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from dbt.clients.jinja import RenderTracker
+from dbt.compile_cache import CompileCache
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import (
+    DependsOn, MacroDependsOn, NodeConfig, ParsedMacro, ParsedModelNode
+)
+from dbt.node_types import NodeType
+
+from .utils import config_from_parts_or_dicts
+
+
+class CompileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.target_path = tempfile.mkdtemp()
+        self.project = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': os.path.abspath('.'),
+            'target-path': self.target_path,
+        }
+        self.profile = {
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'dbname': 'postgres',
+                    'user': 'root',
+                    'host': 'thishostshouldnotexist',
+                    'pass': 'password',
+                    'port': 5432,
+                    'schema': 'public'
+                }
+            },
+            'target': 'test'
+        }
+        self.config = config_from_parts_or_dicts(self.project, self.profile)
+        self.manifest = Manifest(
+            macros={'macro.root.my_macro': self._macro('select 1')},
+            nodes={
+                'model.root.parent': self._model('parent', 'select 1'),
+                'model.root.child': self._model(
+                    'child', "select * from {{ ref('parent') }}",
+                    depends_on=['model.root.parent'],
+                ),
+            },
+            docs={},
+            generated_at=None,
+            disabled=[],
+            files={},
+        )
+        self.node = self.manifest.nodes['model.root.child']
+        self.compiled = SimpleNamespace(
+            compiled_sql='select * from "dbt"."analytics"."parent"',
+            extra_ctes=[],
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.target_path)
+
+    def _macro(self, sql):
+        return ParsedMacro(
+            name='my_macro',
+            path='macros.sql',
+            original_file_path='macros.sql',
+            package_name='root',
+            raw_sql='{% macro my_macro() %}' + sql + '{% endmacro %}',
+            root_path='/usr/src/app',
+            resource_type=NodeType.Macro,
+            unique_id='macro.root.my_macro',
+            tags=[],
+            depends_on=MacroDependsOn(),
+        )
+
+    def _model(self, name, sql, depends_on=()):
+        return ParsedModelNode(
+            name=name,
+            database='dbt',
+            schema='analytics',
+            alias=name,
+            resource_type=NodeType.Model,
+            unique_id='model.root.{}'.format(name),
+            fqn=['root', name],
+            package_name='root',
+            refs=[],
+            sources=[],
+            depends_on=DependsOn(nodes=list(depends_on)),
+            config=NodeConfig(),
+            tags=[],
+            path=name + '.sql',
+            original_file_path=name + '.sql',
+            root_path='/usr/src/app',
+            raw_sql=sql,
+        )
+
+    def _tracker(self, env_vars=None):
+        tracker = RenderTracker()
+        tracker.macros.add('macro.root.my_macro')
+        tracker.env_vars.update(env_vars or {})
+        return tracker
+
+    def _reloaded(self, cache, config=None):
+        cache.write()
+        return CompileCache.load(config or self.config, self.manifest)
+
+    def test_hit_after_reload(self):
+        cache = CompileCache(self.config, self.manifest)
+        self.assertIsNone(cache.get(self.node))
+        cache.put(self.node, self.compiled, self._tracker())
+
+        entry = self._reloaded(cache).get(self.node)
+        self.assertEqual(entry.compiled_sql, self.compiled.compiled_sql)
+        self.assertEqual(entry.macros, {
+            'macro.root.my_macro': mock.ANY,
+        })
+
+    def test_macro_changed(self):
+        cache = CompileCache(self.config, self.manifest)
+        cache.put(self.node, self.compiled, self._tracker())
+        cache.write()
+
+        self.manifest.macros['macro.root.my_macro'] = self._macro('select 2')
+        reloaded = CompileCache.load(self.config, self.manifest)
+        self.assertIsNone(reloaded.get(self.node))
+
+    def test_parent_relation_changed(self):
+        cache = CompileCache(self.config, self.manifest)
+        cache.put(self.node, self.compiled, self._tracker())
+        cache.write()
+
+        parent = self.manifest.nodes['model.root.parent']
+        self.manifest.nodes['model.root.parent'] = parent.replace(
+            alias='renamed'
+        )
+        reloaded = CompileCache.load(self.config, self.manifest)
+        self.assertIsNone(reloaded.get(self.node))
+
+    def test_parent_sql_changed(self):
+        cache = CompileCache(self.config, self.manifest)
+        cache.put(self.node, self.compiled, self._tracker())
+        cache.write()
+
+        parent = self.manifest.nodes['model.root.parent']
+        self.manifest.nodes['model.root.parent'] = parent.replace(
+            raw_sql='select 2'
+        )
+        reloaded = CompileCache.load(self.config, self.manifest)
+        self.assertIsNotNone(reloaded.get(self.node))
+
+    def test_vars_changed(self):
+        cache = CompileCache(self.config, self.manifest)
+        cache.put(self.node, self.compiled, self._tracker())
+
+        config = config_from_parts_or_dicts(self.project, self.profile,
+                                            cli_vars='{"x": 1}')
+        self.assertIsNone(self._reloaded(cache, config).get(self.node))
+
+    def test_env_var_changed(self):
+        tracker = self._tracker({'DBT_TEST_COMPILE_CACHE': 'a'})
+        with mock.patch.dict(os.environ, {'DBT_TEST_COMPILE_CACHE': 'a'}):
+            cache = CompileCache(self.config, self.manifest)
+            cache.put(self.node, self.compiled, tracker)
+            self.assertIsNotNone(cache.get(self.node))
+        with mock.patch.dict(os.environ, {'DBT_TEST_COMPILE_CACHE': 'b'}):
+            self.assertIsNone(cache.get(self.node))
+
+    def test_introspective_node_not_cached(self):
+        cache = CompileCache(self.config, self.manifest)
+        cache.put(self.node, self.compiled, self._tracker())
+        self.assertIsNotNone(cache.get(self.node))
+
+        tracker = self._tracker()
+        tracker.mark_uncacheable('adapter.get_relation')
+        cache.put(self.node, self.compiled, tracker)
+        self.assertIsNone(cache.get(self.node))
+
+    def test_volatile_macro_not_cached(self):
+        self.manifest.macros['macro.root.my_macro'] = self._macro(
+            "select '{{ run_started_at }}'"
+        )
+        cache = CompileCache(self.config, self.manifest)
+        cache.put(self.node, self.compiled, self._tracker())
+        self.assertIsNone(cache.get(self.node))
@@ -738,6 +738,14 @@ class TestProject(BaseConfigTest):
         with self.assertRaises(dbt.exceptions.DbtProjectError):
             dbt.config.Project.from_project_config(self.default_project_data)
 
+    def test_invalid_concurrency_groups(self):
+        for limit in ('1', 0):
+            self.default_project_data['concurrency-groups'] = {'heavy': limit}
+            with self.assertRaises(dbt.exceptions.DbtProjectError):
+                dbt.config.Project.from_project_config(
+                    self.default_project_data
+                )
+
     def test_unsupported_version(self):
         self.default_project_data['require-dbt-version'] = '>99999.0.0'
         # allowed, because the RuntimeConfig checks, not the Project itself
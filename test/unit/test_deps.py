@@ -1,10 +1,23 @@
+import http.server
+import json
+import os
+import shutil
+import socketserver
+import subprocess
+import tarfile
+import tempfile
+import threading
 import unittest
 from unittest import mock
 
 import dbt.deps
 import dbt.exceptions
+from dbt.clients import registry
+from dbt.config import Project
+from dbt.task.deps import DepsTask
+from dbt.deps.base import map_concurrently
 from dbt.deps.git import GitUnpinnedPackage
-from dbt.deps.local import LocalUnpinnedPackage
+from dbt.deps.local import LocalPinnedPackage, LocalUnpinnedPackage
 from dbt.deps.registry import RegistryUnpinnedPackage
 from dbt.deps.resolver import resolve_packages
 from dbt.contracts.project import (
@@ -398,3 +411,260 @@ class TestPackageSpec(unittest.TestCase):
         self.assertEqual(resolved[0].version, '0.1.3')
         self.assertEqual(resolved[1].name, 'fishtown-analytics-test/b')
         self.assertEqual(resolved[1].version, '0.2.1')
+
+
+class TestMapConcurrently(unittest.TestCase):
+    def test_results_in_order(self):
+        self.assertEqual(map_concurrently(lambda x: x * 2, [3, 1, 2]),
+                         [6, 2, 4])
+
+    def test_first_error_in_item_order(self):
+        finished = []
+        second_failed = threading.Event()
+
+        def func(item):
+            if item == 0:
+                # fail after item 1 has already failed
+                second_failed.wait(5)
+                finished.append(item)
+                raise ValueError('first')
+            finished.append(item)
+            if item == 1:
+                second_failed.set()
+                raise ValueError('second')
+            return item
+
+        with self.assertRaises(ValueError) as exc:
+            map_concurrently(func, [0, 1, 2])
+        self.assertEqual(str(exc.exception), 'first')
+        self.assertEqual(sorted(finished), [0, 1, 2])
+
+
+class _HubServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class _HubHandler(http.server.SimpleHTTPRequestHandler):
+    def translate_path(self, path):
+        path = path.split('?', 1)[0].lstrip('/')
+        return os.path.join(self.server.root, *path.split('/'))
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        return super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+def _write_project(path, name, packages=()):
+    os.makedirs(path)
+    with open(os.path.join(path, 'dbt_project.yml'), 'w') as fp:
+        json.dump({'name': name, 'version': '1.0'}, fp)
+    if packages:
+        with open(os.path.join(path, 'packages.yml'), 'w') as fp:
+            json.dump({'packages': list(packages)}, fp)
+
+
+def _git(cwd, *args):
+    subprocess.check_output(
+        ['git', '-c', 'user.name=dbt', '-c', 'user.email=dbt@example.com'] +
+        list(args),
+        cwd=cwd, stderr=subprocess.STDOUT
+    )
+
+
+class TestDepsInstall(unittest.TestCase):
+    """Resolve and install packages from a local registry stand-in and local
+    bare git repositories.
+    """
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.modules_path = os.path.join(self.tempdir, 'dbt_modules')
+        self.hub_root = os.path.join(self.tempdir, 'hub')
+        os.makedirs(self.hub_root)
+        self.server = _HubServer(('127.0.0.1', 0), _HubHandler)
+        self.server.root = self.hub_root
+        self.server.requests = []
+        self.server_thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self.server_thread.start()
+        self.hub_url = 'http://127.0.0.1:{}/'.format(self.server.server_port)
+        self.registry_patcher = mock.patch.object(
+            registry, 'DEFAULT_REGISTRY_BASE_URL', self.hub_url
+        )
+        self.registry_patcher.start()
+        registry.index_cached.cache.clear()
+        self.tracking_patcher = mock.patch(
+            'dbt.tracking.track_package_install'
+        )
+        self.tracking_patcher.start()
+        self.cache_path = os.path.join(self.tempdir, 'cache')
+        self.env_patcher = mock.patch.dict(
+            os.environ, {'DBT_PACKAGE_CACHE_DIR': self.cache_path}
+        )
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.tracking_patcher.stop()
+        self.registry_patcher.stop()
+        registry.index_cached.cache.clear()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tempdir)
+
+    def _make_git_package(self, name, packages=()):
+        src = os.path.join(self.tempdir, 'src', name)
+        _write_project(src, name, packages)
+        _git(src, 'init', '-q')
+        _git(src, 'add', '.')
+        _git(src, 'commit', '-q', '-m', 'init')
+        bare = os.path.join(self.tempdir, 'repos', name + '.git')
+        _git(self.tempdir, 'clone', '-q', '--bare', src, bare)
+        return 'file://' + bare
+
+    def _make_hub_package(self, name, version, packages=()):
+        src = os.path.join(self.tempdir, 'src', name)
+        _write_project(src, name, packages)
+        tar_name = '{}-{}.tar.gz'.format(name, version)
+        with tarfile.open(os.path.join(self.hub_root, tar_name), 'w:gz') as tf:
+            tf.add(src, arcname='{}-{}'.format(name, version))
+
+        api = os.path.join(self.hub_root, 'api', 'v1')
+        os.makedirs(os.path.join(api, 'test', name))
+        with open(os.path.join(api, 'test', name + '.json'), 'w') as fp:
+            json.dump({'versions': {version: {}}}, fp)
+        version_path = os.path.join(api, 'test', name, version + '.json')
+        with open(version_path, 'w') as fp:
+            json.dump({
+                'name': name,
+                'packages': list(packages),
+                'downloads': {'tarball': self.hub_url + tar_name},
+            }, fp)
+
+        index_path = os.path.join(api, 'index.json')
+        index = []
+        if os.path.exists(index_path):
+            with open(index_path) as fp:
+                index = json.load(fp)
+        with open(index_path, 'w') as fp:
+            json.dump(index + ['test/' + name], fp)
+
+    def test_install(self):
+        hub_dep = {'package': 'test/hub_dep', 'version': '0.1.0'}
+        self._make_hub_package('hub_dep', '0.1.0')
+        self._make_hub_package('hub_pkg', '0.2.0', packages=[hub_dep])
+        git_dep = {'git': self._make_git_package('git_dep')}
+        git_pkg = self._make_git_package('git_pkg', packages=[git_dep])
+
+        package_config = PackageConfig.from_dict({
+            'packages': [
+                {'git': git_pkg},
+                {'package': 'test/hub_pkg', 'version': '0.2.0'},
+            ],
+        })
+        config = mock.MagicMock(modules_path=self.modules_path,
+                                packages=package_config)
+        DepsTask(args=mock.MagicMock(), config=config).run()
+
+        self.assertEqual(
+            sorted(os.listdir(self.modules_path)),
+            ['.dbt_packages.lock', 'git_dep', 'git_pkg', 'hub_dep', 'hub_pkg']
+        )
+        for name in ('git_dep', 'git_pkg', 'hub_dep', 'hub_pkg'):
+            project_file = os.path.join(
+                self.modules_path, name, 'dbt_project.yml'
+            )
+            with open(project_file) as fp:
+                self.assertEqual(json.load(fp)['name'], name)
+        self.assertEqual(sorted(os.listdir(self.cache_path)), ['git', 'hub'])
+        tarballs = [p for p in self.server.requests if p.endswith('.tar.gz')]
+        self.assertEqual(len(tarballs), 2)
+
+        # nothing changed: nothing is resolved or installed
+        marker = os.path.join(self.modules_path, 'hub_pkg', 'marker')
+        open(marker, 'w').close()
+        requests = list(self.server.requests)
+        DepsTask(args=mock.MagicMock(), config=config).run()
+        self.assertTrue(os.path.exists(marker))
+        self.assertEqual(self.server.requests, requests)
+
+        # a missing package is reinstalled, out of the cache
+        shutil.rmtree(os.path.join(self.modules_path, 'hub_dep'))
+        DepsTask(args=mock.MagicMock(), config=config).run()
+        self.assertFalse(os.path.exists(marker))
+        self.assertTrue(os.path.exists(
+            os.path.join(self.modules_path, 'hub_dep', 'dbt_project.yml')
+        ))
+        tarballs = [p for p in self.server.requests if p.endswith('.tar.gz')]
+        self.assertEqual(len(tarballs), 2)
+
+        # editing an installed package leaves the cache alone
+        project_file = os.path.join(
+            self.modules_path, 'hub_dep', 'dbt_project.yml'
+        )
+        with open(project_file, 'w') as fp:
+            fp.write('changed')
+        shutil.rmtree(os.path.join(self.modules_path, 'hub_pkg'))
+        DepsTask(args=mock.MagicMock(), config=config).run()
+        with open(project_file) as fp:
+            self.assertEqual(json.load(fp)['name'], 'hub_dep')
+
+    def test_install_local(self):
+        self._make_hub_package('hub_dep', '0.1.0')
+        local_path = os.path.join(self.tempdir, 'src', 'local_pkg')
+        _write_project(local_path, 'local_pkg')
+
+        package_config = PackageConfig.from_dict({
+            'packages': [{'local': local_path}],
+        })
+        config = mock.MagicMock(modules_path=self.modules_path,
+                                project_root=self.tempdir,
+                                packages=package_config)
+        config.from_project_root = Project.from_project_root
+        DepsTask(args=mock.MagicMock(), config=config).run()
+        self.assertEqual(sorted(os.listdir(self.modules_path)),
+                         ['.dbt_packages.lock', 'local_pkg'])
+
+        # the lock matches, but local packages are installed again
+        with mock.patch.object(dbt.task.deps, 'resolve_packages') as resolve, \
+                mock.patch.object(LocalPinnedPackage, 'install') as install:
+            DepsTask(args=mock.MagicMock(), config=config).run()
+        resolve.assert_not_called()
+        install.assert_called_once_with(config)
+
+        # changing the local package's own packages is a new request
+        with open(os.path.join(local_path, 'packages.yml'), 'w') as fp:
+            json.dump({'packages': [
+                {'package': 'test/hub_dep', 'version': '0.1.0'}
+            ]}, fp)
+        DepsTask(args=mock.MagicMock(), config=config).run()
+        self.assertEqual(sorted(os.listdir(self.modules_path)),
+                         ['.dbt_packages.lock', 'hub_dep', 'local_pkg'])
+
+    def test_install_log_order(self):
+        events = []
+        packages = []
+        for idx in range(4):
+            package = mock.MagicMock()
+            package.name = 'package_{}'.format(idx)
+            package.get_version.return_value = '1.0.0'
+            package.install.side_effect = (
+                lambda project, idx=idx: events.append(('install', idx))
+            )
+            packages.append(package)
+
+        def log_info(msg, *args):
+            if msg == 'Installing {}':
+                events.append(('log', packages.index(args[0])))
+
+        task = DepsTask(args=mock.MagicMock(), config=mock.MagicMock())
+        with mock.patch('dbt.task.deps.logger') as logger:
+            logger.info.side_effect = log_info
+            task._install_packages(packages)
+        # every package is announced, in order, before any is installed
+        self.assertEqual(events[:4], [('log', idx) for idx in range(4)])
+        self.assertEqual(sorted(events[4:]),
+                         [('install', idx) for idx in range(4)])
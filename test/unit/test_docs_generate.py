@@ -1,8 +1,12 @@
 from datetime import datetime
 from decimal import Decimal
 from unittest import mock
+import shutil
+import tempfile
 import unittest
 
+import agate
+
 import dbt.flags
 from dbt.task import generate
 
@@ -351,3 +355,35 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+
+class CatalogCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        config = mock.MagicMock(target_path=self.tempdir,
+                                profile_name='test', target_name='default')
+        with mock.patch('dbt.task.base.register_adapter'):
+            self.task = generate.GenerateTask(args=mock.MagicMock(),
+                                              config=config)
+        self.adapter = mock.MagicMock()
+        self.adapter.type.return_value = 'snowflake'
+
+    def test_round_trip_types(self):
+        modified = datetime(2019, 1, 2, 3, 4, 5)
+        table = agate.Table(
+            [['db', 'schema', 'table', 'id', modified, True]],
+            ['table_database', 'table_schema', 'table_name', 'column_name',
+             'stats:last_modified:value', 'stats:last_modified:include'],
+            column_types=[agate.Text(), agate.Text(), agate.Text(),
+                          agate.Text(), agate.DateTime(), agate.Boolean()],
+        )
+        data = [dict(zip(table.column_names, row)) for row in table]
+        key = generate.CatalogKey('db', 'schema', 'table')
+        self.task._write_catalog_cache(self.adapter, table, data,
+                                       {key: 'abc'})
+
+        cache = self.task._load_catalog_cache(self.adapter)
+        self.assertEqual(list(cache), [key])
+        self.assertEqual(cache[key].fingerprint, 'abc')
+        self.assertEqual(cache[key].rows, data)
@@ -1,7 +1,61 @@
+import subprocess
+import sys
 import unittest
 
+
+# modules that only some subcommands need, and that are slow to import
+HEAVY_MODULES = frozenset((
+    'agate',
+    'dbt.adapters.factory',
+    'dbt.task.base',
+    'jinja2',
+    'jsonrpc',
+    'networkx',
+    'snowplow_tracker',
+    'werkzeug',
+))
+
+
+def _modules_after(code):
+    """Run code in a fresh interpreter, and return the names of all the
+    modules that were imported once it finished.
+    """
+    script = code + '\nimport sys\nprint("\\n".join(sys.modules))'
+    output = subprocess.check_output([sys.executable, '-c', script])
+    return set(output.decode('utf-8').split())
+
+
 class ImportTest(unittest.TestCase):
 
     def test_import_dbt_main(self):
         "just test that the project can be imported"
         import dbt.main
+
+    def test_import_dbt_main_is_lazy(self):
+        modules = _modules_after('import dbt.main')
+        self.assertEqual(modules & HEAVY_MODULES, set())
+
+    def test_parse_args_imports_one_task(self):
+        modules = _modules_after(
+            'import dbt.main\n'
+            'parsed = dbt.main.parse_args(["ls"])\n'
+            'assert parsed.cls.__name__ == "ListTask", parsed.cls\n'
+        )
+        self.assertIn('dbt.task.list', modules)
+        for name in ('dbt.task.rpc.server', 'dbt.task.serve',
+                     'dbt.task.generate', 'werkzeug', 'jsonrpc'):
+            self.assertNotIn(name, modules)
+
+    def test_list_resource_types(self):
+        import dbt.main
+        from dbt.task.list import ListTask
+        parsed = dbt.main.parse_args(
+            ['ls'] + [
+                arg for value in ListTask.ALL_RESOURCE_VALUES
+                for arg in ('--resource-type', str(value))
+            ]
+        )
+        self.assertEqual(
+            set(parsed.resource_types),
+            {str(v) for v in ListTask.ALL_RESOURCE_VALUES}
+        )
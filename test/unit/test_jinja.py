@@ -1,6 +1,7 @@
 import unittest
+from unittest import mock
 
-from dbt.clients.jinja import get_template
+from dbt.clients.jinja import get_template, TemplateCache, REMOTE_FILE_PATH
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException
 
@@ -14,6 +15,28 @@ class TestJinja(unittest.TestCase):
         self.assertEqual(mod.my_dict, {'a': 1})
 
 
+class TestTemplateCache(unittest.TestCase):
+    def _macro(self, path, sql):
+        return mock.MagicMock(
+            package_name='root', original_file_path=path, raw_sql=sql
+        )
+
+    def test_cached(self):
+        cache = TemplateCache()
+        first = cache.get_node_template(self._macro('macros.sql', 'a'))
+        second = cache.get_node_template(self._macro('macros.sql', 'a'))
+        self.assertIs(first, second)
+        self.assertEqual(len(cache.file_cache), 1)
+
+    def test_remote_not_cached(self):
+        cache = TemplateCache()
+        first = cache.get_node_template(self._macro(REMOTE_FILE_PATH, 'a'))
+        second = cache.get_node_template(self._macro(REMOTE_FILE_PATH, 'b'))
+        self.assertEqual(first.render(), 'a')
+        self.assertEqual(second.render(), 'b')
+        self.assertEqual(cache.file_cache, {})
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
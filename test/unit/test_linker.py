@@ -4,6 +4,7 @@ import unittest
 from unittest import mock
 
 from dbt import linker
+from dbt.node_types import NodeType
 try:
     from queue import Empty
 except ImportError:
@@ -18,6 +19,18 @@ def _mock_manifest(nodes):
     return manifest
 
 
+def _mock_model_manifest(nodes):
+    def make_model(unique_id):
+        model = mock.MagicMock(unique_id=unique_id,
+                               resource_type=NodeType.Model)
+        model.get_materialization.return_value = 'table'
+        return model
+
+    manifest = mock.MagicMock()
+    manifest.expect.side_effect = make_model
+    return manifest
+
+
 class LinkerTest(unittest.TestCase):
 
     def setUp(self):
@@ -188,3 +201,111 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+    def _wide_and_slow(self):
+        # 'slow' has two children, 'fast' has five
+        for child in ('slow_1', 'slow_2'):
+            self.linker.dependency(child, 'slow')
+        for idx in range(5):
+            self.linker.dependency('fast_{}'.format(idx), 'fast')
+
+    def test_queue_prioritizes_descendants(self):
+        self._wide_and_slow()
+        queue = self.linker.as_graph_queue(_mock_model_manifest(None))
+        self.assertEqual(queue.get(block=False).unique_id, 'fast')
+        self.assertEqual(queue.get(block=False).unique_id, 'slow')
+
+    def test_queue_prioritizes_critical_path(self):
+        self._wide_and_slow()
+        execution_times = {'slow': 2400.0, 'fast': 2.0}
+        for idx in range(5):
+            execution_times['fast_{}'.format(idx)] = 1.0
+        queue = self.linker.as_graph_queue(
+            _mock_model_manifest(None), execution_times=execution_times
+        )
+        self.assertEqual(queue.get(block=False).unique_id, 'slow')
+        self.assertEqual(queue.get(block=False).unique_id, 'fast')
+        queue.mark_done('slow')
+        # unseen nodes take the average time, ties go by descendants
+        self.assertEqual(
+            {queue.get(block=False).unique_id for _ in range(2)},
+            {'slow_1', 'slow_2'}
+        )
+
+    def test_queue_ranks(self):
+        for (l, r) in [('A', 'B'), ('B', 'C'), ('A', 'D')]:
+            self.linker.dependency(l, r)
+        queue = self.linker.as_graph_queue(
+            _mock_model_manifest(None),
+            execution_times={'A': 1.0, 'B': 2.0, 'C': 4.0, 'D': 10.0}
+        )
+        self.assertEqual(
+            queue._calculate_ranks(),
+            {'A': 1.0, 'B': 3.0, 'C': 7.0, 'D': 11.0}
+        )
+
+    def test_queue_waits_for_all_parents(self):
+        for (l, r) in [('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C')]:
+            self.linker.dependency(l, r)
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCD'))
+
+        self.assertEqual(queue.get(block=False).unique_id, 'A')
+        queue.mark_done('A')
+        got = {queue.get(block=False).unique_id for _ in range(2)}
+        self.assertEqual(got, {'B', 'C'})
+        queue.mark_done('B')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        queue.mark_done('C')
+        self.assertEqual(queue.get(block=False).unique_id, 'D')
+        queue.mark_done('D')
+        self.assertTrue(queue.empty())
+
+    def test_queue_concurrency_groups(self):
+        for node in ('heavy_1', 'heavy_2', 'heavy_3', 'light'):
+            self.linker.add_node(node)
+        self.linker.dependency('child', 'heavy_1')
+
+        def make_model(unique_id):
+            model = mock.MagicMock(unique_id=unique_id,
+                                   resource_type=NodeType.Model)
+            model.get_materialization.return_value = 'table'
+            group = 'heavy' if unique_id.startswith('heavy') else None
+            model.config = {'concurrency_group': group}
+            return model
+
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = make_model
+        queue = self.linker.as_graph_queue(
+            manifest, concurrency_limits={'heavy': 1}
+        )
+
+        # heavy_1 has a descendant, so it goes first
+        self.assertEqual(queue.get(block=False).unique_id, 'heavy_1')
+        # the other heavy nodes wait for it
+        self.assertEqual(queue.get(block=False).unique_id, 'light')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        with self.assertRaises(Empty):
+            queue.get(timeout=0.01)
+        self.assertFalse(queue.empty())
+
+        queue.mark_done('light')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+
+        queue.mark_done('heavy_1')
+        # child is not in any group
+        got = {queue.get(block=False).unique_id for _ in range(2)}
+        self.assertIn('child', got)
+        first = (got - {'child'}).pop()
+        self.assertIn(first, ('heavy_2', 'heavy_3'))
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+
+        queue.mark_done(first)
+        second = queue.get(block=False).unique_id
+        self.assertEqual({first, second}, {'heavy_2', 'heavy_3'})
+        queue.mark_done(second)
+        queue.mark_done('child')
+        self.assertTrue(queue.empty())
@@ -0,0 +1,75 @@
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import unittest
+
+import logbook
+
+import dbt.ui.colors
+from dbt.logger import DelayedFileHandler
+
+
+class TestDelayedFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, 'dbt.log')
+        self.handler = DelayedFileHandler()
+        self.logger = logbook.Logger('test')
+
+    def tearDown(self):
+        self.handler.reset()
+        shutil.rmtree(self.log_dir)
+
+    def _lines(self):
+        with open(self.log_path) as fp:
+            return [line.split(': ', 1)[1] for line in fp.read().splitlines()]
+
+    def test_buffers_and_strips_colors(self):
+        red = dbt.ui.colors.COLORS['red']
+        reset = dbt.ui.colors.COLORS['reset_all']
+        with self.handler.applicationbound():
+            self.logger.debug('{}before{}'.format(red, reset))
+            self.handler.set_path(self.log_dir)
+            self.logger.debug('{}after{}'.format(red, reset))
+            self.handler.drain()
+        self.assertEqual(self._lines(), ['before', 'after'])
+
+    def test_many_threads(self):
+        def log_some(idx):
+            for count in range(200):
+                self.logger.debug('{} {}', idx, count)
+
+        with self.handler.applicationbound():
+            self.handler.set_path(self.log_dir)
+            threads = [
+                threading.Thread(target=log_some, args=(idx,))
+                for idx in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        # closing writes everything that was queued
+        self.handler.reset()
+
+        lines = self._lines()
+        self.assertEqual(len(lines), 8 * 200)
+        for idx in range(8):
+            prefix = '{} '.format(idx)
+            mine = [line for line in lines if line.startswith(prefix)]
+            self.assertEqual(
+                mine, ['{} {}'.format(idx, c) for c in range(200)]
+            )
+
+    def test_record_after_stop(self):
+        self.handler.set_path(self.log_dir)
+        messages = queue.Queue()
+        messages.put('test: before')
+        messages.put(None)
+        # queued by a thread that got the queue before it was stopped
+        messages.put('test: after')
+        # returns instead of failing on the sentinel
+        self.handler._run_writer(messages)
+        self.assertEqual(self._lines(), ['before', 'after'])
@@ -5,6 +5,7 @@ import dbt.flags as flags
 import dbt.parser.manifest
 from dbt.task.debug import DebugTask
 
+from dbt.adapters.base.impl import SchemaSearchMap
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.exceptions import ValidationException, DbtConfigError
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
@@ -165,8 +166,9 @@ class TestPostgresAdapter(unittest.TestCase):
             port=5432,
             connect_timeout=10)
 
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
     @mock.patch.object(PostgresAdapter, 'execute_macro')
-    def test_get_catalog_various_schemas(self, mock_execute):
+    def test_get_catalog_various_schemas(self, mock_execute, psycopg2):
         column_names = ['table_database', 'table_schema', 'table_name']
         rows = [
             ('dbt', 'foo', 'bar'),
@@ -182,11 +184,91 @@ class TestPostgresAdapter(unittest.TestCase):
         mock_manifest.get_used_schemas.return_value = {('dbt', 'foo'),
                                                        ('dbt', 'quux')}
 
-        catalog = self.adapter.get_catalog(mock_manifest)
+        information_schema = self.adapter.Relation.create(
+            database='dbt', schema='foo'
+        ).information_schema_only()
+        schema_map = SchemaSearchMap({information_schema: {'foo', 'quux'}})
+        with mock.patch.object(PostgresAdapter, '_get_cache_schemas',
+                               return_value=schema_map):
+            catalog = self.adapter.get_catalog(mock_manifest)
         self.assertEqual(
             set(map(tuple, catalog)),
             {('dbt', 'foo', 'bar'), ('dbt', 'FOO', 'baz'), ('dbt', 'quux', 'bar')}
         )
+        # the macro is only asked for the schemas the manifest uses
+        mock_execute.assert_called_once_with(
+            'get_catalog',
+            kwargs={
+                'information_schema': information_schema,
+                'schemas': ['foo', 'quux'],
+            }
+        )
+
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, 'list_relations_without_caching')
+    def test_set_relations_cache_new_schemas(self, mock_list, mock_link):
+        mock_list.return_value = []
+        information_schema = self.adapter.Relation.create(
+            database='dbt', schema='foo'
+        ).information_schema_only()
+        schema_map = SchemaSearchMap({information_schema: {'foo', 'bar'}})
+        with mock.patch.object(PostgresAdapter, '_get_cache_schemas',
+                               return_value=schema_map):
+            self.adapter.set_relations_cache(
+                mock.MagicMock(), new_schemas={('DBT', 'Bar')}
+            )
+        # the new schema is known to be empty, so it isn't listed
+        mock_list.assert_called_once_with(information_schema, 'foo')
+        self.assertIn(('dbt', 'bar'), self.adapter.cache)
+        self.assertIn(('dbt', 'foo'), self.adapter.cache)
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_introspection_cache(self, mock_execute):
+        mock_execute.side_effect = lambda name, kwargs: [name]
+        relation = self.adapter.Relation.create(
+            database='dbt', schema='foo', identifier='bar'
+        )
+        other = self.adapter.Relation.create(
+            database='dbt', schema='foo', identifier='baz'
+        )
+
+        self.adapter.get_columns_in_relation(relation)
+        self.adapter.get_columns_in_relation(relation)
+        self.adapter.get_columns_in_relation(other)
+        self.assertEqual(mock_execute.call_count, 2)
+
+        # DDL on a relation only invalidates that relation
+        self.adapter.alter_column_type(relation, 'id', 'bigint')
+        self.adapter.get_columns_in_relation(relation)
+        self.adapter.get_columns_in_relation(other)
+        self.assertEqual(mock_execute.call_count, 4)
+
+        # the cache_* hooks invalidate too
+        self.adapter.cache_renamed(other, relation)
+        self.adapter.get_columns_in_relation(relation)
+        self.adapter.get_columns_in_relation(other)
+        self.assertEqual(mock_execute.call_count, 6)
+
+        # so does dropping the schema
+        self.adapter.drop_schema('dbt', 'FOO')
+        self.adapter.get_columns_in_relation(relation)
+        self.assertEqual(mock_execute.call_count, 8)
+
+        self.adapter.cleanup_connections()
+        self.adapter.get_columns_in_relation(relation)
+        self.assertEqual(mock_execute.call_count, 9)
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_introspection_cache_bypassed(self, mock_execute):
+        mock_execute.return_value = [(1,)]
+        flags.USE_CACHE = False
+        try:
+            self.adapter.check_schema_exists('dbt', 'foo')
+            self.adapter.check_schema_exists('dbt', 'foo')
+        finally:
+            flags.USE_CACHE = True
+        self.assertEqual(mock_execute.call_count, 2)
 
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
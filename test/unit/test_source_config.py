@@ -137,3 +137,11 @@ class SourceConfigTest(TestCase):
             cfg.get_project_config(self.root_project_config)
 
         self.assertIn('must be a dict', str(exc.exception))
+
+    def test__source_config_concurrency_group_from_project(self):
+        self.root_project_config.models = {
+            'root': {'x': {'concurrency_group': 'heavy'}},
+        }
+        cfg = SourceConfig(self.root_project_config, self.root_project_config,
+                           ['root', 'x'], NodeType.Model)
+        self.assertEqual(cfg.config['concurrency_group'], 'heavy')
@@ -0,0 +1,173 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import dbt.exceptions
+from dbt.contracts.graph.manifest import (
+    FileHash, FilePath, Manifest, SourceFile
+)
+from dbt.contracts.graph.parsed import (
+    DependsOn, MacroDependsOn, NodeConfig, ParsedMacro, ParsedModelNode,
+    ParsedSeedNode
+)
+from dbt.contracts.state import PreviousState
+from dbt.node_types import NodeType
+
+
+def _macro(name, sql, package_name='root'):
+    return ParsedMacro(
+        name=name,
+        path='macros.sql',
+        original_file_path='macros.sql',
+        package_name=package_name,
+        raw_sql='{% macro ' + name + '() %}' + sql + '{% endmacro %}',
+        root_path='/usr/src/app',
+        resource_type=NodeType.Macro,
+        unique_id='macro.{}.{}'.format(package_name, name),
+        tags=[],
+        depends_on=MacroDependsOn(),
+    )
+
+
+def _model(name, sql, **config):
+    return ParsedModelNode(
+        name=name,
+        database='dbt',
+        schema='analytics',
+        alias=name,
+        resource_type=NodeType.Model,
+        unique_id='model.root.{}'.format(name),
+        fqn=['root', name],
+        package_name='root',
+        refs=[],
+        sources=[],
+        depends_on=DependsOn(),
+        config=NodeConfig(**config),
+        tags=[],
+        path=name + '.sql',
+        original_file_path=name + '.sql',
+        root_path='/usr/src/app',
+        raw_sql=sql,
+    )
+
+
+def _seed(name):
+    return ParsedSeedNode(
+        name=name,
+        database='dbt',
+        schema='analytics',
+        alias=name,
+        resource_type=NodeType.Seed,
+        unique_id='seed.root.{}'.format(name),
+        fqn=['root', name],
+        package_name='root',
+        refs=[],
+        sources=[],
+        depends_on=DependsOn(),
+        config=NodeConfig(),
+        tags=[],
+        path=name + '.csv',
+        original_file_path='data/' + name + '.csv',
+        root_path='/usr/src/app',
+        raw_sql='',
+        seed_file_path='/usr/src/app/data/' + name + '.csv',
+    )
+
+
+def _seed_file(name, contents):
+    source_file = SourceFile(
+        path=FilePath(
+            searched_path='data',
+            relative_path=name + '.csv',
+            project_root='/usr/src/app',
+        ),
+        checksum=FileHash.from_contents(contents),
+    )
+    source_file.nodes.append('seed.root.{}'.format(name))
+    return source_file
+
+
+class PreviousStateTest(unittest.TestCase):
+    def setUp(self):
+        self.macros = {
+            m.unique_id: m for m in [
+                _macro('outer', '{{ inner() }}'),
+                _macro('inner', 'select 1'),
+                _macro('default__dispatched', 'select 2'),
+                _macro('unused', 'select 3'),
+            ]
+        }
+        self.nodes = {
+            n.unique_id: n for n in [
+                _model('plain', 'select 1'),
+                _model('calls_outer', 'select * from ({{ outer() }})'),
+                _model('dispatches',
+                       "{{ adapter_macro('root.dispatched') }}"),
+                _seed('people'),
+            ]
+        }
+        self.files = {}
+        self._replace_seed_file('people', 'id\n1\n')
+        self.previous = PreviousState(self._manifest())
+
+    def _manifest(self):
+        return Manifest(
+            macros=dict(self.macros),
+            nodes=dict(self.nodes),
+            docs={},
+            generated_at=None,
+            disabled=[],
+            files=dict(self.files),
+        )
+
+    def _replace_seed_file(self, name, contents):
+        source_file = _seed_file(name, contents)
+        self.files[source_file.search_key] = source_file
+
+    def _replace_macro(self, name, sql):
+        self.macros['macro.root.' + name] = _macro(name, sql)
+
+    def assert_modified(self, expected):
+        self.assertEqual(self.previous.modified_nodes(self._manifest()),
+                         expected)
+
+    def test_unchanged(self):
+        self.assert_modified(set())
+        self.assertEqual(self.previous.new_nodes(self._manifest()), set())
+
+    def test_new_node(self):
+        self.nodes['model.root.added'] = _model('added', 'select 1')
+        self.assertEqual(self.previous.new_nodes(self._manifest()),
+                         {'model.root.added'})
+        self.assert_modified({'model.root.added'})
+
+    def test_sql_and_config_changed(self):
+        self.nodes['model.root.plain'] = _model('plain', 'select 2')
+        self.assert_modified({'model.root.plain'})
+
+        self.nodes['model.root.plain'] = _model('plain', 'select 1',
+                                                materialized='table')
+        self.assert_modified({'model.root.plain'})
+
+    def test_called_macro_changed(self):
+        self._replace_macro('inner', 'select 10')
+        self.assert_modified({'model.root.calls_outer'})
+
+    def test_dispatched_macro_changed(self):
+        self._replace_macro('default__dispatched', 'select 20')
+        self.assert_modified({'model.root.dispatches'})
+
+    def test_unused_macro_changed(self):
+        self._replace_macro('unused', 'select 30')
+        self.assert_modified(set())
+
+    def test_seed_data_changed(self):
+        self._replace_seed_file('people', 'id\n1\n2\n')
+        self.assert_modified({'seed.root.people'})
+
+    def test_load_missing(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            PreviousState.load(os.path.join(path, 'manifest.json'))
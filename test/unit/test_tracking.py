@@ -0,0 +1,111 @@
+import http.server
+import json
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import dbt.tracking
+
+
+# track an event without flushing, the way an invalid invocation does
+_EXIT_WITHOUT_FLUSH = '''
+import sys
+import dbt.tracking
+emitter = dbt.tracking.TimeoutEmitter(
+    '127.0.0.1', protocol='http', port=int(sys.argv[1])
+)
+dbt.tracking.tracker.emitters = [emitter]
+emitter.input({'n': 'exit'})
+'''
+
+
+class _CollectorServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class _CollectorHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers['content-length'])
+        body = json.loads(self.rfile.read(length).decode('utf-8'))
+        time.sleep(self.server.delay)
+        self.server.batches.append(body['data'])
+        self.send_response(self.server.status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTimeoutEmitter(unittest.TestCase):
+    """Send events to a local stand-in for the collector."""
+    def setUp(self):
+        self.server = _CollectorServer(('127.0.0.1', 0), _CollectorHandler)
+        self.server.batches = []
+        self.server.delay = 0
+        self.server.status = 200
+        self.server_thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self.server_thread.start()
+        self.emitter = dbt.tracking.TimeoutEmitter(
+            '127.0.0.1', protocol='http', port=self.server.server_port,
+            buffer_size=3
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _events(self):
+        return [e['n'] for batch in self.server.batches for e in batch]
+
+    def test_batches(self):
+        for idx in range(7):
+            self.emitter.input({'n': idx})
+        self.emitter.flush()
+        self.assertEqual(self._events(), [str(idx) for idx in range(7)])
+        self.assertEqual([len(b) for b in self.server.batches], [3, 3, 1])
+
+    def test_slow_collector(self):
+        self.server.delay = 1.0
+        start = time.monotonic()
+        for idx in range(5):
+            self.emitter.input({'n': idx})
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        start = time.monotonic()
+        self.emitter.flush(timeout=0.2)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        self.emitter.flush(timeout=5)
+        self.assertEqual(self._events(), [str(idx) for idx in range(5)])
+
+    @mock.patch('dbt.tracking.do_not_track')
+    def test_failure_disables(self, do_not_track):
+        self.server.status = 500
+        self.emitter.input({'n': 0})
+        self.emitter.flush()
+        do_not_track.assert_called_once_with()
+        self.assertTrue(self.emitter.disabled)
+
+        self.emitter.input({'n': 1})
+        self.emitter.flush()
+        self.assertEqual(self._events(), ['0'])
+
+    def test_flush_without_events(self):
+        start = time.monotonic()
+        self.emitter.flush()
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(self.server.batches, [])
+
+    def test_flush_at_exit(self):
+        subprocess.run(
+            [sys.executable, '-c', _EXIT_WITHOUT_FLUSH,
+             str(self.server.server_port)],
+            check=True, timeout=30
+        )
+        self.assertEqual(self._events(), ['exit'])